@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from typing import List, Protocol
+
+from result import Err, Ok, Result
+
+from app.core.admin.interactor import (
+    ADMIN_KEY,
+    AdminError,
+    GetStatisticsRequest,
+    GetStatisticsResponse,
+    GetTransactionTimeseriesRequest,
+    GetTransactionTimeseriesResponse,
+    Granularity,
+    TransactionBucket,
+    TransactionStatistics,
+    check_timeseries_request,
+    to_timeseries_response,
+)
+from app.core.transaction.entity import Transaction
+
+
+class IAsyncAdminRepository(Protocol):
+    async def get_all_transactions(self) -> List[Transaction]:
+        raise NotImplementedError()
+
+    async def get_transaction_statistics(self) -> TransactionStatistics:
+        raise NotImplementedError()
+
+    async def get_transaction_buckets(
+        self, granularity: Granularity, start: int, end: int
+    ) -> List[TransactionBucket]:
+        raise NotImplementedError()
+
+
+class IAsyncAdminInteractor(Protocol):
+    async def get_statistics(
+        self, request: GetStatisticsRequest
+    ) -> Result[GetStatisticsResponse, AdminError]:
+        raise NotImplementedError()
+
+    async def get_transaction_timeseries(
+        self, request: GetTransactionTimeseriesRequest
+    ) -> Result[GetTransactionTimeseriesResponse, AdminError]:
+        raise NotImplementedError()
+
+
+@dataclass
+class AsyncAdminInteractor:
+    admin_repository: IAsyncAdminRepository
+
+    async def get_statistics(
+        self, request: GetStatisticsRequest
+    ) -> Result[GetStatisticsResponse, AdminError]:
+        admin_key = request.admin_key
+        if admin_key != ADMIN_KEY:
+            return Err(AdminError.INCORRECT_ADMIN_KEY)
+        statistics = await self.admin_repository.get_transaction_statistics()
+        return Ok(
+            GetStatisticsResponse(
+                number_of_transactions=statistics.number_of_transactions,
+                profit=statistics.profit,
+            )
+        )
+
+    async def get_transaction_timeseries(
+        self, request: GetTransactionTimeseriesRequest
+    ) -> Result[GetTransactionTimeseriesResponse, AdminError]:
+        error = check_timeseries_request(request)
+        if error is not None:
+            return Err(error)
+        buckets = await self.admin_repository.get_transaction_buckets(
+            request.granularity, request.start, request.end
+        )
+        return Ok(to_timeseries_response(request, buckets))
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Protocol
+from typing import List, Optional, Protocol
 
 from result import Err, Ok, Result
 
@@ -9,6 +9,8 @@ from app.core.transaction.entity import Transaction
 
 class AdminError(Enum):
     INCORRECT_ADMIN_KEY = 0
+    INVALID_TIME_RANGE = 1
+    TOO_MANY_BUCKETS = 2
 
 
 @dataclass
@@ -22,20 +24,117 @@ class GetStatisticsResponse:
     profit: int
 
 
+@dataclass
+class TransactionStatistics:
+    number_of_transactions: int
+    profit: int
+
+
+class Granularity(str, Enum):
+    MINUTE = "minute"
+    HOUR = "hour"
+    DAY = "day"
+
+    @property
+    def seconds(self) -> int:
+        return GRANULARITY_SECONDS[self]
+
+
+GRANULARITY_SECONDS = {
+    Granularity.MINUTE: 60,
+    Granularity.HOUR: 60 * 60,
+    Granularity.DAY: 24 * 60 * 60,
+}
+MAX_TIMESERIES_BUCKETS = 2000
+
+
+@dataclass
+class TransactionBucket:
+    # unix time the bucket starts at, a multiple of the granularity
+    start: int
+    number_of_transactions: int
+    volume: int
+    profit: int
+
+
+@dataclass
+class GetTransactionTimeseriesRequest:
+    admin_key: str
+    # unix times, start inclusive and end exclusive
+    start: int
+    end: int
+    granularity: Granularity
+
+
+@dataclass
+class GetTransactionTimeseriesResponse:
+    granularity: Granularity
+    # one bucket per step from start to end, including the empty ones
+    buckets: List[TransactionBucket]
+
+
 class IAdminRepository(Protocol):
     def get_all_transactions(self) -> List[Transaction]:
         raise NotImplementedError()
 
+    def get_transaction_statistics(self) -> TransactionStatistics:
+        raise NotImplementedError()
+
+    def get_transaction_buckets(
+        self, granularity: Granularity, start: int, end: int
+    ) -> List[TransactionBucket]:
+        # the non-empty buckets starting in [start, end), in order
+        raise NotImplementedError()
+
 
 ADMIN_KEY = "sezam-gaighe"
 
 
+def bucket_start(timestamp: int, granularity: Granularity) -> int:
+    return timestamp - timestamp % granularity.seconds
+
+
+def check_timeseries_request(
+    request: GetTransactionTimeseriesRequest,
+) -> Optional[AdminError]:
+    if request.admin_key != ADMIN_KEY:
+        return AdminError.INCORRECT_ADMIN_KEY
+    if request.end <= request.start:
+        return AdminError.INVALID_TIME_RANGE
+    first = bucket_start(request.start, request.granularity)
+    if request.end - first > MAX_TIMESERIES_BUCKETS * request.granularity.seconds:
+        return AdminError.TOO_MANY_BUCKETS
+    return None
+
+
+def to_timeseries_response(
+    request: GetTransactionTimeseriesRequest, buckets: List[TransactionBucket]
+) -> GetTransactionTimeseriesResponse:
+    # the repository only has the buckets something happened in
+    by_start = {bucket.start: bucket for bucket in buckets}
+    step = request.granularity.seconds
+    return GetTransactionTimeseriesResponse(
+        granularity=request.granularity,
+        buckets=[
+            by_start.get(start, TransactionBucket(start, 0, 0, 0))
+            for start in range(
+                bucket_start(request.start, request.granularity), request.end, step
+            )
+        ],
+    )
+
+
 class IAdminInteractor(Protocol):
     def get_statistics(
         self, request: GetStatisticsRequest
     ) -> Result[GetStatisticsResponse, AdminError]:
         raise NotImplementedError()
 
+    def get_transaction_timeseries(
+        self, request: GetTransactionTimeseriesRequest
+    ) -> Result[GetTransactionTimeseriesResponse, AdminError]:
+        raise NotImplementedError()
+
 
 @dataclass
 class AdminInteractor:
@@ -47,10 +146,21 @@ class AdminInteractor:
         admin_key = request.admin_key
         if admin_key != ADMIN_KEY:
             return Err(AdminError.INCORRECT_ADMIN_KEY)
-        transactions = self.admin_repository.get_all_transactions()
+        statistics = self.admin_repository.get_transaction_statistics()
         return Ok(
             GetStatisticsResponse(
-                number_of_transactions=len(transactions),
-                profit=sum([t.fee for t in transactions]),
+                number_of_transactions=statistics.number_of_transactions,
+                profit=statistics.profit,
             )
         )
+
+    def get_transaction_timeseries(
+        self, request: GetTransactionTimeseriesRequest
+    ) -> Result[GetTransactionTimeseriesResponse, AdminError]:
+        error = check_timeseries_request(request)
+        if error is not None:
+            return Err(error)
+        buckets = self.admin_repository.get_transaction_buckets(
+            request.granularity, request.start, request.end
+        )
+        return Ok(to_timeseries_response(request, buckets))
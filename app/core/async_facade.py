@@ -0,0 +1,162 @@
+from dataclasses import dataclass
+
+from result import Result
+
+from app.core.admin.async_interactor import (
+    AsyncAdminInteractor,
+    IAsyncAdminInteractor,
+    IAsyncAdminRepository,
+)
+from app.core.admin.interactor import (
+    AdminError,
+    GetStatisticsRequest,
+    GetStatisticsResponse,
+    GetTransactionTimeseriesRequest,
+    GetTransactionTimeseriesResponse,
+)
+from app.core.currency_converter import IAsyncCurrencyConverter
+from app.core.key_generator import generate_new_user_key, generate_wallet_address
+from app.core.provisioning.async_interactor import (
+    AsyncProvisioningInteractor,
+    IAsyncProvisioningInteractor,
+)
+from app.core.provisioning.interactor import (
+    ProvisioningError,
+    ProvisionUsersRequest,
+    ProvisionUsersResponse,
+)
+from app.core.transaction.async_interactor import (
+    AsyncExportTransactionsResponse,
+    AsyncTransactionInteractor,
+    IAsyncTransactionInteractor,
+    IAsyncTransactionRepository,
+)
+from app.core.transaction.fee_calculator import FeeCalculator
+from app.core.transaction.interactor import (
+    ExportTransactionsRequest,
+    GetTransactionsRequest,
+    GetTransactionsResponse,
+    MakeTransactionRequest,
+    MakeTransactionResponse,
+    MakeTransactionsRequest,
+    MakeTransactionsResponse,
+    TransactionError,
+)
+from app.core.unit_of_work import IAsyncUnitOfWork
+from app.core.user.async_interactor import (
+    AsyncUserInteractor,
+    IAsyncUserInteractor,
+    IAsyncUserRepository,
+)
+from app.core.user.interactor import UserCreatedResponse
+from app.core.wallet.async_interactor import (
+    AsyncWalletInteractor,
+    IAsyncWalletInteractor,
+    IAsyncWalletRepository,
+)
+from app.core.wallet.interactor import (
+    CreateWalletRequest,
+    GetUserWalletsRequest,
+    GetWalletRequest,
+    UserWalletsResponse,
+    WalletError,
+    WalletResponse,
+)
+
+
+@dataclass
+class AsyncWalletService:
+    user_interactor: IAsyncUserInteractor
+    wallet_interactor: IAsyncWalletInteractor
+    transaction_interactor: IAsyncTransactionInteractor
+    admin_interactor: IAsyncAdminInteractor
+    provisioning_interactor: IAsyncProvisioningInteractor
+
+    async def create_user(self) -> UserCreatedResponse:
+        return await self.user_interactor.create_user()
+
+    async def provision_users(
+        self, request: ProvisionUsersRequest
+    ) -> Result[ProvisionUsersResponse, ProvisioningError]:
+        return await self.provisioning_interactor.provision_users(request)
+
+    async def create_wallet(
+        self, request: CreateWalletRequest
+    ) -> Result[WalletResponse, WalletError]:
+        return await self.wallet_interactor.create_wallet(request)
+
+    async def get_wallet(
+        self, request: GetWalletRequest
+    ) -> Result[WalletResponse, WalletError]:
+        return await self.wallet_interactor.get_wallet(request)
+
+    async def get_user_wallets(
+        self, request: GetUserWalletsRequest
+    ) -> Result[UserWalletsResponse, WalletError]:
+        return await self.wallet_interactor.get_user_wallets(request)
+
+    async def make_transaction(
+        self, request: MakeTransactionRequest
+    ) -> Result[MakeTransactionResponse, TransactionError]:
+        return await self.transaction_interactor.make_transaction(request)
+
+    async def make_transactions(
+        self, request: MakeTransactionsRequest
+    ) -> Result[MakeTransactionsResponse, TransactionError]:
+        return await self.transaction_interactor.make_transactions(request)
+
+    async def get_transactions(
+        self, request: GetTransactionsRequest
+    ) -> Result[GetTransactionsResponse, TransactionError]:
+        return await self.transaction_interactor.get_transactions(request)
+
+    async def export_transactions(
+        self, request: ExportTransactionsRequest
+    ) -> Result[AsyncExportTransactionsResponse, TransactionError]:
+        return await self.transaction_interactor.export_transactions(request)
+
+    async def get_statistics(
+        self, request: GetStatisticsRequest
+    ) -> Result[GetStatisticsResponse, AdminError]:
+        return await self.admin_interactor.get_statistics(request)
+
+    async def get_transaction_timeseries(
+        self, request: GetTransactionTimeseriesRequest
+    ) -> Result[GetTransactionTimeseriesResponse, AdminError]:
+        return await self.admin_interactor.get_transaction_timeseries(request)
+
+    @classmethod
+    def create(
+        cls,
+        user_repository: IAsyncUserRepository,
+        wallet_repository: IAsyncWalletRepository,
+        transaction_repository: IAsyncTransactionRepository,
+        admin_repository: IAsyncAdminRepository,
+        currency_converter: IAsyncCurrencyConverter,
+        unit_of_work: IAsyncUnitOfWork,
+    ) -> "AsyncWalletService":
+        return cls(
+            AsyncUserInteractor(user_repository, generate_new_user_key),
+            AsyncWalletInteractor(
+                wallet_repository,
+                user_repository,
+                currency_converter,
+                generate_wallet_address,
+            ),
+            AsyncTransactionInteractor(
+                transaction_repository,
+                user_repository,
+                wallet_repository,
+                FeeCalculator(),
+                unit_of_work,
+            ),
+            AsyncAdminInteractor(admin_repository),
+            AsyncProvisioningInteractor(
+                user_repository,
+                wallet_repository,
+                currency_converter,
+                generate_new_user_key,
+                generate_wallet_address,
+                unit_of_work,
+            ),
+        )
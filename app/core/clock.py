@@ -0,0 +1,9 @@
+import time
+from typing import Callable
+
+# seconds since the unix epoch, transactions are stamped with it
+Clock = Callable[[], int]
+
+
+def unix_time() -> int:
+    return int(time.time())
@@ -1,6 +1,10 @@
+import asyncio
 import random
+import threading
+import time
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Protocol
+from typing import Any, Callable, Dict, List, Optional, Protocol
 
 import httpx
 from result import Err, Ok, Result
@@ -15,6 +19,13 @@ class FiatCurrency(Enum):
     RUB = 3
 
 
+# the currencies the blockchain.info ticker has a rate for, GEL is not one
+SUPPORTED_CURRENCIES = [FiatCurrency.USD, FiatCurrency.EUR, FiatCurrency.RUB]
+
+# one amount converted to each of the requested currencies
+FiatAmounts = Dict[FiatCurrency, float]
+
+
 class ConversionError(Enum):
     UNSUPPORTED_CURRENCY = 1
 
@@ -25,28 +36,213 @@ class ICurrencyConverter(Protocol):
     ) -> Result[float, ConversionError]:
         raise NotImplementedError()
 
+    # every amount in every currency from one set of rates, in order
+    def convert_many(
+        self, satoshis: List[int], currencies: List[FiatCurrency]
+    ) -> Result[List[FiatAmounts], ConversionError]:
+        raise NotImplementedError()
+
+
+class IAsyncCurrencyConverter(Protocol):
+    async def convert_btc_to_fiat(
+        self, satoshis: int, currency: FiatCurrency
+    ) -> Result[float, ConversionError]:
+        raise NotImplementedError()
+
+    async def convert_many(
+        self, satoshis: List[int], currencies: List[FiatCurrency]
+    ) -> Result[List[FiatAmounts], ConversionError]:
+        raise NotImplementedError()
+
+
+def convert_with_rates(
+    satoshis: List[int], rates: Dict[FiatCurrency, float]
+) -> List[FiatAmounts]:
+    return [
+        {currency: amount / SATOSHI_IN_BTC * rate for currency, rate in rates.items()}
+        for amount in satoshis
+    ]
+
+
+@dataclass
+class TickerSnapshot:
+    rates: Dict[str, float]
+    fetched_at: float
 
+
+@dataclass
 class BlockChainTickerCurrencyConverter:
     API_URL = "https://blockchain.info/ticker"
-    fiat_currency_str = {
-        FiatCurrency.USD: "USD",
-        FiatCurrency.EUR: "EUR",
-        FiatCurrency.RUB: "RUB",
-    }
+    fiat_currency_str = {currency: currency.name for currency in SUPPORTED_CURRENCIES}
+
+    api_url: str = API_URL
+    # a snapshot older than this is still served, but triggers a refetch
+    ttl_seconds: float = 60.0
+    refresh_interval_seconds: float = 30.0
+    request_timeout_seconds: float = 5.0
+    clock: Callable[[], float] = time.monotonic
+
+    _snapshot: Optional[TickerSnapshot] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _revalidating: bool = field(default=False, init=False, repr=False)
+    # held during a cold fetch, requests arriving together share that fetch
+    _cold_fetch: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _stopped: threading.Event = field(
+        default_factory=threading.Event, init=False, repr=False, compare=False
+    )
+    _refresher: Optional[threading.Thread] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def convert_btc_to_fiat(
         self, satoshis: int, currency: FiatCurrency
     ) -> Result[float, ConversionError]:
-        response = httpx.get(BlockChainTickerCurrencyConverter.API_URL)
+        converted = self.convert_many([satoshis], [currency])
+        if isinstance(converted, Err):
+            return converted
+        return Ok(converted.value[0][currency])
+
+    def convert_many(
+        self, satoshis: List[int], currencies: List[FiatCurrency]
+    ) -> Result[List[FiatAmounts], ConversionError]:
+        if any(
+            currency not in BlockChainTickerCurrencyConverter.fiat_currency_str
+            for currency in currencies
+        ):
+            return Err(ConversionError.UNSUPPORTED_CURRENCY)
 
+        # one snapshot for all of them, a refresh in between cannot mix rates
+        ticker_rates = self._get_rates()
+        rates = {
+            currency: ticker_rates[
+                BlockChainTickerCurrencyConverter.fiat_currency_str[currency]
+            ]
+            for currency in currencies
+        }
+        return Ok(convert_with_rates(satoshis, rates))
+
+    def start(self) -> None:
+        with self._lock:
+            if self._refresher is not None:
+                return
+            self._stopped.clear()
+            self._refresher = threading.Thread(
+                target=self._refresh_periodically, daemon=True
+            )
+            self._refresher.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            refresher, self._refresher = self._refresher, None
+        self._stopped.set()
+        if refresher is not None:
+            refresher.join()
+
+    def _get_rates(self) -> Dict[str, float]:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._cold_fetch:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    return self._refresh().rates
+        if self.clock() - snapshot.fetched_at >= self.ttl_seconds:
+            self._revalidate_in_background()
+        return snapshot.rates
+
+    async def ensure_rates(self) -> None:
+        # a cold cache is fetched without blocking the event loop, after that
+        # convert_btc_to_fiat never waits on the network
+        if self._snapshot is not None:
+            return
+        async with httpx.AsyncClient(timeout=self.request_timeout_seconds) as client:
+            response = await client.get(self.api_url)
+        response.raise_for_status()
+        self._store(response.json())
+
+    def _refresh(self) -> TickerSnapshot:
+        response = httpx.get(self.api_url, timeout=self.request_timeout_seconds)
+        response.raise_for_status()
+        return self._store(response.json())
+
+    def _store(self, ticker: Dict[str, Dict[str, Any]]) -> TickerSnapshot:
+        snapshot = TickerSnapshot(
+            rates={
+                currency: float(rates["last"]) for currency, rates in ticker.items()
+            },
+            fetched_at=self.clock(),
+        )
+        self._snapshot = snapshot
+        return snapshot
+
+    def _try_refresh(self) -> None:
+        try:
+            self._refresh()
+        except (httpx.HTTPError, ValueError, KeyError):
+            # keep serving the previous snapshot until the ticker recovers
+            pass
+
+    def _revalidate_in_background(self) -> None:
+        with self._lock:
+            if self._revalidating:
+                return
+            self._revalidating = True
+        threading.Thread(target=self._revalidate, daemon=True).start()
+
+    def _revalidate(self) -> None:
+        try:
+            self._try_refresh()
+        finally:
+            with self._lock:
+                self._revalidating = False
+
+    def _refresh_periodically(self) -> None:
+        while not self._stopped.is_set():
+            self._try_refresh()
+            self._stopped.wait(self.refresh_interval_seconds)
+
+
+@dataclass
+class AsyncBlockChainTickerCurrencyConverter:
+    converter: BlockChainTickerCurrencyConverter
+    # built on first use, on python 3.9 a lock binds to the loop current when
+    # it is built and this object is built before the server's loop runs
+    _cold_fetch_lock: Optional[asyncio.Lock] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def _cold_fetch(self) -> asyncio.Lock:
+        if self._cold_fetch_lock is None:
+            self._cold_fetch_lock = asyncio.Lock()
+        return self._cold_fetch_lock
+
+    async def convert_btc_to_fiat(
+        self, satoshis: int, currency: FiatCurrency
+    ) -> Result[float, ConversionError]:
         if currency not in BlockChainTickerCurrencyConverter.fiat_currency_str:
             return Err(ConversionError.UNSUPPORTED_CURRENCY)
 
-        last_conversion_rate = response.json()[
-            BlockChainTickerCurrencyConverter.fiat_currency_str[currency]
-        ]["last"]
+        # requests arriving together on a cold cache share one fetch
+        async with self._cold_fetch:
+            await self.converter.ensure_rates()
+        return self.converter.convert_btc_to_fiat(satoshis, currency)
+
+    async def convert_many(
+        self, satoshis: List[int], currencies: List[FiatCurrency]
+    ) -> Result[List[FiatAmounts], ConversionError]:
+        if any(
+            currency not in BlockChainTickerCurrencyConverter.fiat_currency_str
+            for currency in currencies
+        ):
+            return Err(ConversionError.UNSUPPORTED_CURRENCY)
 
-        return Ok((satoshis / SATOSHI_IN_BTC) * last_conversion_rate)
+        async with self._cold_fetch:
+            await self.converter.ensure_rates()
+        return self.converter.convert_many(satoshis, currencies)
 
 
 class RandomCurrencyConverter:
@@ -54,3 +250,12 @@ class RandomCurrencyConverter:
         self, satoshis: int, currency: FiatCurrency
     ) -> Result[float, ConversionError]:
         return Ok(random.random())
+
+    def convert_many(
+        self, satoshis: List[int], currencies: List[FiatCurrency]
+    ) -> Result[List[FiatAmounts], ConversionError]:
+        return Ok(
+            convert_with_rates(
+                satoshis, {currency: random.random() for currency in currencies}
+            )
+        )
@@ -7,22 +7,36 @@ from app.core.admin.interactor import (
     AdminInteractor,
     GetStatisticsRequest,
     GetStatisticsResponse,
+    GetTransactionTimeseriesRequest,
+    GetTransactionTimeseriesResponse,
     IAdminInteractor,
     IAdminRepository,
 )
-from app.core.currency_converter import BlockChainTickerCurrencyConverter
+from app.core.currency_converter import ICurrencyConverter
 from app.core.key_generator import generate_new_user_key, generate_wallet_address
+from app.core.provisioning.interactor import (
+    IProvisioningInteractor,
+    ProvisioningError,
+    ProvisioningInteractor,
+    ProvisionUsersRequest,
+    ProvisionUsersResponse,
+)
 from app.core.transaction.fee_calculator import FeeCalculator
 from app.core.transaction.interactor import (
+    ExportTransactionsRequest,
+    ExportTransactionsResponse,
     GetTransactionsRequest,
     GetTransactionsResponse,
     ITransactionInteractor,
     ITransactionRepository,
     MakeTransactionRequest,
     MakeTransactionResponse,
+    MakeTransactionsRequest,
+    MakeTransactionsResponse,
     TransactionError,
     TransactionInteractor,
 )
+from app.core.unit_of_work import IUnitOfWork
 from app.core.user.interactor import (
     IUserInteractor,
     IUserRepository,
@@ -31,9 +45,11 @@ from app.core.user.interactor import (
 )
 from app.core.wallet.interactor import (
     CreateWalletRequest,
+    GetUserWalletsRequest,
     GetWalletRequest,
     IWalletInteractor,
     IWalletRepository,
+    UserWalletsResponse,
     WalletError,
     WalletInteractor,
     WalletResponse,
@@ -46,10 +62,16 @@ class WalletService:
     wallet_interactor: IWalletInteractor
     transaction_interactor: ITransactionInteractor
     admin_interactor: IAdminInteractor
+    provisioning_interactor: IProvisioningInteractor
 
     def create_user(self) -> UserCreatedResponse:
         return self.user_interactor.create_user()
 
+    def provision_users(
+        self, request: ProvisionUsersRequest
+    ) -> Result[ProvisionUsersResponse, ProvisioningError]:
+        return self.provisioning_interactor.provision_users(request)
+
     def create_wallet(
         self, request: CreateWalletRequest
     ) -> Result[WalletResponse, WalletError]:
@@ -60,21 +82,41 @@ class WalletService:
     ) -> Result[WalletResponse, WalletError]:
         return self.wallet_interactor.get_wallet(request)
 
+    def get_user_wallets(
+        self, request: GetUserWalletsRequest
+    ) -> Result[UserWalletsResponse, WalletError]:
+        return self.wallet_interactor.get_user_wallets(request)
+
     def make_transaction(
         self, request: MakeTransactionRequest
     ) -> Result[MakeTransactionResponse, TransactionError]:
         return self.transaction_interactor.make_transaction(request)
 
+    def make_transactions(
+        self, request: MakeTransactionsRequest
+    ) -> Result[MakeTransactionsResponse, TransactionError]:
+        return self.transaction_interactor.make_transactions(request)
+
     def get_transactions(
         self, request: GetTransactionsRequest
     ) -> Result[GetTransactionsResponse, TransactionError]:
         return self.transaction_interactor.get_transactions(request)
 
+    def export_transactions(
+        self, request: ExportTransactionsRequest
+    ) -> Result[ExportTransactionsResponse, TransactionError]:
+        return self.transaction_interactor.export_transactions(request)
+
     def get_statistics(
         self, request: GetStatisticsRequest
     ) -> Result[GetStatisticsResponse, AdminError]:
         return self.admin_interactor.get_statistics(request)
 
+    def get_transaction_timeseries(
+        self, request: GetTransactionTimeseriesRequest
+    ) -> Result[GetTransactionTimeseriesResponse, AdminError]:
+        return self.admin_interactor.get_transaction_timeseries(request)
+
     @classmethod
     def create(
         cls,
@@ -82,13 +124,15 @@ class WalletService:
         wallet_repository: IWalletRepository,
         transaction_repository: ITransactionRepository,
         admin_repository: IAdminRepository,
+        currency_converter: ICurrencyConverter,
+        unit_of_work: IUnitOfWork,
     ) -> "WalletService":
         return cls(
             UserInteractor(user_repository, generate_new_user_key),
             WalletInteractor(
                 wallet_repository,
                 user_repository,
-                BlockChainTickerCurrencyConverter(),
+                currency_converter,
                 generate_wallet_address,
             ),
             TransactionInteractor(
@@ -96,6 +140,15 @@ class WalletService:
                 user_repository,
                 wallet_repository,
                 FeeCalculator(),
+                unit_of_work,
             ),
             AdminInteractor(admin_repository),
+            ProvisioningInteractor(
+                user_repository,
+                wallet_repository,
+                currency_converter,
+                generate_new_user_key,
+                generate_wallet_address,
+                unit_of_work,
+            ),
         )
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+from result import Err, Ok, Result
+
+from app.core.btc_constants import INITIAL_WALLET_VALUE_SATOSHIS
+from app.core.currency_converter import (
+    ConversionError,
+    FiatCurrency,
+    IAsyncCurrencyConverter,
+)
+from app.core.key_generator import ApiKeyGenerator
+from app.core.provisioning.interactor import (
+    ProvisioningError,
+    ProvisionUsersRequest,
+    ProvisionUsersResponse,
+    check_provisioning_request,
+    plan_provisioning,
+)
+from app.core.unit_of_work import IAsyncUnitOfWork
+from app.core.user.async_interactor import IAsyncUserRepository
+from app.core.wallet.async_interactor import IAsyncWalletRepository
+
+
+class IAsyncProvisioningInteractor(Protocol):
+    async def provision_users(
+        self, request: ProvisionUsersRequest
+    ) -> Result[ProvisionUsersResponse, ProvisioningError]:
+        raise NotImplementedError()
+
+
+@dataclass
+class AsyncProvisioningInteractor:
+    user_repository: IAsyncUserRepository
+    wallet_repository: IAsyncWalletRepository
+    currency_convertor: IAsyncCurrencyConverter
+    key_generator: ApiKeyGenerator
+    wallet_address_creator: ApiKeyGenerator
+    unit_of_work: IAsyncUnitOfWork
+
+    async def provision_users(
+        self, request: ProvisionUsersRequest
+    ) -> Result[ProvisionUsersResponse, ProvisioningError]:
+        checked = check_provisioning_request(request)
+        if isinstance(checked, Err):
+            return checked
+
+        converted_to_fiat: Result[float, ConversionError] = (
+            await self.currency_convertor.convert_btc_to_fiat(
+                satoshis=INITIAL_WALLET_VALUE_SATOSHIS, currency=FiatCurrency.USD
+            )
+        )
+        if isinstance(converted_to_fiat, Err):
+            return Err(ProvisioningError.UNSUPPORTED_CURRENCY)
+
+        plan = plan_provisioning(
+            request, self.key_generator, self.wallet_address_creator
+        )
+        async with self.unit_of_work.atomic():
+            await self.user_repository.create_users(plan.api_keys)
+            await self.wallet_repository.create_wallets(plan.wallets)
+
+        return Ok(plan.to_response(converted_to_fiat.value))
@@ -0,0 +1,142 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Protocol
+
+from result import Err, Ok, Result
+
+from app.core.admin.interactor import ADMIN_KEY
+from app.core.btc_constants import INITIAL_WALLET_VALUE_SATOSHIS, SATOSHI_IN_BTC
+from app.core.currency_converter import (
+    ConversionError,
+    FiatCurrency,
+    ICurrencyConverter,
+)
+from app.core.key_generator import ApiKeyGenerator
+from app.core.unit_of_work import IUnitOfWork
+from app.core.user.interactor import IUserRepository
+from app.core.wallet.entity import Wallet
+from app.core.wallet.interactor import (
+    MAX_WALLETS_PER_PERSON,
+    IWalletRepository,
+    WalletResponse,
+)
+
+
+class ProvisioningError(Enum):
+    INCORRECT_ADMIN_KEY = 0
+    WALLET_LIMIT_REACHED = 1
+    UNSUPPORTED_CURRENCY = 2
+
+
+@dataclass
+class ProvisionUsersRequest:
+    admin_key: str
+    number_of_users: int
+    wallets_per_user: int
+
+
+@dataclass
+class ProvisionedUser:
+    api_key: str
+    wallets: List[WalletResponse]
+
+
+@dataclass
+class ProvisionUsersResponse:
+    users: List[ProvisionedUser]
+
+
+class IProvisioningInteractor(Protocol):
+    def provision_users(
+        self, request: ProvisionUsersRequest
+    ) -> Result[ProvisionUsersResponse, ProvisioningError]:
+        raise NotImplementedError()
+
+
+def check_provisioning_request(
+    request: ProvisionUsersRequest,
+) -> Result[None, ProvisioningError]:
+    if request.admin_key != ADMIN_KEY:
+        return Err(ProvisioningError.INCORRECT_ADMIN_KEY)
+    if request.wallets_per_user > MAX_WALLETS_PER_PERSON:
+        return Err(ProvisioningError.WALLET_LIMIT_REACHED)
+    return Ok(None)
+
+
+@dataclass
+class ProvisioningPlan:
+    api_keys: List[str]
+    # wallets_per_user consecutive wallets for every api key, in order
+    wallets: List[Wallet]
+    wallets_per_user: int
+
+    def to_response(self, balance_usd: float) -> ProvisionUsersResponse:
+        # every wallet starts with the same balance, so it is converted once
+        balance_btc = INITIAL_WALLET_VALUE_SATOSHIS / SATOSHI_IN_BTC
+        users = []
+        for i, api_key in enumerate(self.api_keys):
+            start = i * self.wallets_per_user
+            end = start + self.wallets_per_user
+            users.append(
+                ProvisionedUser(
+                    api_key=api_key,
+                    wallets=[
+                        WalletResponse(
+                            wallet_address=wallet.address,
+                            balance_btc=balance_btc,
+                            balance_usd=balance_usd,
+                        )
+                        for wallet in self.wallets[start:end]
+                    ],
+                )
+            )
+        return ProvisionUsersResponse(users)
+
+
+def plan_provisioning(
+    request: ProvisionUsersRequest,
+    key_generator: ApiKeyGenerator,
+    wallet_address_creator: ApiKeyGenerator,
+) -> ProvisioningPlan:
+    api_keys = [key_generator() for _ in range(request.number_of_users)]
+    wallets = [
+        Wallet(wallet_address_creator(), api_key, INITIAL_WALLET_VALUE_SATOSHIS)
+        for api_key in api_keys
+        for _ in range(request.wallets_per_user)
+    ]
+    return ProvisioningPlan(api_keys, wallets, request.wallets_per_user)
+
+
+@dataclass
+class ProvisioningInteractor:
+    user_repository: IUserRepository
+    wallet_repository: IWalletRepository
+    currency_convertor: ICurrencyConverter
+    key_generator: ApiKeyGenerator
+    wallet_address_creator: ApiKeyGenerator
+    unit_of_work: IUnitOfWork
+
+    def provision_users(
+        self, request: ProvisionUsersRequest
+    ) -> Result[ProvisionUsersResponse, ProvisioningError]:
+        checked = check_provisioning_request(request)
+        if isinstance(checked, Err):
+            return checked
+
+        # converted before anything is written, a failed lookup creates nothing
+        converted_to_fiat: Result[float, ConversionError] = (
+            self.currency_convertor.convert_btc_to_fiat(
+                satoshis=INITIAL_WALLET_VALUE_SATOSHIS, currency=FiatCurrency.USD
+            )
+        )
+        if isinstance(converted_to_fiat, Err):
+            return Err(ProvisioningError.UNSUPPORTED_CURRENCY)
+
+        plan = plan_provisioning(
+            request, self.key_generator, self.wallet_address_creator
+        )
+        with self.unit_of_work.atomic():
+            self.user_repository.create_users(plan.api_keys)
+            self.wallet_repository.create_wallets(plan.wallets)
+
+        return Ok(plan.to_response(converted_to_fiat.value))
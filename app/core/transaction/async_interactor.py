@@ -0,0 +1,185 @@
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional, Protocol
+
+from result import Err, Ok, Result
+
+from app.core.clock import Clock, unix_time
+from app.core.transaction.entity import Transaction
+from app.core.transaction.fee_calculator import IFeeCalculator
+from app.core.transaction.interactor import (
+    ExportTransactionsRequest,
+    GetTransactionsRequest,
+    GetTransactionsResponse,
+    MakeTransactionRequest,
+    MakeTransactionResponse,
+    MakeTransactionsRequest,
+    MakeTransactionsResponse,
+    TransactionError,
+    TransactionPage,
+    TransferRequest,
+    plan_transfers,
+    transfer_addresses,
+)
+from app.core.unit_of_work import IAsyncUnitOfWork
+from app.core.user.async_interactor import IAsyncUserRepository
+from app.core.wallet.async_interactor import IAsyncWalletRepository
+from app.core.wallet.identity_map import WalletIdentityMap
+
+
+@dataclass
+class AsyncExportTransactionsResponse:
+    # lazily produced, callers must consume it before the repository goes away
+    transactions: AsyncIterator[Transaction]
+
+
+class IAsyncTransactionRepository(Protocol):
+    async def create_transaction(self, transaction: Transaction) -> None:
+        raise NotImplementedError()
+
+    async def create_transactions(self, transactions: List[Transaction]) -> None:
+        raise NotImplementedError()
+
+    async def get_all_user_transactions(self, user_api_key: str) -> List[Transaction]:
+        raise NotImplementedError()
+
+    async def get_all_wallet_transactions(
+        self, wallet_address: str
+    ) -> List[Transaction]:
+        raise NotImplementedError()
+
+    async def get_user_transactions_page(
+        self, user_api_key: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        raise NotImplementedError()
+
+    async def get_wallet_transactions_page(
+        self, wallet_address: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        raise NotImplementedError()
+
+    def iter_user_transactions(self, user_api_key: str) -> AsyncIterator[Transaction]:
+        raise NotImplementedError()
+
+    def iter_wallet_transactions(
+        self, wallet_address: str
+    ) -> AsyncIterator[Transaction]:
+        raise NotImplementedError()
+
+
+class IAsyncTransactionInteractor(Protocol):
+    async def make_transaction(
+        self, request: MakeTransactionRequest
+    ) -> Result[MakeTransactionResponse, TransactionError]:
+        raise NotImplementedError()
+
+    async def make_transactions(
+        self, request: MakeTransactionsRequest
+    ) -> Result[MakeTransactionsResponse, TransactionError]:
+        raise NotImplementedError()
+
+    async def get_transactions(
+        self, request: GetTransactionsRequest
+    ) -> Result[GetTransactionsResponse, TransactionError]:
+        raise NotImplementedError()
+
+    async def export_transactions(
+        self, request: ExportTransactionsRequest
+    ) -> Result[AsyncExportTransactionsResponse, TransactionError]:
+        raise NotImplementedError()
+
+
+@dataclass
+class AsyncTransactionInteractor:
+    transaction_repository: IAsyncTransactionRepository
+    user_repository: IAsyncUserRepository
+    wallet_repository: IAsyncWalletRepository
+    fee_calculator: IFeeCalculator
+    unit_of_work: IAsyncUnitOfWork
+    clock: Clock = unix_time
+
+    async def make_transaction(
+        self, request: MakeTransactionRequest
+    ) -> Result[MakeTransactionResponse, TransactionError]:
+        transfer = TransferRequest(
+            request.source_address, request.destination_address, request.amount
+        )
+        response = await self.make_transactions(
+            MakeTransactionsRequest(request.user_api_key, [transfer])
+        )
+        if isinstance(response, Err):
+            return response
+        return response.value.results[0]
+
+    async def make_transactions(
+        self, request: MakeTransactionsRequest
+    ) -> Result[MakeTransactionsResponse, TransactionError]:
+        if await self.user_repository.get_user(request.user_api_key) is None:
+            return Err(TransactionError.USER_NOT_FOUND)
+
+        async with self.unit_of_work.atomic():
+            wallets = WalletIdentityMap()
+            await wallets.load_async(
+                self.wallet_repository, transfer_addresses(request.transfers)
+            )
+            plan = plan_transfers(
+                request.user_api_key,
+                request.transfers,
+                wallets,
+                self.fee_calculator,
+                self.clock(),
+            )
+            await wallets.flush_async(self.wallet_repository)
+            if plan.transactions:
+                await self.transaction_repository.create_transactions(plan.transactions)
+
+        return Ok(MakeTransactionsResponse(plan.results))
+
+    async def get_transactions(
+        self, request: GetTransactionsRequest
+    ) -> Result[GetTransactionsResponse, TransactionError]:
+        error = await self._check_history_access(
+            request.user_api_key, request.wallet_address
+        )
+        if error is not None:
+            return Err(error)
+
+        if request.wallet_address is None:
+            page = await self.transaction_repository.get_user_transactions_page(
+                request.user_api_key, request.cursor, request.limit
+            )
+        else:
+            page = await self.transaction_repository.get_wallet_transactions_page(
+                request.wallet_address, request.cursor, request.limit
+            )
+        return Ok(GetTransactionsResponse(page.transactions, page.next_cursor))
+
+    async def export_transactions(
+        self, request: ExportTransactionsRequest
+    ) -> Result[AsyncExportTransactionsResponse, TransactionError]:
+        error = await self._check_history_access(
+            request.user_api_key, request.wallet_address
+        )
+        if error is not None:
+            return Err(error)
+
+        if request.wallet_address is None:
+            transactions = self.transaction_repository.iter_user_transactions(
+                request.user_api_key
+            )
+        else:
+            transactions = self.transaction_repository.iter_wallet_transactions(
+                request.wallet_address
+            )
+        return Ok(AsyncExportTransactionsResponse(transactions))
+
+    async def _check_history_access(
+        self, user_api_key: str, wallet_address: Optional[str]
+    ) -> Optional[TransactionError]:
+        if await self.user_repository.get_user(user_api_key) is None:
+            return TransactionError.USER_NOT_FOUND
+        if (
+            wallet_address is not None
+            and await self.wallet_repository.get_wallet(wallet_address) is None
+        ):
+            return TransactionError.WALLET_NOT_FOUND
+        return None
@@ -1,9 +1,14 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class Transaction:
+    # histories hold millions of these, slots drop the per instance __dict__
+    __slots__ = ("source", "destination", "amount", "fee", "created_at")
+
     source: str
     destination: str
     amount: int
     fee: int
+    # unix time in seconds
+    created_at: int
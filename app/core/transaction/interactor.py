@@ -1,13 +1,16 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Protocol
+from typing import Iterator, List, Optional, Protocol
 
 from result import Err, Ok, Result
 
 from app.core.btc_constants import SATOSHI_IN_BTC
+from app.core.clock import Clock, unix_time
 from app.core.transaction.entity import Transaction
 from app.core.transaction.fee_calculator import IFeeCalculator
+from app.core.unit_of_work import IUnitOfWork
 from app.core.user.interactor import IUserRepository
+from app.core.wallet.identity_map import WalletIdentityMap
 from app.core.wallet.interactor import IWalletRepository
 
 
@@ -33,27 +36,88 @@ class MakeTransactionResponse:
     amount_left_btc: float
 
 
+@dataclass
+class TransferRequest:
+    source_address: str
+    destination_address: str
+    amount: int
+
+
+@dataclass
+class MakeTransactionsRequest:
+    user_api_key: str
+    transfers: List[TransferRequest]
+
+
+@dataclass
+class MakeTransactionsResponse:
+    # one result per transfer, in request order
+    results: List[Result[MakeTransactionResponse, TransactionError]]
+
+
 @dataclass
 class GetTransactionsRequest:
     user_api_key: str
     wallet_address: Optional[str] = None
+    # id of the last transaction already seen, None starts from the beginning
+    cursor: Optional[int] = None
+    limit: Optional[int] = None
 
 
 @dataclass
 class GetTransactionsResponse:
     transactions: List[Transaction]
+    next_cursor: Optional[int] = None
+
+
+@dataclass
+class ExportTransactionsRequest:
+    user_api_key: str
+    wallet_address: Optional[str] = None
+
+
+@dataclass
+class ExportTransactionsResponse:
+    # lazily produced, callers must consume it before the repository goes away
+    transactions: Iterator[Transaction]
+
+
+@dataclass
+class TransactionPage:
+    transactions: List[Transaction]
+    # None when there are no transactions after this page
+    next_cursor: Optional[int] = None
 
 
 class ITransactionRepository(Protocol):
     def create_transaction(self, transaction: Transaction) -> None:
         raise NotImplementedError()
 
+    def create_transactions(self, transactions: List[Transaction]) -> None:
+        raise NotImplementedError()
+
     def get_all_user_transactions(self, user_api_key: str) -> List[Transaction]:
         raise NotImplementedError()
 
     def get_all_wallet_transactions(self, wallet_address: str) -> List[Transaction]:
         raise NotImplementedError()
 
+    def get_user_transactions_page(
+        self, user_api_key: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        raise NotImplementedError()
+
+    def get_wallet_transactions_page(
+        self, wallet_address: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        raise NotImplementedError()
+
+    def iter_user_transactions(self, user_api_key: str) -> Iterator[Transaction]:
+        raise NotImplementedError()
+
+    def iter_wallet_transactions(self, wallet_address: str) -> Iterator[Transaction]:
+        raise NotImplementedError()
+
 
 class ITransactionInteractor(Protocol):
     def make_transaction(
@@ -61,11 +125,84 @@ class ITransactionInteractor(Protocol):
     ) -> Result[MakeTransactionResponse, TransactionError]:
         raise NotImplementedError()
 
+    def make_transactions(
+        self, request: MakeTransactionsRequest
+    ) -> Result[MakeTransactionsResponse, TransactionError]:
+        raise NotImplementedError()
+
     def get_transactions(
         self, request: GetTransactionsRequest
     ) -> Result[GetTransactionsResponse, TransactionError]:
         raise NotImplementedError()
 
+    def export_transactions(
+        self, request: ExportTransactionsRequest
+    ) -> Result[ExportTransactionsResponse, TransactionError]:
+        raise NotImplementedError()
+
+
+@dataclass
+class TransferPlan:
+    results: List[Result[MakeTransactionResponse, TransactionError]]
+    transactions: List[Transaction]
+
+
+def transfer_addresses(transfers: List[TransferRequest]) -> List[str]:
+    addresses = dict.fromkeys(
+        address
+        for transfer in transfers
+        for address in (transfer.source_address, transfer.destination_address)
+    )
+    return list(addresses)
+
+
+def plan_transfers(
+    user_api_key: str,
+    transfers: List[TransferRequest],
+    wallets: WalletIdentityMap,
+    fee_calculator: IFeeCalculator,
+    created_at: int,
+) -> TransferPlan:
+    # applies the transfers in order to the request's copies of the wallets,
+    # so a transfer can spend what an earlier one in the batch credited
+    results: List[Result[MakeTransactionResponse, TransactionError]] = []
+    transactions: List[Transaction] = []
+    for transfer in transfers:
+        source = wallets.get(transfer.source_address)
+        destination = wallets.get(transfer.destination_address)
+        if source is None:
+            results.append(Err(TransactionError.SOURCE_WALLET_NOT_FOUND))
+            continue
+        if destination is None:
+            results.append(Err(TransactionError.DESTINATION_WALLET_NOT_FOUND))
+            continue
+        if source.owner_key != user_api_key:
+            results.append(Err(TransactionError.INCORRECT_API_KEY))
+            continue
+
+        fee_amount = fee_calculator(source, destination, transfer.amount)
+        if source.balance < transfer.amount:
+            results.append(Err(TransactionError.NOT_ENOUGH_AMOUNT_ON_SOURCE_ACCOUNT))
+            continue
+
+        wallets.change_balance(source.address, -transfer.amount)
+        balance_left = source.balance
+        wallets.change_balance(destination.address, transfer.amount - fee_amount)
+        transactions.append(
+            Transaction(
+                source=source.address,
+                destination=destination.address,
+                amount=transfer.amount,
+                fee=fee_amount,
+                created_at=created_at,
+            )
+        )
+        results.append(
+            Ok(MakeTransactionResponse(amount_left_btc=balance_left / SATOSHI_IN_BTC))
+        )
+
+    return TransferPlan(results, transactions)
+
 
 @dataclass
 class TransactionInteractor:
@@ -73,71 +210,89 @@ class TransactionInteractor:
     user_repository: IUserRepository
     wallet_repository: IWalletRepository
     fee_calculator: IFeeCalculator
+    unit_of_work: IUnitOfWork
+    clock: Clock = unix_time
 
     def make_transaction(
         self, request: MakeTransactionRequest
     ) -> Result[MakeTransactionResponse, TransactionError]:
+        transfer = TransferRequest(
+            request.source_address, request.destination_address, request.amount
+        )
+        response = self.make_transactions(
+            MakeTransactionsRequest(request.user_api_key, [transfer])
+        )
+        if isinstance(response, Err):
+            return response
+        return response.value.results[0]
+
+    def make_transactions(
+        self, request: MakeTransactionsRequest
+    ) -> Result[MakeTransactionsResponse, TransactionError]:
         if self.user_repository.get_user(request.user_api_key) is None:
             return Err(TransactionError.USER_NOT_FOUND)
 
-        source = self.wallet_repository.get_wallet(request.source_address)
-        destination = self.wallet_repository.get_wallet(request.destination_address)
-
-        if source is None:
-            return Err(TransactionError.SOURCE_WALLET_NOT_FOUND)
-        if destination is None:
-            return Err(TransactionError.DESTINATION_WALLET_NOT_FOUND)
-
-        if source.owner_key != request.user_api_key:
-            return Err(TransactionError.INCORRECT_API_KEY)
-
-        fee_amount = self.fee_calculator(source, destination, request.amount)
-
-        if source.balance < request.amount:
-            return Err(TransactionError.NOT_ENOUGH_AMOUNT_ON_SOURCE_ACCOUNT)
-
-        source.balance -= request.amount
-        destination.balance += request.amount - fee_amount
-
-        self.wallet_repository.update_balance(source.address, source.balance)
-        self.wallet_repository.update_balance(destination.address, destination.balance)
-
-        self.transaction_repository.create_transaction(
-            Transaction(
-                source=source.address,
-                destination=destination.address,
-                amount=request.amount,
-                fee=fee_amount,
+        # balances are read under the write lock, so the plan stays valid
+        # until it is written
+        with self.unit_of_work.atomic():
+            wallets = WalletIdentityMap()
+            wallets.load(self.wallet_repository, transfer_addresses(request.transfers))
+            # every transfer of a request is stamped with the same time
+            plan = plan_transfers(
+                request.user_api_key,
+                request.transfers,
+                wallets,
+                self.fee_calculator,
+                self.clock(),
             )
-        )
+            wallets.flush(self.wallet_repository)
+            if plan.transactions:
+                self.transaction_repository.create_transactions(plan.transactions)
 
-        return Ok(
-            MakeTransactionResponse(amount_left_btc=source.balance / SATOSHI_IN_BTC)
-        )
+        return Ok(MakeTransactionsResponse(plan.results))
 
     def get_transactions(
         self, request: GetTransactionsRequest
     ) -> Result[GetTransactionsResponse, TransactionError]:
-        if self.user_repository.get_user(request.user_api_key) is None:
-            return Err(TransactionError.USER_NOT_FOUND)
+        error = self._check_history_access(request.user_api_key, request.wallet_address)
+        if error is not None:
+            return Err(error)
 
         if request.wallet_address is None:
-            return Ok(
-                GetTransactionsResponse(
-                    self.transaction_repository.get_all_user_transactions(
-                        request.user_api_key
-                    )
-                )
+            page = self.transaction_repository.get_user_transactions_page(
+                request.user_api_key, request.cursor, request.limit
             )
+        else:
+            page = self.transaction_repository.get_wallet_transactions_page(
+                request.wallet_address, request.cursor, request.limit
+            )
+        return Ok(GetTransactionsResponse(page.transactions, page.next_cursor))
 
-        wallet = self.wallet_repository.get_wallet(request.wallet_address)
-        if wallet is None:
-            return Err(TransactionError.WALLET_NOT_FOUND)
+    def export_transactions(
+        self, request: ExportTransactionsRequest
+    ) -> Result[ExportTransactionsResponse, TransactionError]:
+        error = self._check_history_access(request.user_api_key, request.wallet_address)
+        if error is not None:
+            return Err(error)
 
-        return Ok(
-            GetTransactionsResponse(
-                self.transaction_repository.get_all_wallet_transactions(
-                    request.wallet_address
-                )
+        if request.wallet_address is None:
+            transactions = self.transaction_repository.iter_user_transactions(
+                request.user_api_key
             )
-        )
+        else:
+            transactions = self.transaction_repository.iter_wallet_transactions(
+                request.wallet_address
+            )
+        return Ok(ExportTransactionsResponse(transactions))
+
+    def _check_history_access(
+        self, user_api_key: str, wallet_address: Optional[str]
+    ) -> Optional[TransactionError]:
+        if self.user_repository.get_user(user_api_key) is None:
+            return TransactionError.USER_NOT_FOUND
+        if (
+            wallet_address is not None
+            and self.wallet_repository.get_wallet(wallet_address) is None
+        ):
+            return TransactionError.WALLET_NOT_FOUND
+        return None
@@ -0,0 +1,13 @@
+from typing import AsyncContextManager, ContextManager, Protocol
+
+
+class IUnitOfWork(Protocol):
+    # repository calls made inside atomic() do not interleave with other units
+    # of work, a persistent implementation also rolls them back on error
+    def atomic(self) -> ContextManager[None]:
+        raise NotImplementedError()
+
+
+class IAsyncUnitOfWork(Protocol):
+    def atomic(self) -> AsyncContextManager[None]:
+        raise NotImplementedError()
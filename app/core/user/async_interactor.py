@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import List, Optional, Protocol
+
+from app.core.key_generator import ApiKeyGenerator
+from app.core.user.entity import User
+from app.core.user.interactor import UserCreatedResponse
+
+
+class IAsyncUserRepository(Protocol):
+    async def create_user(self, api_key: str) -> User:
+        raise NotImplementedError()
+
+    async def create_users(self, api_keys: List[str]) -> List[User]:
+        raise NotImplementedError()
+
+    async def get_user(self, user_api_key: str) -> Optional[User]:
+        raise NotImplementedError()
+
+
+class IAsyncUserInteractor(Protocol):
+    async def create_user(self) -> UserCreatedResponse:
+        raise NotImplementedError()
+
+
+@dataclass
+class AsyncUserInteractor:
+    repository: IAsyncUserRepository
+    key_generator: ApiKeyGenerator
+
+    async def create_user(self) -> UserCreatedResponse:
+        new_key = self.key_generator()
+        return UserCreatedResponse(user=await self.repository.create_user(new_key))
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class User:
+    __slots__ = ("api_key",)
+
     api_key: str
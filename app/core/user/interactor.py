@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, Protocol
+from typing import List, Optional, Protocol
 
 from app.core.key_generator import ApiKeyGenerator
 from app.core.user.entity import User
@@ -14,6 +14,9 @@ class IUserRepository(Protocol):
     def create_user(self, api_key: str) -> User:
         raise NotImplementedError()
 
+    def create_users(self, api_keys: List[str]) -> List[User]:
+        raise NotImplementedError()
+
     def get_user(self, user_api_key: str) -> Optional[User]:
         raise NotImplementedError()
 
@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Protocol
+
+from result import Err, Ok, Result
+
+from app.core.btc_constants import INITIAL_WALLET_VALUE_SATOSHIS
+from app.core.currency_converter import IAsyncCurrencyConverter
+from app.core.key_generator import ApiKeyGenerator
+from app.core.user.async_interactor import IAsyncUserRepository
+from app.core.wallet.entity import Wallet
+from app.core.wallet.interactor import (
+    MAX_WALLETS_PER_PERSON,
+    CreateWalletRequest,
+    GetUserWalletsRequest,
+    GetWalletRequest,
+    UserWalletsResponse,
+    WalletError,
+    WalletResponse,
+    balance_currencies,
+    to_user_wallets_response,
+    to_wallet_response,
+    user_wallets_balances,
+)
+
+
+class IAsyncWalletRepository(Protocol):
+    async def create_wallet(
+        self, user_api_key: str, wallet_address: str, initial_balance: int
+    ) -> Wallet:
+        raise NotImplementedError()
+
+    async def create_wallets(self, wallets: List[Wallet]) -> None:
+        raise NotImplementedError()
+
+    async def get_wallet(self, wallet_address: str) -> Optional[Wallet]:
+        raise NotImplementedError()
+
+    async def get_user_wallets(self, user_api_key: str) -> List[Wallet]:
+        raise NotImplementedError()
+
+    async def get_wallets(self, wallet_addresses: List[str]) -> List[Wallet]:
+        raise NotImplementedError()
+
+    async def update_balance(self, wallet_address: str, balance: int) -> None:
+        raise NotImplementedError()
+
+    async def apply_balance_changes(self, balance_changes: Dict[str, int]) -> None:
+        raise NotImplementedError()
+
+
+class IAsyncWalletInteractor(Protocol):
+    async def create_wallet(
+        self, request: CreateWalletRequest
+    ) -> Result[WalletResponse, WalletError]:
+        raise NotImplementedError()
+
+    async def get_wallet(
+        self, request: GetWalletRequest
+    ) -> Result[WalletResponse, WalletError]:
+        raise NotImplementedError()
+
+    async def get_user_wallets(
+        self, request: GetUserWalletsRequest
+    ) -> Result[UserWalletsResponse, WalletError]:
+        raise NotImplementedError()
+
+
+@dataclass
+class AsyncWalletInteractor:
+    wallet_repository: IAsyncWalletRepository
+    user_repository: IAsyncUserRepository
+    currency_convertor: IAsyncCurrencyConverter
+    wallet_address_creator: ApiKeyGenerator
+
+    async def create_wallet(
+        self, request: CreateWalletRequest
+    ) -> Result[WalletResponse, WalletError]:
+        if await self.user_repository.get_user(request.user_api_key) is None:
+            return Err(WalletError.USER_NOT_FOUND)
+
+        user_wallets = await self.wallet_repository.get_user_wallets(
+            request.user_api_key
+        )
+
+        if len(user_wallets) == MAX_WALLETS_PER_PERSON:
+            return Err(WalletError.WALLET_LIMIT_REACHED)
+
+        wallet = await self.wallet_repository.create_wallet(
+            request.user_api_key,
+            self.wallet_address_creator(),
+            INITIAL_WALLET_VALUE_SATOSHIS,
+        )
+        return await self._wallet_response(wallet, request.all_currencies)
+
+    async def get_wallet(
+        self, request: GetWalletRequest
+    ) -> Result[WalletResponse, WalletError]:
+        if await self.user_repository.get_user(request.user_api_key) is None:
+            return Err(WalletError.USER_NOT_FOUND)
+
+        wallet = await self.wallet_repository.get_wallet(request.wallet_address)
+        if wallet is None:
+            return Err(WalletError.WALLET_NOT_FOUND)
+        if wallet.owner_key != request.user_api_key:
+            return Err(WalletError.NOT_THIS_USERS_WALLET)
+
+        return await self._wallet_response(wallet, request.all_currencies)
+
+    async def get_user_wallets(
+        self, request: GetUserWalletsRequest
+    ) -> Result[UserWalletsResponse, WalletError]:
+        wallets = await self.wallet_repository.get_user_wallets(request.user_api_key)
+        if not wallets and (
+            await self.user_repository.get_user(request.user_api_key) is None
+        ):
+            return Err(WalletError.USER_NOT_FOUND)
+
+        converted = await self.currency_convertor.convert_many(
+            user_wallets_balances(wallets), balance_currencies(request.all_currencies)
+        )
+        if isinstance(converted, Err):
+            return Err(WalletError.UNSUPPORTED_CURRENCY)
+
+        return Ok(
+            to_user_wallets_response(wallets, converted.value, request.all_currencies)
+        )
+
+    async def _wallet_response(
+        self, wallet: Wallet, all_currencies: bool
+    ) -> Result[WalletResponse, WalletError]:
+        converted = await self.currency_convertor.convert_many(
+            [wallet.balance], balance_currencies(all_currencies)
+        )
+        if isinstance(converted, Err):
+            return Err(WalletError.UNSUPPORTED_CURRENCY)
+
+        return Ok(to_wallet_response(wallet, converted.value[0], all_currencies))
@@ -3,6 +3,8 @@ from dataclasses import dataclass
 
 @dataclass
 class Wallet:
+    __slots__ = ("address", "owner_key", "balance")
+
     address: str
     owner_key: str
     balance: int
@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from app.core.wallet.async_interactor import IAsyncWalletRepository
+from app.core.wallet.entity import Wallet
+from app.core.wallet.interactor import IWalletRepository
+
+
+@dataclass
+class WalletIdentityMap:
+    # Wallets read during one request, keyed by address. Every wallet is
+    # fetched at most once, balance changes are applied to private copies and
+    # written together at the end, so a request touches each row at most twice.
+    wallets: Dict[str, Wallet] = field(default_factory=dict)
+    # addresses looked up and not found
+    missing: Set[str] = field(default_factory=set)
+    balance_changes: Dict[str, int] = field(default_factory=dict)
+
+    def unknown(self, wallet_addresses: List[str]) -> List[str]:
+        return list(
+            dict.fromkeys(
+                a
+                for a in wallet_addresses
+                if a not in self.wallets and a not in self.missing
+            )
+        )
+
+    def add(self, wallet_addresses: List[str], wallets: List[Wallet]) -> None:
+        for wallet in wallets:
+            # a copy, so that in-memory repositories never see a pending change
+            self.wallets[wallet.address] = Wallet(
+                wallet.address, wallet.owner_key, wallet.balance
+            )
+        for address in wallet_addresses:
+            if address not in self.wallets:
+                self.missing.add(address)
+
+    def get(self, wallet_address: str) -> Optional[Wallet]:
+        return self.wallets.get(wallet_address)
+
+    def change_balance(self, wallet_address: str, amount: int) -> None:
+        self.wallets[wallet_address].balance += amount
+        self.balance_changes[wallet_address] = (
+            self.balance_changes.get(wallet_address, 0) + amount
+        )
+
+    def take_balance_changes(self) -> Dict[str, int]:
+        changes = {a: amount for a, amount in self.balance_changes.items() if amount}
+        self.balance_changes = {}
+        return changes
+
+    def load(self, repository: IWalletRepository, wallet_addresses: List[str]) -> None:
+        unknown = self.unknown(wallet_addresses)
+        if unknown:
+            self.add(unknown, repository.get_wallets(unknown))
+
+    def flush(self, repository: IWalletRepository) -> None:
+        changes = self.take_balance_changes()
+        if changes:
+            repository.apply_balance_changes(changes)
+
+    async def load_async(
+        self, repository: IAsyncWalletRepository, wallet_addresses: List[str]
+    ) -> None:
+        unknown = self.unknown(wallet_addresses)
+        if unknown:
+            self.add(unknown, await repository.get_wallets(unknown))
+
+    async def flush_async(self, repository: IAsyncWalletRepository) -> None:
+        changes = self.take_balance_changes()
+        if changes:
+            await repository.apply_balance_changes(changes)
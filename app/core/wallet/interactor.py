@@ -1,12 +1,13 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Protocol
+from typing import Dict, List, Optional, Protocol
 
 from result import Err, Ok, Result
 
 from app.core.btc_constants import INITIAL_WALLET_VALUE_SATOSHIS, SATOSHI_IN_BTC
 from app.core.currency_converter import (
-    ConversionError,
+    SUPPORTED_CURRENCIES,
+    FiatAmounts,
     FiatCurrency,
     ICurrencyConverter,
 )
@@ -28,17 +29,35 @@ class WalletResponse:
     wallet_address: str
     balance_btc: float
     balance_usd: float
+    # the balance in every supported currency by its code, when asked for
+    balances: Optional[Dict[str, float]] = None
 
 
 @dataclass
 class CreateWalletRequest:
     user_api_key: str
+    all_currencies: bool = False
 
 
 @dataclass
 class GetWalletRequest:
     user_api_key: str
     wallet_address: str
+    all_currencies: bool = False
+
+
+@dataclass
+class GetUserWalletsRequest:
+    user_api_key: str
+    all_currencies: bool = False
+
+
+@dataclass
+class UserWalletsResponse:
+    wallets: List[WalletResponse]
+    total_btc: float
+    total_usd: float
+    total_balances: Optional[Dict[str, float]] = None
 
 
 class IWalletRepository(Protocol):
@@ -47,15 +66,26 @@ class IWalletRepository(Protocol):
     ) -> Wallet:
         raise NotImplementedError()
 
+    def create_wallets(self, wallets: List[Wallet]) -> None:
+        raise NotImplementedError()
+
     def get_wallet(self, wallet_address: str) -> Optional[Wallet]:
         raise NotImplementedError()
 
     def get_user_wallets(self, user_api_key: str) -> List[Wallet]:
         raise NotImplementedError()
 
+    # unknown addresses are left out
+    def get_wallets(self, wallet_addresses: List[str]) -> List[Wallet]:
+        raise NotImplementedError()
+
     def update_balance(self, wallet_address: str, balance: int) -> None:
         raise NotImplementedError()
 
+    # adds every amount to its wallet's balance, amounts may be negative
+    def apply_balance_changes(self, balance_changes: Dict[str, int]) -> None:
+        raise NotImplementedError()
+
 
 class IWalletInteractor(Protocol):
     def create_wallet(
@@ -68,10 +98,57 @@ class IWalletInteractor(Protocol):
     ) -> Result[WalletResponse, WalletError]:
         raise NotImplementedError()
 
+    def get_user_wallets(
+        self, request: GetUserWalletsRequest
+    ) -> Result[UserWalletsResponse, WalletError]:
+        raise NotImplementedError()
+
 
 MAX_WALLETS_PER_PERSON = 3
 
 
+def balance_currencies(all_currencies: bool) -> List[FiatCurrency]:
+    return SUPPORTED_CURRENCIES if all_currencies else [FiatCurrency.USD]
+
+
+def by_code(amounts: FiatAmounts, all_currencies: bool) -> Optional[Dict[str, float]]:
+    if not all_currencies:
+        return None
+    return {currency.name: amount for currency, amount in amounts.items()}
+
+
+def to_wallet_response(
+    wallet: Wallet, amounts: FiatAmounts, all_currencies: bool
+) -> WalletResponse:
+    return WalletResponse(
+        wallet_address=wallet.address,
+        balance_btc=wallet.balance / SATOSHI_IN_BTC,
+        balance_usd=amounts[FiatCurrency.USD],
+        balances=by_code(amounts, all_currencies),
+    )
+
+
+def user_wallets_balances(wallets: List[Wallet]) -> List[int]:
+    # every wallet's balance and then the total, converted in one go
+    balances = [wallet.balance for wallet in wallets]
+    return balances + [sum(balances)]
+
+
+def to_user_wallets_response(
+    wallets: List[Wallet], amounts: List[FiatAmounts], all_currencies: bool
+) -> UserWalletsResponse:
+    total = amounts[-1]
+    return UserWalletsResponse(
+        wallets=[
+            to_wallet_response(wallet, wallet_amounts, all_currencies)
+            for wallet, wallet_amounts in zip(wallets, amounts)
+        ],
+        total_btc=sum(wallet.balance for wallet in wallets) / SATOSHI_IN_BTC,
+        total_usd=total[FiatCurrency.USD],
+        total_balances=by_code(total, all_currencies),
+    )
+
+
 @dataclass
 class WalletInteractor:
     wallet_repository: IWalletRepository
@@ -95,23 +172,7 @@ class WalletInteractor:
             self.wallet_address_creator(),
             INITIAL_WALLET_VALUE_SATOSHIS,
         )
-
-        converted_to_fiat: Result[
-            float, ConversionError
-        ] = self.currency_convertor.convert_btc_to_fiat(
-            satoshis=wallet.balance, currency=FiatCurrency.USD
-        )
-
-        if isinstance(converted_to_fiat, Err):
-            return Err(WalletError.UNSUPPORTED_CURRENCY)
-
-        return Ok(
-            WalletResponse(
-                wallet_address=wallet.address,
-                balance_btc=wallet.balance / SATOSHI_IN_BTC,
-                balance_usd=converted_to_fiat.value,
-            )
-        )
+        return self._wallet_response(wallet, request.all_currencies)
 
     def get_wallet(
         self, request: GetWalletRequest
@@ -125,19 +186,34 @@ class WalletInteractor:
         if wallet.owner_key != request.user_api_key:
             return Err(WalletError.NOT_THIS_USERS_WALLET)
 
-        converted_to_fiat: Result[
-            float, ConversionError
-        ] = self.currency_convertor.convert_btc_to_fiat(
-            satoshis=wallet.balance, currency=FiatCurrency.USD
-        )
+        return self._wallet_response(wallet, request.all_currencies)
 
-        if isinstance(converted_to_fiat, Err):
+    def get_user_wallets(
+        self, request: GetUserWalletsRequest
+    ) -> Result[UserWalletsResponse, WalletError]:
+        wallets = self.wallet_repository.get_user_wallets(request.user_api_key)
+        # a user with wallets exists, only an empty list needs the user lookup
+        if not wallets and self.user_repository.get_user(request.user_api_key) is None:
+            return Err(WalletError.USER_NOT_FOUND)
+
+        converted = self.currency_convertor.convert_many(
+            user_wallets_balances(wallets), balance_currencies(request.all_currencies)
+        )
+        if isinstance(converted, Err):
             return Err(WalletError.UNSUPPORTED_CURRENCY)
 
         return Ok(
-            WalletResponse(
-                wallet_address=wallet.address,
-                balance_btc=wallet.balance / SATOSHI_IN_BTC,
-                balance_usd=converted_to_fiat.value,
-            )
+            to_user_wallets_response(wallets, converted.value, request.all_currencies)
         )
+
+    def _wallet_response(
+        self, wallet: Wallet, all_currencies: bool
+    ) -> Result[WalletResponse, WalletError]:
+        # one rate lookup for all the currencies
+        converted = self.currency_convertor.convert_many(
+            [wallet.balance], balance_currencies(all_currencies)
+        )
+        if isinstance(converted, Err):
+            return Err(WalletError.UNSUPPORTED_CURRENCY)
+
+        return Ok(to_wallet_response(wallet, converted.value[0], all_currencies))
@@ -0,0 +1,127 @@
+import asyncio
+import contextvars
+import sqlite3
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+import aiosqlite
+
+from app.infra.sqlite.database import MEMORY, SqliteSettings
+from app.infra.sqlite.migrations import migrate
+
+
+async def connect(filename: str, settings: SqliteSettings) -> aiosqlite.Connection:
+    conn = await aiosqlite.connect(filename, uri=True)
+    await conn.execute(f"PRAGMA busy_timeout = {int(settings.busy_timeout_ms)}")
+    await conn.execute(f"PRAGMA journal_mode = {settings.journal_mode}")
+    await conn.execute(f"PRAGMA synchronous = {settings.synchronous}")
+    await conn.execute(f"PRAGMA mmap_size = {int(settings.mmap_size)}")
+    return conn
+
+
+class AsyncSqliteDatabase:
+    def __init__(
+        self,
+        filename: str,
+        schema_version: Optional[int] = None,
+        settings: SqliteSettings = SqliteSettings(),
+    ) -> None:
+        in_memory = filename == MEMORY
+        if in_memory:
+            # see SqliteDatabase, the anchor keeps the shared-cache database
+            # alive while no pooled connection is open yet
+            filename = f"file:{uuid.uuid4().hex}?mode=memory&cache=shared"
+            settings = SqliteSettings(
+                pool_size=1,
+                journal_mode="MEMORY",
+                synchronous=settings.synchronous,
+                busy_timeout_ms=settings.busy_timeout_ms,
+                mmap_size=0,
+            )
+        self.filename = filename
+        self.settings = settings
+        # connections are opened lazily, on the event loop that serves requests.
+        # So are the queue and the lock: on python 3.9 they bind to the loop
+        # current when they are built, and this runs before uvicorn's loop
+        self._lazy_idle: "Optional[asyncio.LifoQueue[aiosqlite.Connection]]" = None
+        self._opened: List[aiosqlite.Connection] = []
+        self._lazy_open_lock: Optional[asyncio.Lock] = None
+        # the connection pinned to the current task, nested blocks reuse it
+        self._current: contextvars.ContextVar[Optional[aiosqlite.Connection]] = (
+            contextvars.ContextVar(f"sqlite-{id(self)}", default=None)
+        )
+
+        self._anchor: Optional[sqlite3.Connection] = sqlite3.connect(
+            filename, uri=True, check_same_thread=False
+        )
+        migrate(self._anchor, schema_version)
+        if not in_memory:
+            self._anchor.close()
+            self._anchor = None
+
+    @property
+    def _idle(self) -> "asyncio.LifoQueue[aiosqlite.Connection]":
+        if self._lazy_idle is None:
+            self._lazy_idle = asyncio.LifoQueue()
+        return self._lazy_idle
+
+    @property
+    def _open_lock(self) -> asyncio.Lock:
+        if self._lazy_open_lock is None:
+            self._lazy_open_lock = asyncio.Lock()
+        return self._lazy_open_lock
+
+    async def _acquire(self) -> aiosqlite.Connection:
+        try:
+            return self._idle.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        async with self._open_lock:
+            if len(self._opened) < self.settings.pool_size:
+                conn = await connect(self.filename, self.settings)
+                self._opened.append(conn)
+                return conn
+        return await self._idle.get()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        conn = self._current.get()
+        if conn is not None:
+            # nested use, e.g. inside atomic(), the outermost one commits
+            yield conn
+            return
+
+        conn = await self._acquire()
+        token = self._current.set(conn)
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                await conn.rollback()
+            raise
+        else:
+            if conn.in_transaction:
+                await conn.commit()
+        finally:
+            self._current.reset(token)
+            self._idle.put_nowait(conn)
+
+    @asynccontextmanager
+    async def atomic(self) -> AsyncIterator[None]:
+        async with self.connection() as conn:
+            if not conn.in_transaction:
+                await conn.execute("BEGIN IMMEDIATE")
+            yield
+
+    async def close(self) -> None:
+        async with self._open_lock:
+            for conn in self._opened:
+                await conn.close()
+            self._opened.clear()
+            self._lazy_idle = None
+        # a later use may come from another event loop
+        self._lazy_open_lock = None
+        if self._anchor is not None:
+            self._anchor.close()
+            self._anchor = None
@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterable, List, Optional
+
+from app.core.admin.interactor import (
+    Granularity,
+    TransactionBucket,
+    TransactionStatistics,
+)
+from app.core.transaction.entity import Transaction
+from app.core.transaction.interactor import TransactionPage
+from app.infra.async_sqlite.database import AsyncSqliteDatabase
+from app.infra.repository.id_transaction import IdTransaction
+from app.infra.sqlite.transaction import (
+    ITER_BATCH_SIZE,
+    SINGLE_WALLET,
+    USER_WALLETS,
+    select_buckets,
+    select_transactions,
+    to_transaction_page,
+)
+
+
+@dataclass(init=False)
+class AsyncSqlTransactionRepository:
+    def __init__(self, database: AsyncSqliteDatabase) -> None:
+        self.database = database
+
+    async def create_transaction(self, transaction: Transaction) -> None:
+        async with self.database.connection() as conn:
+            await conn.execute(
+                " INSERT INTO Transaction_tbl VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    None,
+                    transaction.source,
+                    transaction.destination,
+                    transaction.amount,
+                    transaction.fee,
+                    transaction.created_at,
+                ),
+            )
+
+    async def create_transactions(self, transactions: List[Transaction]) -> None:
+        async with self.database.connection() as conn:
+            await conn.executemany(
+                " INSERT INTO Transaction_tbl VALUES (NULL, ?, ?, ?, ?, ?)",
+                [
+                    (t.source, t.destination, t.amount, t.fee, t.created_at)
+                    for t in transactions
+                ],
+            )
+
+    async def get_all_user_transactions(self, user_api_key: str) -> List[Transaction]:
+        page = await self.get_user_transactions_page(user_api_key, None, None)
+        return page.transactions
+
+    async def get_all_wallet_transactions(
+        self, wallet_address: str
+    ) -> List[Transaction]:
+        page = await self.get_wallet_transactions_page(wallet_address, None, None)
+        return page.transactions
+
+    async def get_user_transactions_page(
+        self, user_api_key: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        return await self._get_transactions_page(
+            USER_WALLETS, user_api_key, cursor, limit
+        )
+
+    async def get_wallet_transactions_page(
+        self, wallet_address: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        return await self._get_transactions_page(
+            SINGLE_WALLET, wallet_address, cursor, limit
+        )
+
+    def iter_user_transactions(self, user_api_key: str) -> AsyncIterator[Transaction]:
+        return self._iter_transactions(USER_WALLETS, user_api_key)
+
+    def iter_wallet_transactions(
+        self, wallet_address: str
+    ) -> AsyncIterator[Transaction]:
+        return self._iter_transactions(SINGLE_WALLET, wallet_address)
+
+    async def _iter_transactions(
+        self, wallets: str, key: str
+    ) -> AsyncIterator[Transaction]:
+        cursor = None
+        while True:
+            page = await self._get_transactions_page(
+                wallets, key, cursor, ITER_BATCH_SIZE
+            )
+            for transaction in page.transactions:
+                yield transaction
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    async def _get_transactions_page(
+        self, wallets: str, key: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        async with self.database.connection() as conn:
+            rows = await conn.execute_fetchall(
+                *select_transactions(wallets, key, cursor, limit)
+            )
+        return to_transaction_page(rows, limit)
+
+    async def get_all_transactions(self) -> List[Transaction]:
+        async with self.database.connection() as conn:
+            rows: Iterable[Any] = await conn.execute_fetchall(
+                " SELECT * FROM Transaction_tbl"
+            )
+        return [IdTransaction.from_row(row).transaction for row in rows]
+
+    async def get_transaction_statistics(self) -> TransactionStatistics:
+        async with self.database.connection() as conn:
+            cursor = await conn.execute(
+                " SELECT number_of_transactions, profit FROM Transaction_statistics"
+            )
+            row = await cursor.fetchone()
+        assert row is not None
+        number_of_transactions, profit = row
+        return TransactionStatistics(number_of_transactions, profit)
+
+    async def get_transaction_buckets(
+        self, granularity: Granularity, start: int, end: int
+    ) -> List[TransactionBucket]:
+        async with self.database.connection() as conn:
+            rows: Iterable[Any] = await conn.execute_fetchall(
+                *select_buckets(granularity, start, end)
+            )
+        return [TransactionBucket(*row) for row in rows]
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.core.user.entity import User
+from app.infra.async_sqlite.database import AsyncSqliteDatabase
+
+
+@dataclass
+class AsyncSqlUserRepository:
+    def __init__(self, database: AsyncSqliteDatabase) -> None:
+        self.database = database
+
+    async def create_user(self, api_key: str) -> User:
+        async with self.database.connection() as conn:
+            await conn.execute(" INSERT INTO Users VALUES (?)", (api_key,))
+        return User(api_key)
+
+    async def create_users(self, api_keys: List[str]) -> List[User]:
+        async with self.database.connection() as conn:
+            await conn.executemany(
+                " INSERT INTO Users VALUES (?)", [(api_key,) for api_key in api_keys]
+            )
+        return [User(api_key) for api_key in api_keys]
+
+    async def get_user(self, user_api_key: str) -> Optional[User]:
+        async with self.database.connection() as conn:
+            for row in await conn.execute_fetchall(
+                " SELECT * FROM Users WHERE api_key = ?", (user_api_key,)
+            ):
+                return User(*row)
+
+        return None
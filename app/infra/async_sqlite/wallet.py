@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from app.core.wallet.entity import Wallet
+from app.infra.async_sqlite.database import AsyncSqliteDatabase
+from app.infra.sqlite.wallet import MAX_VARIABLES
+
+
+@dataclass
+class AsyncSqlWalletRepository:
+    def __init__(self, database: AsyncSqliteDatabase) -> None:
+        self.database = database
+
+    async def create_wallet(
+        self, user_api_key: str, wallet_address: str, initial_balance: int
+    ) -> Wallet:
+        async with self.database.connection() as conn:
+            await conn.execute(
+                " INSERT INTO Wallet VALUES (?, ?, ?)",
+                (wallet_address, user_api_key, initial_balance),
+            )
+        return Wallet(wallet_address, user_api_key, initial_balance)
+
+    async def create_wallets(self, wallets: List[Wallet]) -> None:
+        async with self.database.connection() as conn:
+            await conn.executemany(
+                " INSERT INTO Wallet VALUES (?, ?, ?)",
+                [(w.address, w.owner_key, w.balance) for w in wallets],
+            )
+
+    async def get_wallet(self, wallet_address: str) -> Optional[Wallet]:
+        async with self.database.connection() as conn:
+            for row in await conn.execute_fetchall(
+                " SELECT * FROM Wallet WHERE address = ?", (wallet_address,)
+            ):
+                return Wallet(*row)
+        return None
+
+    async def get_user_wallets(self, user_api_key: str) -> List[Wallet]:
+        async with self.database.connection() as conn:
+            rows = await conn.execute_fetchall(
+                " SELECT * FROM Wallet WHERE owner_key = ?", (user_api_key,)
+            )
+        return [Wallet(*row) for row in rows]
+
+    async def get_wallets(self, wallet_addresses: List[str]) -> List[Wallet]:
+        wallets: List[Wallet] = list()
+        async with self.database.connection() as conn:
+            for start in range(0, len(wallet_addresses), MAX_VARIABLES):
+                end = start + MAX_VARIABLES
+                chunk = wallet_addresses[start:end]
+                for row in await conn.execute_fetchall(
+                    " SELECT * FROM Wallet WHERE address IN"
+                    f" ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ):
+                    wallets.append(Wallet(*row))
+        return wallets
+
+    async def update_balance(self, wallet_address: str, balance: int) -> None:
+        async with self.database.connection() as conn:
+            await conn.execute(
+                "UPDATE Wallet SET balance = ? WHERE address = ?",
+                (balance, wallet_address),
+            )
+
+    async def apply_balance_changes(self, balance_changes: Dict[str, int]) -> None:
+        async with self.database.connection() as conn:
+            await conn.executemany(
+                "UPDATE Wallet SET balance = balance + ? WHERE address = ?",
+                [(amount, address) for address, amount in balance_changes.items()],
+            )
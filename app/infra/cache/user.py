@@ -0,0 +1,126 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from app.core.user.async_interactor import IAsyncUserRepository
+from app.core.user.entity import User
+from app.core.user.interactor import IUserRepository
+
+
+@dataclass
+class UserCacheStats:
+    hits: int = 0
+    misses: int = 0
+    # lookups of unknown keys answered without the repository
+    negative_hits: int = 0
+
+
+@dataclass
+class UserCache:
+    # users are never deleted, so a cached user never goes stale
+    max_size: int = 100_000
+    # an unknown key is remembered only briefly, it may be created elsewhere
+    negative_ttl_seconds: float = 5.0
+    max_negative_size: int = 10_000
+    clock: Callable[[], float] = time.monotonic
+    stats: UserCacheStats = field(default_factory=UserCacheStats)
+
+    _users: "OrderedDict[str, User]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    # api key -> time after which the key is looked up again
+    _unknown: "OrderedDict[str, float]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    # returns (True, user) on a hit, (False, None) when the caller has to ask
+    def lookup(self, api_key: str) -> Tuple[bool, Optional[User]]:
+        with self._lock:
+            user = self._users.get(api_key)
+            if user is not None:
+                self._users.move_to_end(api_key)
+                self.stats.hits += 1
+                return True, user
+            expires_at = self._unknown.get(api_key)
+            if expires_at is not None:
+                if self.clock() < expires_at:
+                    self.stats.negative_hits += 1
+                    return True, None
+                del self._unknown[api_key]
+            self.stats.misses += 1
+            return False, None
+
+    def store(self, api_key: str, user: Optional[User]) -> None:
+        with self._lock:
+            if user is not None:
+                self._users[api_key] = user
+                self._users.move_to_end(api_key)
+                if len(self._users) > self.max_size:
+                    self._users.popitem(last=False)
+            else:
+                self._unknown[api_key] = self.clock() + self.negative_ttl_seconds
+                self._unknown.move_to_end(api_key)
+                if len(self._unknown) > self.max_negative_size:
+                    self._unknown.popitem(last=False)
+
+    def forget_unknown(self, api_keys: List[str]) -> None:
+        # new users are not cached here, their transaction may still roll
+        # back, the first get_user after the commit caches them. A lookup
+        # racing with the commit can still remember a key as unknown, for at
+        # most negative_ttl_seconds
+        with self._lock:
+            for api_key in api_keys:
+                self._unknown.pop(api_key, None)
+
+
+@dataclass
+class CachedUserRepository:
+    repository: IUserRepository
+    cache: UserCache = field(default_factory=UserCache)
+
+    def create_user(self, api_key: str) -> User:
+        created = self.repository.create_user(api_key)
+        self.cache.forget_unknown([api_key])
+        return created
+
+    def create_users(self, api_keys: List[str]) -> List[User]:
+        created = self.repository.create_users(api_keys)
+        self.cache.forget_unknown(api_keys)
+        return created
+
+    def get_user(self, user_api_key: str) -> Optional[User]:
+        found, user = self.cache.lookup(user_api_key)
+        if found:
+            return user
+        user = self.repository.get_user(user_api_key)
+        self.cache.store(user_api_key, user)
+        return user
+
+
+@dataclass
+class AsyncCachedUserRepository:
+    repository: IAsyncUserRepository
+    cache: UserCache = field(default_factory=UserCache)
+
+    async def create_user(self, api_key: str) -> User:
+        created = await self.repository.create_user(api_key)
+        self.cache.forget_unknown([api_key])
+        return created
+
+    async def create_users(self, api_keys: List[str]) -> List[User]:
+        created = await self.repository.create_users(api_keys)
+        self.cache.forget_unknown(api_keys)
+        return created
+
+    async def get_user(self, user_api_key: str) -> Optional[User]:
+        found, user = self.cache.lookup(user_api_key)
+        if found:
+            return user
+        user = await self.repository.get_user(user_api_key)
+        self.cache.store(user_api_key, user)
+        return user
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from result.result import Ok
 
 from app.core.admin.interactor import (
+    MAX_TIMESERIES_BUCKETS,
     AdminError,
     GetStatisticsRequest,
     GetStatisticsResponse,
+    GetTransactionTimeseriesRequest,
+    GetTransactionTimeseriesResponse,
+    Granularity,
 )
 from app.core.facade import WalletService
 from app.infra.fastapi.dependables import get_core
@@ -15,6 +19,14 @@ error_formatter = (
     .add_error_with_status_code(
         AdminError.INCORRECT_ADMIN_KEY, "Incorrect api key for admin", 410
     )
+    .add_error_with_status_code(
+        AdminError.INVALID_TIME_RANGE, "to must be later than from", 411
+    )
+    .add_error_with_status_code(
+        AdminError.TOO_MANY_BUCKETS,
+        f"Cannot return more than {MAX_TIMESERIES_BUCKETS} buckets",
+        412,
+    )
     .build()
 )
 
@@ -37,3 +49,26 @@ def get_statistics(
         return get_statistics_response.value
     else:
         error_formatter.raise_http_exception(get_statistics_response.value)
+
+
+@admin_api.get(
+    "/statistics/timeseries",
+    response_model=GetTransactionTimeseriesResponse,
+    responses=error_formatter.responses(),
+)
+def get_transaction_timeseries(
+    admin_key: str,
+    # unix times, from inclusive and to exclusive
+    start: int = Query(..., alias="from"),
+    end: int = Query(..., alias="to"),
+    granularity: Granularity = Granularity.HOUR,
+    core: WalletService = Depends(get_core),
+) -> GetTransactionTimeseriesResponse:
+    request = GetTransactionTimeseriesRequest(admin_key, start, end, granularity)
+
+    timeseries_response = core.get_transaction_timeseries(request)
+
+    if isinstance(timeseries_response, Ok):
+        return timeseries_response.value
+    else:
+        error_formatter.raise_http_exception(timeseries_response.value)
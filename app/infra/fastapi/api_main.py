@@ -1,13 +1,35 @@
+from typing import Optional
+
 from fastapi.applications import FastAPI
 
+from app.core.async_facade import AsyncWalletService
 from app.core.facade import WalletService
 from app.infra.fastapi.admin import admin_api
+from app.infra.fastapi.async_admin import async_admin_api
+from app.infra.fastapi.async_transaction import async_transaction_api
+from app.infra.fastapi.async_user import async_user_api
+from app.infra.fastapi.async_wallet import async_wallet_api
+from app.infra.fastapi.metrics import MetricsMiddleware, metrics_api
 from app.infra.fastapi.transaction import transaction_api
 from app.infra.fastapi.user import user_api
 from app.infra.fastapi.wallet import wallet_api
+from app.infra.metrics.registry import Metrics
+
+
+def add_metrics(app: FastAPI, metrics: Optional[Metrics]) -> None:
+    # without metrics nothing is installed, requests pay for nothing
+    if metrics is None:
+        return
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+    app.include_router(metrics_api)
+    app.state.metrics = metrics
 
 
-def setup_fastapi(wallet_service: WalletService) -> FastAPI:
+def setup_fastapi(
+    wallet_service: WalletService,
+    fast_serialization: bool = False,
+    metrics: Optional[Metrics] = None,
+) -> FastAPI:
     app = FastAPI()
 
     app.include_router(user_api)
@@ -16,5 +38,26 @@ def setup_fastapi(wallet_service: WalletService) -> FastAPI:
     app.include_router(transaction_api)
 
     app.state.core = wallet_service
+    app.state.fast_serialization = fast_serialization
+    add_metrics(app, metrics)
+
+    return app
+
+
+def setup_async_fastapi(
+    wallet_service: AsyncWalletService,
+    fast_serialization: bool = False,
+    metrics: Optional[Metrics] = None,
+) -> FastAPI:
+    app = FastAPI()
+
+    app.include_router(async_user_api)
+    app.include_router(async_wallet_api)
+    app.include_router(async_admin_api)
+    app.include_router(async_transaction_api)
+
+    app.state.core = wallet_service
+    app.state.fast_serialization = fast_serialization
+    add_metrics(app, metrics)
 
     return app
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, Query
+from result.result import Ok
+
+from app.core.admin.interactor import (
+    GetStatisticsRequest,
+    GetStatisticsResponse,
+    GetTransactionTimeseriesRequest,
+    GetTransactionTimeseriesResponse,
+    Granularity,
+)
+from app.core.async_facade import AsyncWalletService
+from app.infra.fastapi.admin import error_formatter
+from app.infra.fastapi.dependables import get_async_core
+
+async_admin_api = APIRouter()
+
+
+@async_admin_api.get(
+    "/statistics",
+    response_model=GetStatisticsResponse,
+    responses=error_formatter.responses(),
+)
+async def get_statistics(
+    admin_key: str, core: AsyncWalletService = Depends(get_async_core)
+) -> GetStatisticsResponse:
+    request = GetStatisticsRequest(admin_key)
+
+    get_statistics_response = await core.get_statistics(request)
+
+    if isinstance(get_statistics_response, Ok):
+        return get_statistics_response.value
+    else:
+        error_formatter.raise_http_exception(get_statistics_response.value)
+
+
+@async_admin_api.get(
+    "/statistics/timeseries",
+    response_model=GetTransactionTimeseriesResponse,
+    responses=error_formatter.responses(),
+)
+async def get_transaction_timeseries(
+    admin_key: str,
+    start: int = Query(..., alias="from"),
+    end: int = Query(..., alias="to"),
+    granularity: Granularity = Granularity.HOUR,
+    core: AsyncWalletService = Depends(get_async_core),
+) -> GetTransactionTimeseriesResponse:
+    request = GetTransactionTimeseriesRequest(admin_key, start, end, granularity)
+
+    timeseries_response = await core.get_transaction_timeseries(request)
+
+    if isinstance(timeseries_response, Ok):
+        return timeseries_response.value
+    else:
+        error_formatter.raise_http_exception(timeseries_response.value)
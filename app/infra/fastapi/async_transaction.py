@@ -0,0 +1,206 @@
+from typing import AsyncIterable, AsyncIterator, Callable, List, Optional, Union
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response, StreamingResponse
+from result import Ok
+
+from app.core.async_facade import AsyncWalletService
+from app.core.transaction.entity import Transaction
+from app.core.transaction.interactor import (
+    ExportTransactionsRequest,
+    GetTransactionsRequest,
+    GetTransactionsResponse,
+    MakeTransactionRequest,
+    MakeTransactionResponse,
+)
+from app.infra.fastapi.dependables import get_async_core, get_fast_serialization
+from app.infra.fastapi.serialization import transactions_response
+from app.infra.fastapi.transaction import (
+    CSV_HEADER,
+    DEFAULT_TRANSACTIONS_PAGE_LIMIT,
+    EXPORT_CHUNK_SIZE,
+    MAX_TRANSACTIONS_PAGE_LIMIT,
+    ExportFormat,
+    GetTransactionsResponsePydantic,
+    MakeTransactionResponsePydantic,
+    MakeTransactionsRequestPydantic,
+    MakeTransactionsResponsePydantic,
+    encode_csv,
+    encode_ndjson,
+    error_formatter,
+    to_make_transactions_request,
+    to_make_transactions_response,
+)
+
+async_transaction_api = APIRouter()
+
+
+@async_transaction_api.post(
+    "/transactions",
+    response_model=MakeTransactionResponsePydantic,
+    responses=error_formatter.responses(),
+)
+async def create_transaction(
+    api_key: str,
+    source: str,
+    destination: str,
+    amount: int,
+    core: AsyncWalletService = Depends(get_async_core),
+) -> MakeTransactionResponse:
+    request = MakeTransactionRequest(
+        user_api_key=api_key,
+        source_address=source,
+        destination_address=destination,
+        amount=amount,
+    )
+    transaction_made_response = await core.make_transaction(request)
+
+    if isinstance(transaction_made_response, Ok):
+        return transaction_made_response.value
+    else:
+        error_formatter.raise_http_exception(transaction_made_response.value)
+
+
+@async_transaction_api.post(
+    "/transactions/batch",
+    response_model=MakeTransactionsResponsePydantic,
+    responses=error_formatter.responses(),
+)
+async def create_transactions(
+    api_key: str,
+    body: MakeTransactionsRequestPydantic,
+    core: AsyncWalletService = Depends(get_async_core),
+) -> MakeTransactionsResponsePydantic:
+    transactions_made_response = await core.make_transactions(
+        to_make_transactions_request(api_key, body)
+    )
+
+    if isinstance(transactions_made_response, Ok):
+        return to_make_transactions_response(transactions_made_response.value)
+    else:
+        error_formatter.raise_http_exception(transactions_made_response.value)
+
+
+@async_transaction_api.get(
+    "/transactions",
+    response_model=GetTransactionsResponsePydantic,
+    responses=error_formatter.responses(),
+)
+async def get_transactions_for_user(
+    api_key: str,
+    cursor: Optional[int] = None,
+    limit: int = Query(
+        DEFAULT_TRANSACTIONS_PAGE_LIMIT, gt=0, le=MAX_TRANSACTIONS_PAGE_LIMIT
+    ),
+    core: AsyncWalletService = Depends(get_async_core),
+    fast_serialization: bool = Depends(get_fast_serialization),
+) -> Union[GetTransactionsResponse, Response]:
+    request = GetTransactionsRequest(
+        user_api_key=api_key, wallet_address=None, cursor=cursor, limit=limit
+    )
+
+    get_transactions_response = await core.get_transactions(request)
+
+    if isinstance(get_transactions_response, Ok):
+        if fast_serialization:
+            return transactions_response(get_transactions_response.value)
+        return get_transactions_response.value
+    else:
+        error_formatter.raise_http_exception(get_transactions_response.value)
+
+
+@async_transaction_api.get(
+    "/wallets/{address}/transactions",
+    response_model=GetTransactionsResponsePydantic,
+    responses=error_formatter.responses(),
+)
+async def get_transactions_for_wallet(
+    api_key: str,
+    address: str,
+    cursor: Optional[int] = None,
+    limit: int = Query(
+        DEFAULT_TRANSACTIONS_PAGE_LIMIT, gt=0, le=MAX_TRANSACTIONS_PAGE_LIMIT
+    ),
+    core: AsyncWalletService = Depends(get_async_core),
+    fast_serialization: bool = Depends(get_fast_serialization),
+) -> Union[GetTransactionsResponse, Response]:
+    request = GetTransactionsRequest(
+        user_api_key=api_key, wallet_address=address, cursor=cursor, limit=limit
+    )
+
+    get_transactions_response = await core.get_transactions(request)
+
+    if isinstance(get_transactions_response, Ok):
+        if fast_serialization:
+            return transactions_response(get_transactions_response.value)
+        return get_transactions_response.value
+    else:
+        error_formatter.raise_http_exception(get_transactions_response.value)
+
+
+async def encode_in_chunks(
+    transactions: AsyncIterable[Transaction],
+    encode: Callable[[List[Transaction]], str],
+    header: str = "",
+) -> AsyncIterator[str]:
+    if header:
+        yield header
+    chunk: List[Transaction] = []
+    async for transaction in transactions:
+        chunk.append(transaction)
+        if len(chunk) == EXPORT_CHUNK_SIZE:
+            yield encode(chunk)
+            chunk = []
+    if chunk:
+        yield encode(chunk)
+
+
+async def export_response(
+    request: ExportTransactionsRequest,
+    export_format: ExportFormat,
+    core: AsyncWalletService,
+) -> StreamingResponse:
+    export_transactions_response = await core.export_transactions(request)
+
+    if not isinstance(export_transactions_response, Ok):
+        error_formatter.raise_http_exception(export_transactions_response.value)
+
+    transactions = export_transactions_response.value.transactions
+    if export_format == ExportFormat.CSV:
+        return StreamingResponse(
+            encode_in_chunks(transactions, encode_csv, ",".join(CSV_HEADER) + "\r\n"),
+            media_type="text/csv",
+        )
+    return StreamingResponse(
+        encode_in_chunks(transactions, encode_ndjson),
+        media_type="application/x-ndjson",
+    )
+
+
+@async_transaction_api.get(
+    "/transactions/export",
+    response_class=StreamingResponse,
+    responses=error_formatter.responses(),
+)
+async def export_transactions_for_user(
+    api_key: str,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    core: AsyncWalletService = Depends(get_async_core),
+) -> StreamingResponse:
+    request = ExportTransactionsRequest(user_api_key=api_key, wallet_address=None)
+    return await export_response(request, export_format, core)
+
+
+@async_transaction_api.get(
+    "/wallets/{address}/transactions/export",
+    response_class=StreamingResponse,
+    responses=error_formatter.responses(),
+)
+async def export_transactions_for_wallet(
+    api_key: str,
+    address: str,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    core: AsyncWalletService = Depends(get_async_core),
+) -> StreamingResponse:
+    request = ExportTransactionsRequest(user_api_key=api_key, wallet_address=address)
+    return await export_response(request, export_format, core)
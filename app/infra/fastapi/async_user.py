@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, Query
+from result import Ok
+
+from app.core.async_facade import AsyncWalletService
+from app.core.provisioning.interactor import (
+    ProvisionUsersRequest,
+    ProvisionUsersResponse,
+)
+from app.core.user.entity import User
+from app.core.wallet.interactor import MAX_WALLETS_PER_PERSON
+from app.infra.fastapi.dependables import get_async_core
+from app.infra.fastapi.user import (
+    MAX_PROVISIONED_USERS,
+    ProvisionUsersResponsePydantic,
+    error_formatter,
+)
+
+async_user_api = APIRouter()
+
+
+@async_user_api.post("/users", response_model=User)
+async def create_user(core: AsyncWalletService = Depends(get_async_core)) -> User:
+    user_created_response = await core.create_user()
+    return user_created_response.user
+
+
+@async_user_api.post(
+    "/users/batch",
+    response_model=ProvisionUsersResponsePydantic,
+    response_model_exclude_none=True,
+    responses=error_formatter.responses(),
+)
+async def provision_users(
+    admin_key: str,
+    users: int = Query(..., gt=0, le=MAX_PROVISIONED_USERS),
+    wallets_per_user: int = Query(1, ge=0, le=MAX_WALLETS_PER_PERSON),
+    core: AsyncWalletService = Depends(get_async_core),
+) -> ProvisionUsersResponse:
+    request = ProvisionUsersRequest(admin_key, users, wallets_per_user)
+    provision_users_response = await core.provision_users(request)
+
+    if isinstance(provision_users_response, Ok):
+        return provision_users_response.value
+    else:
+        error_formatter.raise_http_exception(provision_users_response.value)
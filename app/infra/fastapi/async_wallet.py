@@ -0,0 +1,83 @@
+from fastapi import APIRouter, Depends
+from result.result import Ok
+
+from app.core.async_facade import AsyncWalletService
+from app.core.wallet.interactor import (
+    CreateWalletRequest,
+    GetUserWalletsRequest,
+    GetWalletRequest,
+    UserWalletsResponse,
+    WalletResponse,
+)
+from app.infra.fastapi.dependables import get_async_core
+from app.infra.fastapi.wallet import (
+    UserWalletsResponsePydantic,
+    WalletResponsePydantic,
+    error_formatter,
+)
+
+async_wallet_api = APIRouter()
+
+
+@async_wallet_api.post(
+    "/wallets",
+    response_model=WalletResponsePydantic,
+    response_model_exclude_none=True,
+    responses=error_formatter.responses(),
+)
+async def create_wallet(
+    api_key: str,
+    # adds the balance in every supported currency
+    all_currencies: bool = False,
+    core: AsyncWalletService = Depends(get_async_core),
+) -> WalletResponse:
+    request = CreateWalletRequest(user_api_key=api_key, all_currencies=all_currencies)
+    wallet_created_response = await core.create_wallet(request)
+
+    if isinstance(wallet_created_response, Ok):
+        return wallet_created_response.value
+    else:
+        error_formatter.raise_http_exception(wallet_created_response.value)
+
+
+@async_wallet_api.get(
+    "/wallets/{address}",
+    response_model=WalletResponsePydantic,
+    response_model_exclude_none=True,
+    responses=error_formatter.responses(),
+)
+async def get_wallet(
+    api_key: str,
+    address: str,
+    all_currencies: bool = False,
+    core: AsyncWalletService = Depends(get_async_core),
+) -> WalletResponse:
+    request = GetWalletRequest(api_key, address, all_currencies)
+
+    get_wallet_response = await core.get_wallet(request)
+
+    if isinstance(get_wallet_response, Ok):
+        return get_wallet_response.value
+    else:
+        error_formatter.raise_http_exception(get_wallet_response.value)
+
+
+@async_wallet_api.get(
+    "/wallets",
+    response_model=UserWalletsResponsePydantic,
+    response_model_exclude_none=True,
+    responses=error_formatter.responses(),
+)
+async def get_user_wallets(
+    api_key: str,
+    all_currencies: bool = False,
+    core: AsyncWalletService = Depends(get_async_core),
+) -> UserWalletsResponse:
+    request = GetUserWalletsRequest(api_key, all_currencies)
+
+    get_user_wallets_response = await core.get_user_wallets(request)
+
+    if isinstance(get_user_wallets_response, Ok):
+        return get_user_wallets_response.value
+    else:
+        error_formatter.raise_http_exception(get_user_wallets_response.value)
@@ -1,8 +1,26 @@
 from starlette.requests import Request
 
+from app.core.async_facade import AsyncWalletService
 from app.core.facade import WalletService
+from app.infra.metrics.registry import Metrics
 
 
 def get_core(request: Request) -> WalletService:
     btc_wallet_service: WalletService = request.app.state.core
     return btc_wallet_service
+
+
+def get_async_core(request: Request) -> AsyncWalletService:
+    btc_wallet_service: AsyncWalletService = request.app.state.core
+    return btc_wallet_service
+
+
+# routes return orjson responses built from the core entities when set
+def get_fast_serialization(request: Request) -> bool:
+    fast_serialization: bool = request.app.state.fast_serialization
+    return fast_serialization
+
+
+def get_metrics(request: Request) -> Metrics:
+    metrics: Metrics = request.app.state.metrics
+    return metrics
@@ -24,14 +24,15 @@ UNDOCUMENTER_ERROR_MESSAGE = "Undocumented error, contact developers"
 class ErrorFormatter:
     error_format: Dict[Enum, ErrorFormat]
 
+    def format(self, error: Enum) -> ErrorFormat:
+        return self.error_format.get(
+            error, ErrorFormat(UNDOCUMENTED_ERROR_CODE, UNDOCUMENTER_ERROR_MESSAGE)
+        )
+
     def raise_http_exception(self, error: Enum) -> NoReturn:
-        if error not in self.error_format:
-            raise HTTPException(
-                status_code=UNDOCUMENTED_ERROR_CODE, detail=UNDOCUMENTER_ERROR_MESSAGE
-            )
+        error_format = self.format(error)
         raise HTTPException(
-            status_code=self.error_format[error].status_code,
-            detail=self.error_format[error].error_message,
+            status_code=error_format.status_code, detail=error_format.error_message
         )
 
     def responses(self) -> Dict[Union[int, str], Dict[str, Any]]:
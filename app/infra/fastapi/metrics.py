@@ -0,0 +1,54 @@
+import time
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infra.fastapi.dependables import get_metrics
+from app.infra.metrics.registry import Metrics
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+metrics_api = APIRouter()
+
+
+class MetricsMiddleware:
+    # plain ASGI instead of BaseHTTPMiddleware, which would run every request
+    # through an extra task and a memory stream
+    def __init__(self, app: ASGIApp, metrics: Metrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # the router leaves the matched route in the scope, its template
+            # keeps one series per route instead of one per wallet address
+            route = scope.get("route")
+            self.metrics.requests.observe(
+                (
+                    scope["method"],
+                    route.path if route is not None else "unmatched",
+                    str(status),
+                ),
+                time.perf_counter() - start,
+            )
+
+
+@metrics_api.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics_text(metrics: Metrics = Depends(get_metrics)) -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,33 @@
+from typing import Any, Dict, List
+
+from fastapi.responses import ORJSONResponse
+
+from app.core.transaction.entity import Transaction
+from app.core.transaction.interactor import GetTransactionsResponse
+
+# A route returning a Response skips its response_model, so rows are not
+# validated and copied through pydantic on the way out. The response_model
+# still documents the route, these encoders must produce exactly its json.
+
+
+def encode_transaction(transaction: Transaction) -> Dict[str, Any]:
+    return {
+        "source": transaction.source,
+        "destination": transaction.destination,
+        "amount": transaction.amount,
+        "fee": transaction.fee,
+        "created_at": transaction.created_at,
+    }
+
+
+def encode_transactions(transactions: List[Transaction]) -> List[Dict[str, Any]]:
+    return [encode_transaction(t) for t in transactions]
+
+
+def transactions_response(response: GetTransactionsResponse) -> ORJSONResponse:
+    return ORJSONResponse(
+        {
+            "transactions": encode_transactions(response.transactions),
+            "next_cursor": response.next_cursor,
+        }
+    )
@@ -1,20 +1,34 @@
-from typing import List
+import csv
+import io
+import json
+from enum import Enum
+from typing import Callable, Iterable, Iterator, List, Optional, Union
 
 import pydantic
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
 from result import Ok
 
 from app.core.facade import WalletService
 from app.core.transaction.entity import Transaction
 from app.core.transaction.interactor import (
+    ExportTransactionsRequest,
     GetTransactionsRequest,
     GetTransactionsResponse,
     MakeTransactionRequest,
     MakeTransactionResponse,
+    MakeTransactionsRequest,
+    MakeTransactionsResponse,
     TransactionError,
+    TransferRequest,
 )
-from app.infra.fastapi.dependables import get_core
+from app.infra.fastapi.dependables import get_core, get_fast_serialization
 from app.infra.fastapi.error_formatter import ErrorFormatterBuilder
+from app.infra.fastapi.serialization import (
+    encode_transaction,
+    transactions_response,
+)
 
 error_formatter = (
     ErrorFormatterBuilder()
@@ -47,6 +61,10 @@ error_formatter = (
 
 transaction_api = APIRouter()
 
+DEFAULT_TRANSACTIONS_PAGE_LIMIT = 100
+MAX_TRANSACTIONS_PAGE_LIMIT = 1000
+MAX_TRANSACTIONS_BATCH_SIZE = 1000
+
 
 # fastapi is supposed to work with normal dataclasses but I guess it still does not work fully :shrug:
 @pydantic.dataclasses.dataclass
@@ -80,8 +98,92 @@ def create_transaction(
         error_formatter.raise_http_exception(transaction_made_response.value)
 
 
+class TransferPydantic(BaseModel):
+    source: str
+    destination: str
+    # a negative amount would move coins from destination to source
+    amount: int = Field(..., gt=0)
+
+
+class MakeTransactionsRequestPydantic(BaseModel):
+    transfers: List[TransferPydantic] = Field(
+        ..., min_items=1, max_items=MAX_TRANSACTIONS_BATCH_SIZE
+    )
+
+
+class TransferResultPydantic(BaseModel):
+    # the status code the transfer would get from POST /transactions
+    status_code: int
+    amount_left_btc: Optional[float] = None
+    detail: Optional[str] = None
+
+
+class MakeTransactionsResponsePydantic(BaseModel):
+    results: List[TransferResultPydantic]
+
+
+def to_make_transactions_request(
+    api_key: str, body: MakeTransactionsRequestPydantic
+) -> MakeTransactionsRequest:
+    return MakeTransactionsRequest(
+        user_api_key=api_key,
+        transfers=[
+            TransferRequest(
+                source_address=t.source,
+                destination_address=t.destination,
+                amount=t.amount,
+            )
+            for t in body.transfers
+        ],
+    )
+
+
+def to_make_transactions_response(
+    response: MakeTransactionsResponse,
+) -> MakeTransactionsResponsePydantic:
+    results = []
+    for result in response.results:
+        if isinstance(result, Ok):
+            results.append(
+                TransferResultPydantic(
+                    status_code=200, amount_left_btc=result.value.amount_left_btc
+                )
+            )
+        else:
+            error_format = error_formatter.format(result.value)
+            results.append(
+                TransferResultPydantic(
+                    status_code=error_format.status_code,
+                    detail=error_format.error_message,
+                )
+            )
+    return MakeTransactionsResponsePydantic(results=results)
+
+
+@transaction_api.post(
+    "/transactions/batch",
+    response_model=MakeTransactionsResponsePydantic,
+    responses=error_formatter.responses(),
+)
+def create_transactions(
+    api_key: str,
+    body: MakeTransactionsRequestPydantic,
+    core: WalletService = Depends(get_core),
+) -> MakeTransactionsResponsePydantic:
+    # transfers are applied in order and all at once, each one succeeds or
+    # fails on its own like a single POST /transactions would
+    transactions_made_response = core.make_transactions(
+        to_make_transactions_request(api_key, body)
+    )
+
+    if isinstance(transactions_made_response, Ok):
+        return to_make_transactions_response(transactions_made_response.value)
+    else:
+        error_formatter.raise_http_exception(transactions_made_response.value)
+
+
 # Couldn't make it work directly with fastapi :')
-@pydantic.dataclasses.dataclass
+@pydantic.dataclasses.dataclass(frozen=True)
 class TransactionPydantic(Transaction):
     pass
 
@@ -89,6 +191,7 @@ class TransactionPydantic(Transaction):
 @pydantic.dataclasses.dataclass
 class GetTransactionsResponsePydantic:
     transactions: List[TransactionPydantic]
+    next_cursor: Optional[int] = None
 
 
 @transaction_api.get(
@@ -97,13 +200,23 @@ class GetTransactionsResponsePydantic:
     responses=error_formatter.responses(),
 )
 def get_transactions_for_user(
-    api_key: str, core: WalletService = Depends(get_core)
-) -> GetTransactionsResponse:
-    request = GetTransactionsRequest(user_api_key=api_key, wallet_address=None)
+    api_key: str,
+    cursor: Optional[int] = None,
+    limit: int = Query(
+        DEFAULT_TRANSACTIONS_PAGE_LIMIT, gt=0, le=MAX_TRANSACTIONS_PAGE_LIMIT
+    ),
+    core: WalletService = Depends(get_core),
+    fast_serialization: bool = Depends(get_fast_serialization),
+) -> Union[GetTransactionsResponse, Response]:
+    request = GetTransactionsRequest(
+        user_api_key=api_key, wallet_address=None, cursor=cursor, limit=limit
+    )
 
     get_transactions_response = core.get_transactions(request)
 
     if isinstance(get_transactions_response, Ok):
+        if fast_serialization:
+            return transactions_response(get_transactions_response.value)
         return get_transactions_response.value
     else:
         error_formatter.raise_http_exception(get_transactions_response.value)
@@ -115,13 +228,116 @@ def get_transactions_for_user(
     responses=error_formatter.responses(),
 )
 def get_transactions_for_wallet(
-    api_key: str, address: str, core: WalletService = Depends(get_core)
-) -> GetTransactionsResponse:
-    request = GetTransactionsRequest(user_api_key=api_key, wallet_address=address)
+    api_key: str,
+    address: str,
+    cursor: Optional[int] = None,
+    limit: int = Query(
+        DEFAULT_TRANSACTIONS_PAGE_LIMIT, gt=0, le=MAX_TRANSACTIONS_PAGE_LIMIT
+    ),
+    core: WalletService = Depends(get_core),
+    fast_serialization: bool = Depends(get_fast_serialization),
+) -> Union[GetTransactionsResponse, Response]:
+    request = GetTransactionsRequest(
+        user_api_key=api_key, wallet_address=address, cursor=cursor, limit=limit
+    )
 
     get_transactions_response = core.get_transactions(request)
 
     if isinstance(get_transactions_response, Ok):
+        if fast_serialization:
+            return transactions_response(get_transactions_response.value)
         return get_transactions_response.value
     else:
         error_formatter.raise_http_exception(get_transactions_response.value)
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+EXPORT_CHUNK_SIZE = 1000
+CSV_HEADER = ["source", "destination", "amount", "fee", "created_at"]
+
+
+def encode_ndjson(transactions: List[Transaction]) -> str:
+    # one line per transaction, each the object the json endpoints return
+    return "".join(json.dumps(encode_transaction(t)) + "\n" for t in transactions)
+
+
+def encode_csv(transactions: List[Transaction]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        (t.source, t.destination, t.amount, t.fee, t.created_at) for t in transactions
+    )
+    return buffer.getvalue()
+
+
+def encode_in_chunks(
+    transactions: Iterable[Transaction],
+    encode: Callable[[List[Transaction]], str],
+    header: str = "",
+) -> Iterator[str]:
+    # starlette hands every chunk of a sync iterator to the threadpool, one
+    # chunk per transaction would spend more time hopping threads than encoding
+    if header:
+        yield header
+    chunk: List[Transaction] = []
+    for transaction in transactions:
+        chunk.append(transaction)
+        if len(chunk) == EXPORT_CHUNK_SIZE:
+            yield encode(chunk)
+            chunk = []
+    if chunk:
+        yield encode(chunk)
+
+
+def export_response(
+    request: ExportTransactionsRequest,
+    export_format: ExportFormat,
+    core: WalletService,
+) -> StreamingResponse:
+    export_transactions_response = core.export_transactions(request)
+
+    if not isinstance(export_transactions_response, Ok):
+        error_formatter.raise_http_exception(export_transactions_response.value)
+
+    transactions = export_transactions_response.value.transactions
+    if export_format == ExportFormat.CSV:
+        return StreamingResponse(
+            encode_in_chunks(transactions, encode_csv, ",".join(CSV_HEADER) + "\r\n"),
+            media_type="text/csv",
+        )
+    return StreamingResponse(
+        encode_in_chunks(transactions, encode_ndjson),
+        media_type="application/x-ndjson",
+    )
+
+
+@transaction_api.get(
+    "/transactions/export",
+    response_class=StreamingResponse,
+    responses=error_formatter.responses(),
+)
+def export_transactions_for_user(
+    api_key: str,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    core: WalletService = Depends(get_core),
+) -> StreamingResponse:
+    request = ExportTransactionsRequest(user_api_key=api_key, wallet_address=None)
+    return export_response(request, export_format, core)
+
+
+@transaction_api.get(
+    "/wallets/{address}/transactions/export",
+    response_class=StreamingResponse,
+    responses=error_formatter.responses(),
+)
+def export_transactions_for_wallet(
+    api_key: str,
+    address: str,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    core: WalletService = Depends(get_core),
+) -> StreamingResponse:
+    request = ExportTransactionsRequest(user_api_key=api_key, wallet_address=address)
+    return export_response(request, export_format, core)
@@ -1,13 +1,76 @@
-from fastapi import APIRouter, Depends
+from typing import List
+
+import pydantic
+from fastapi import APIRouter, Depends, Query
+from result import Ok
 
 from app.core.facade import WalletService
+from app.core.provisioning.interactor import (
+    ProvisioningError,
+    ProvisionUsersRequest,
+    ProvisionUsersResponse,
+)
 from app.core.user.entity import User
+from app.core.wallet.interactor import MAX_WALLETS_PER_PERSON
 from app.infra.fastapi.dependables import get_core
+from app.infra.fastapi.error_formatter import ErrorFormatterBuilder
+from app.infra.fastapi.wallet import WalletResponsePydantic
+
+error_formatter = (
+    ErrorFormatterBuilder()
+    .add_error_with_status_code(
+        ProvisioningError.INCORRECT_ADMIN_KEY, "Incorrect api key for admin", 410
+    )
+    .add_error_with_status_code(
+        ProvisioningError.WALLET_LIMIT_REACHED,
+        f"Cannot create more than {MAX_WALLETS_PER_PERSON} wallets",
+        412,
+    )
+    .add_error_with_status_code(
+        ProvisioningError.UNSUPPORTED_CURRENCY, "Unsupported Currency", 413
+    )
+    .build()
+)
 
 user_api = APIRouter()
 
+MAX_PROVISIONED_USERS = 10000
+
 
 @user_api.post("/users", response_model=User)
 def create_user(core: WalletService = Depends(get_core)) -> User:
     user_created_response = core.create_user()
     return user_created_response.user
+
+
+@pydantic.dataclasses.dataclass
+class ProvisionedUserPydantic:
+    api_key: str
+    wallets: List[WalletResponsePydantic]
+
+
+@pydantic.dataclasses.dataclass
+class ProvisionUsersResponsePydantic:
+    users: List[ProvisionedUserPydantic]
+
+
+@user_api.post(
+    "/users/batch",
+    response_model=ProvisionUsersResponsePydantic,
+    response_model_exclude_none=True,
+    responses=error_formatter.responses(),
+)
+def provision_users(
+    admin_key: str,
+    users: int = Query(..., gt=0, le=MAX_PROVISIONED_USERS),
+    wallets_per_user: int = Query(1, ge=0, le=MAX_WALLETS_PER_PERSON),
+    core: WalletService = Depends(get_core),
+) -> ProvisionUsersResponse:
+    # all users and wallets are created in one transaction, or none are
+    request = ProvisionUsersRequest(admin_key, users, wallets_per_user)
+    provision_users_response = core.provision_users(request)
+
+    if isinstance(provision_users_response, Ok):
+        return provision_users_response.value
+    else:
+        error_formatter.raise_http_exception(provision_users_response.value)
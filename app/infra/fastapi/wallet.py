@@ -1,3 +1,5 @@
+from typing import Dict, List, Optional
+
 import pydantic
 from fastapi import APIRouter, Depends
 from result.result import Ok
@@ -6,7 +8,9 @@ from app.core.facade import WalletService
 from app.core.wallet.interactor import (
     MAX_WALLETS_PER_PERSON,
     CreateWalletRequest,
+    GetUserWalletsRequest,
     GetWalletRequest,
+    UserWalletsResponse,
     WalletError,
     WalletResponse,
 )
@@ -45,12 +49,16 @@ class WalletResponsePydantic(WalletResponse):
 @wallet_api.post(
     "/wallets",
     response_model=WalletResponsePydantic,
+    response_model_exclude_none=True,
     responses=error_formatter.responses(),
 )
 def create_wallet(
-    api_key: str, core: WalletService = Depends(get_core)
+    api_key: str,
+    # adds the balance in every supported currency
+    all_currencies: bool = False,
+    core: WalletService = Depends(get_core),
 ) -> WalletResponse:
-    request = CreateWalletRequest(user_api_key=api_key)
+    request = CreateWalletRequest(user_api_key=api_key, all_currencies=all_currencies)
     wallet_created_response = core.create_wallet(request)
 
     if isinstance(wallet_created_response, Ok):
@@ -62,12 +70,16 @@ def create_wallet(
 @wallet_api.get(
     "/wallets/{address}",
     response_model=WalletResponsePydantic,
+    response_model_exclude_none=True,
     responses=error_formatter.responses(),
 )
 def get_wallet(
-    api_key: str, address: str, core: WalletService = Depends(get_core)
+    api_key: str,
+    address: str,
+    all_currencies: bool = False,
+    core: WalletService = Depends(get_core),
 ) -> WalletResponse:
-    request = GetWalletRequest(api_key, address)
+    request = GetWalletRequest(api_key, address, all_currencies)
 
     get_wallet_response = core.get_wallet(request)
 
@@ -75,3 +87,33 @@ def get_wallet(
         return get_wallet_response.value
     else:
         error_formatter.raise_http_exception(get_wallet_response.value)
+
+
+@pydantic.dataclasses.dataclass
+class UserWalletsResponsePydantic:
+    wallets: List[WalletResponsePydantic]
+    total_btc: float
+    total_usd: float
+    total_balances: Optional[Dict[str, float]] = None
+
+
+@wallet_api.get(
+    "/wallets",
+    response_model=UserWalletsResponsePydantic,
+    response_model_exclude_none=True,
+    responses=error_formatter.responses(),
+)
+def get_user_wallets(
+    api_key: str,
+    all_currencies: bool = False,
+    core: WalletService = Depends(get_core),
+) -> UserWalletsResponse:
+    # every wallet of the user and their total, converted with one rate lookup
+    request = GetUserWalletsRequest(api_key, all_currencies)
+
+    get_user_wallets_response = core.get_user_wallets(request)
+
+    if isinstance(get_user_wallets_response, Ok):
+        return get_user_wallets_response.value
+    else:
+        error_formatter.raise_http_exception(get_user_wallets_response.value)
@@ -0,0 +1,143 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from app.core.admin.interactor import (
+    Granularity,
+    TransactionBucket,
+    TransactionStatistics,
+)
+from app.core.transaction.entity import Transaction
+from app.core.transaction.interactor import TransactionPage
+from app.core.wallet.interactor import IWalletRepository
+from app.infra.inmemory.transaction import TransactionRollups, merge_ids
+
+
+def int_column() -> "array[int]":
+    return array("q")
+
+
+@dataclass
+class ColumnarTransactionRepository:
+    wallet_repository: IWalletRepository
+    # one entry per transaction, a transaction's id is its position. Transaction
+    # objects are only built for the rows a query returns
+    sources: "array[int]" = field(default_factory=int_column)
+    destinations: "array[int]" = field(default_factory=int_column)
+    amounts: "array[int]" = field(default_factory=int_column)
+    fees: "array[int]" = field(default_factory=int_column)
+    created_ats: "array[int]" = field(default_factory=int_column)
+    # wallet addresses are interned, the columns hold positions in addresses
+    addresses: List[str] = field(default_factory=list)
+    address_ids: Dict[str, int] = field(default_factory=dict)
+    # ascending ids of the transactions every interned address took part in
+    by_address: List["array[int]"] = field(default_factory=list)
+    rollups: TransactionRollups = field(default_factory=TransactionRollups)
+    # sum of the fees column, kept so that statistics do not scan it
+    profit: int = 0
+
+    def create_transaction(self, transaction: Transaction) -> None:
+        transaction_id = len(self.amounts)
+        source = self._intern(transaction.source)
+        destination = self._intern(transaction.destination)
+        self.sources.append(source)
+        self.destinations.append(destination)
+        self.amounts.append(transaction.amount)
+        self.fees.append(transaction.fee)
+        self.created_ats.append(transaction.created_at)
+        self.by_address[source].append(transaction_id)
+        if destination != source:
+            self.by_address[destination].append(transaction_id)
+        self.rollups.add(transaction)
+        self.profit += transaction.fee
+
+    def create_transactions(self, transactions: List[Transaction]) -> None:
+        for transaction in transactions:
+            self.create_transaction(transaction)
+
+    def get_all_user_transactions(self, user_api_key: str) -> List[Transaction]:
+        return self.get_user_transactions_page(user_api_key, None, None).transactions
+
+    def get_all_wallet_transactions(self, wallet_address: str) -> List[Transaction]:
+        return self.get_wallet_transactions_page(
+            wallet_address, None, None
+        ).transactions
+
+    def get_user_transactions_page(
+        self, user_api_key: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        return self._get_transactions_page(
+            self._user_addresses(user_api_key), cursor, limit
+        )
+
+    def get_wallet_transactions_page(
+        self, wallet_address: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        return self._get_transactions_page([wallet_address], cursor, limit)
+
+    def iter_user_transactions(self, user_api_key: str) -> Iterator[Transaction]:
+        for i in self._related_ids(self._user_addresses(user_api_key), 0):
+            yield self._transaction(i)
+
+    def iter_wallet_transactions(self, wallet_address: str) -> Iterator[Transaction]:
+        for i in self._related_ids([wallet_address], 0):
+            yield self._transaction(i)
+
+    def get_all_transactions(self) -> List[Transaction]:
+        return [self._transaction(i) for i in range(len(self.amounts))]
+
+    def get_transaction_statistics(self) -> TransactionStatistics:
+        return TransactionStatistics(
+            number_of_transactions=len(self.amounts), profit=self.profit
+        )
+
+    def get_transaction_buckets(
+        self, granularity: Granularity, start: int, end: int
+    ) -> List[TransactionBucket]:
+        return self.rollups.get(granularity, start, end)
+
+    def _intern(self, address: str) -> int:
+        address_id = self.address_ids.get(address)
+        if address_id is None:
+            address_id = len(self.addresses)
+            self.addresses.append(address)
+            self.address_ids[address] = address_id
+            self.by_address.append(int_column())
+        return address_id
+
+    def _transaction(self, i: int) -> Transaction:
+        return Transaction(
+            source=self.addresses[self.sources[i]],
+            destination=self.addresses[self.destinations[i]],
+            amount=self.amounts[i],
+            fee=self.fees[i],
+            created_at=self.created_ats[i],
+        )
+
+    def _user_addresses(self, user_api_key: str) -> List[str]:
+        return [
+            w.address for w in self.wallet_repository.get_user_wallets(user_api_key)
+        ]
+
+    def _related_ids(self, addresses: List[str], start: int) -> Iterator[int]:
+        return merge_ids(
+            [
+                self.by_address[self.address_ids[a]]
+                for a in addresses
+                if a in self.address_ids
+            ],
+            start,
+        )
+
+    def _get_transactions_page(
+        self, addresses: List[str], cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        start = 0 if cursor is None else max(cursor + 1, 0)
+        page: List[int] = []
+        for i in self._related_ids(addresses, start):
+            if limit is not None and len(page) == limit:
+                return TransactionPage(
+                    [self._transaction(j) for j in page], next_cursor=page[-1]
+                )
+            page.append(i)
+        return TransactionPage([self._transaction(j) for j in page])
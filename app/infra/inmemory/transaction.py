@@ -1,36 +1,205 @@
-import copy
-from dataclasses import dataclass, field
-from typing import List
+import heapq
+from bisect import bisect_left
+from dataclasses import dataclass, field, replace
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence
 
+from app.core.admin.interactor import (
+    Granularity,
+    TransactionBucket,
+    TransactionStatistics,
+    bucket_start,
+)
 from app.core.transaction.entity import Transaction
+from app.core.transaction.interactor import TransactionPage
 from app.core.wallet.interactor import IWalletRepository
-from app.infra.repository.id_transaction import IdTransaction
+
+
+def merge_ids(id_lists: Iterable[Sequence[int]], start: int) -> Iterator[int]:
+    # merges ascending id lists from start on, an id that is in several lists,
+    # e.g. a transfer between two wallets of one user, is yielded once
+    def ids_from(ids: Sequence[int]) -> Iterator[int]:
+        for position in range(bisect_left(ids, start), len(ids)):
+            yield ids[position]
+
+    previous = None
+    for i in heapq.merge(*(ids_from(ids) for ids in id_lists)):
+        if i != previous:
+            yield i
+            previous = i
+
+
+def empty_buckets() -> Dict[Granularity, Dict[int, TransactionBucket]]:
+    return {granularity: {} for granularity in Granularity}
+
+
+@dataclass
+class TransactionRollups:
+    # per granularity, the buckets something happened in by their start
+    buckets: Dict[Granularity, Dict[int, TransactionBucket]] = field(
+        default_factory=empty_buckets
+    )
+
+    def add(self, transaction: Transaction) -> None:
+        for granularity, buckets in self.buckets.items():
+            start = bucket_start(transaction.created_at, granularity)
+            bucket = buckets.get(start)
+            if bucket is None:
+                bucket = buckets[start] = TransactionBucket(start, 0, 0, 0)
+            bucket.number_of_transactions += 1
+            bucket.volume += transaction.amount
+            bucket.profit += transaction.fee
+
+    def get(
+        self, granularity: Granularity, start: int, end: int
+    ) -> List[TransactionBucket]:
+        # walks the range and not the stored buckets, O(buckets in range)
+        buckets = self.buckets[granularity]
+        return [
+            replace(buckets[s])
+            for s in range(bucket_start(start, granularity), end, granularity.seconds)
+            if s in buckets
+        ]
 
 
 @dataclass
 class InMemoryTransactionRepository:
     wallet_repository: IWalletRepository
-    data: List[IdTransaction] = field(default_factory=list)
-    id_counter = 0
+    # a transaction's id is its position, transactions are frozen so they are
+    # handed out without copying
+    data: List[Transaction] = field(default_factory=list)
+    # ascending ids of the transactions every address took part in
+    by_address: Dict[str, List[int]] = field(default_factory=dict)
+    rollups: TransactionRollups = field(default_factory=TransactionRollups)
+    # sum of all fees, kept so that statistics do not scan the history
+    profit: int = 0
 
     def create_transaction(self, transaction: Transaction) -> None:
-        self.data.append(IdTransaction(id=self.id_counter, transaction=transaction))
-        self.id_counter += 1
+        transaction_id = len(self.data)
+        self.data.append(transaction)
+        self.by_address.setdefault(transaction.source, []).append(transaction_id)
+        if transaction.destination != transaction.source:
+            self.by_address.setdefault(transaction.destination, []).append(
+                transaction_id
+            )
+        self.profit += transaction.fee
+        self.rollups.add(transaction)
+
+    def create_transactions(self, transactions: List[Transaction]) -> None:
+        for transaction in transactions:
+            self.create_transaction(transaction)
 
     def get_all_user_transactions(self, user_api_key: str) -> List[Transaction]:
-        user_wallets = self.wallet_repository.get_user_wallets(user_api_key)
-        user_wallet_addresses = [w.address for w in user_wallets]
-        unique_transactions = set(
-            t for t in self.data if t.is_related_to_addresses(user_wallet_addresses)
-        )
-        return [copy.copy(t.transaction) for t in unique_transactions]
+        return self.get_user_transactions_page(user_api_key, None, None).transactions
 
     def get_all_wallet_transactions(self, wallet_address: str) -> List[Transaction]:
+        return self.get_wallet_transactions_page(
+            wallet_address, None, None
+        ).transactions
+
+    def get_user_transactions_page(
+        self, user_api_key: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        return self._get_transactions_page(
+            self._user_addresses(user_api_key), cursor, limit
+        )
+
+    def get_wallet_transactions_page(
+        self, wallet_address: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        return self._get_transactions_page([wallet_address], cursor, limit)
+
+    def iter_user_transactions(self, user_api_key: str) -> Iterator[Transaction]:
+        for i in self._related_ids(self._user_addresses(user_api_key), 0):
+            yield self.data[i]
+
+    def iter_wallet_transactions(self, wallet_address: str) -> Iterator[Transaction]:
+        for i in self._related_ids([wallet_address], 0):
+            yield self.data[i]
+
+    def _user_addresses(self, user_api_key: str) -> List[str]:
         return [
-            copy.copy(t.transaction)
-            for t in self.data
-            if t.is_related_to_addresses([wallet_address])
+            w.address for w in self.wallet_repository.get_user_wallets(user_api_key)
         ]
 
+    def _related_ids(self, addresses: List[str], start: int) -> Iterator[int]:
+        return merge_ids([self.by_address.get(a, []) for a in addresses], start)
+
+    def _get_transactions_page(
+        self, addresses: List[str], cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        start = 0 if cursor is None else max(cursor + 1, 0)
+        page: List[int] = []
+        for i in self._related_ids(addresses, start):
+            if limit is not None and len(page) == limit:
+                return TransactionPage(
+                    [self.data[j] for j in page], next_cursor=page[-1]
+                )
+            page.append(i)
+        return TransactionPage([self.data[j] for j in page])
+
     def get_all_transactions(self) -> List[Transaction]:
-        return [copy.copy(t.transaction) for t in self.data]
+        return list(self.data)
+
+    def get_transaction_statistics(self) -> TransactionStatistics:
+        return TransactionStatistics(
+            number_of_transactions=len(self.data), profit=self.profit
+        )
+
+    def get_transaction_buckets(
+        self, granularity: Granularity, start: int, end: int
+    ) -> List[TransactionBucket]:
+        return self.rollups.get(granularity, start, end)
+
+
+@dataclass
+class AsyncInMemoryTransactionRepository:
+    repository: InMemoryTransactionRepository
+
+    async def create_transaction(self, transaction: Transaction) -> None:
+        self.repository.create_transaction(transaction)
+
+    async def create_transactions(self, transactions: List[Transaction]) -> None:
+        self.repository.create_transactions(transactions)
+
+    async def get_all_user_transactions(self, user_api_key: str) -> List[Transaction]:
+        return self.repository.get_all_user_transactions(user_api_key)
+
+    async def get_all_wallet_transactions(
+        self, wallet_address: str
+    ) -> List[Transaction]:
+        return self.repository.get_all_wallet_transactions(wallet_address)
+
+    async def get_user_transactions_page(
+        self, user_api_key: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        return self.repository.get_user_transactions_page(user_api_key, cursor, limit)
+
+    async def get_wallet_transactions_page(
+        self, wallet_address: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        return self.repository.get_wallet_transactions_page(
+            wallet_address, cursor, limit
+        )
+
+    async def iter_user_transactions(
+        self, user_api_key: str
+    ) -> AsyncIterator[Transaction]:
+        for transaction in self.repository.iter_user_transactions(user_api_key):
+            yield transaction
+
+    async def iter_wallet_transactions(
+        self, wallet_address: str
+    ) -> AsyncIterator[Transaction]:
+        for transaction in self.repository.iter_wallet_transactions(wallet_address):
+            yield transaction
+
+    async def get_all_transactions(self) -> List[Transaction]:
+        return self.repository.get_all_transactions()
+
+    async def get_transaction_statistics(self) -> TransactionStatistics:
+        return self.repository.get_transaction_statistics()
+
+    async def get_transaction_buckets(
+        self, granularity: Granularity, start: int, end: int
+    ) -> List[TransactionBucket]:
+        return self.repository.get_transaction_buckets(granularity, start, end)
@@ -0,0 +1,33 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Iterator, Optional
+
+
+@dataclass
+class InMemoryUnitOfWork:
+    lock: threading.RLock = field(default_factory=threading.RLock)
+
+    @contextmanager
+    def atomic(self) -> Iterator[None]:
+        with self.lock:
+            yield
+
+
+@dataclass
+class AsyncInMemoryUnitOfWork:
+    # built on first use, on python 3.9 a lock binds to the loop current when
+    # it is built and this object is built before the server's loop runs
+    _lock: Optional[asyncio.Lock] = field(default=None, init=False, repr=False)
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    @asynccontextmanager
+    async def atomic(self) -> AsyncIterator[None]:
+        async with self.lock:
+            yield
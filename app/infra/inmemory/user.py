@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from app.core.user.entity import User
 
@@ -13,7 +13,24 @@ class InMemoryUserRepository:
         self.data[api_key] = user
         return user
 
+    def create_users(self, api_keys: List[str]) -> List[User]:
+        return [self.create_user(api_key) for api_key in api_keys]
+
     def get_user(self, user_api_key: str) -> Optional[User]:
         if user_api_key in self.data.keys():
             return self.data[user_api_key]
         return None
+
+
+@dataclass
+class AsyncInMemoryUserRepository:
+    repository: InMemoryUserRepository = field(default_factory=InMemoryUserRepository)
+
+    async def create_user(self, api_key: str) -> User:
+        return self.repository.create_user(api_key)
+
+    async def create_users(self, api_keys: List[str]) -> List[User]:
+        return self.repository.create_users(api_keys)
+
+    async def get_user(self, user_api_key: str) -> Optional[User]:
+        return self.repository.get_user(user_api_key)
@@ -1,30 +1,72 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from app.core.wallet.entity import Wallet
 
 
 @dataclass
 class InMemoryWalletRepository:
-    data: List[Wallet] = field(default_factory=list)
+    data: Dict[str, Wallet] = field(default_factory=dict)
+    # wallets of every owner in creation order
+    by_owner: Dict[str, List[Wallet]] = field(default_factory=dict)
 
     def create_wallet(
         self, user_api_key: str, wallet_address: str, initial_balance: int
     ) -> Wallet:
         wallet = Wallet(wallet_address, user_api_key, initial_balance)
-        self.data.append(wallet)
+        self.data[wallet_address] = wallet
+        self.by_owner.setdefault(user_api_key, []).append(wallet)
         return wallet
 
+    def create_wallets(self, wallets: List[Wallet]) -> None:
+        for wallet in wallets:
+            self.data[wallet.address] = wallet
+            self.by_owner.setdefault(wallet.owner_key, []).append(wallet)
+
     def get_wallet(self, wallet_address: str) -> Optional[Wallet]:
-        found_wallet = [w for w in self.data if w.address == wallet_address]
-        if len(found_wallet) == 0:
-            return None
-        return found_wallet[0]
+        return self.data.get(wallet_address)
 
     def get_user_wallets(self, user_api_key: str) -> List[Wallet]:
-        return [w for w in self.data if w.owner_key == user_api_key]
+        return list(self.by_owner.get(user_api_key, ()))
+
+    def get_wallets(self, wallet_addresses: List[str]) -> List[Wallet]:
+        return [self.data[a] for a in wallet_addresses if a in self.data]
 
     def update_balance(self, wallet_address: str, balance: int) -> None:
-        wallet = self.get_wallet(wallet_address)
-        assert wallet is not None
-        wallet.balance = balance
+        self.data[wallet_address].balance = balance
+
+    def apply_balance_changes(self, balance_changes: Dict[str, int]) -> None:
+        for wallet_address, amount in balance_changes.items():
+            self.data[wallet_address].balance += amount
+
+
+@dataclass
+class AsyncInMemoryWalletRepository:
+    repository: InMemoryWalletRepository = field(
+        default_factory=InMemoryWalletRepository
+    )
+
+    async def create_wallet(
+        self, user_api_key: str, wallet_address: str, initial_balance: int
+    ) -> Wallet:
+        return self.repository.create_wallet(
+            user_api_key, wallet_address, initial_balance
+        )
+
+    async def create_wallets(self, wallets: List[Wallet]) -> None:
+        self.repository.create_wallets(wallets)
+
+    async def get_wallet(self, wallet_address: str) -> Optional[Wallet]:
+        return self.repository.get_wallet(wallet_address)
+
+    async def get_user_wallets(self, user_api_key: str) -> List[Wallet]:
+        return self.repository.get_user_wallets(user_api_key)
+
+    async def get_wallets(self, wallet_addresses: List[str]) -> List[Wallet]:
+        return self.repository.get_wallets(wallet_addresses)
+
+    async def update_balance(self, wallet_address: str, balance: int) -> None:
+        self.repository.update_balance(wallet_address, balance)
+
+    async def apply_balance_changes(self, balance_changes: Dict[str, int]) -> None:
+        self.repository.apply_balance_changes(balance_changes)
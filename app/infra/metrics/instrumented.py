@@ -0,0 +1,80 @@
+import inspect
+import time
+from typing import Any, Callable, Optional, TypeVar, cast
+
+from app.infra.cache.user import UserCache
+from app.infra.metrics.registry import Histogram, Labels, Metrics
+
+T = TypeVar("T")
+
+
+class Instrumented:
+    # Times every public method of the wrapped object into histogram, labelled
+    # with labels and the method name. Methods are wrapped on first use and
+    # then found on the instance, later calls skip __getattr__. A method
+    # returning an iterator is timed until the iterator is returned, not
+    # until it is drained.
+    def __init__(self, target: Any, histogram: Histogram, labels: Labels) -> None:
+        self._target = target
+        self._histogram = histogram
+        self._labels = labels
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+        wrapped = self._wrap(attribute, self._labels + (name,))
+        setattr(self, name, wrapped)
+        return wrapped
+
+    def _wrap(self, method: Callable[..., Any], labels: Labels) -> Callable[..., Any]:
+        observe = self._histogram.observe
+
+        if inspect.iscoroutinefunction(method):
+
+            async def timed_coroutine(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    return await method(*args, **kwargs)
+                finally:
+                    observe(labels, time.perf_counter() - start)
+
+            return timed_coroutine
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                observe(labels, time.perf_counter() - start)
+
+        return timed
+
+
+def instrument(target: T, histogram: Histogram, *labels: str) -> T:
+    # the wrapper answers every method of target, so it can stand in for it
+    return cast(T, Instrumented(target, histogram, labels))
+
+
+def instrument_repository(
+    repository: T, metrics: Optional[Metrics], repository_name: str
+) -> T:
+    # the repository itself when metrics are off, calls pay for nothing
+    if metrics is None:
+        return repository
+    return instrument(repository, metrics.repository_calls, repository_name)
+
+
+def instrument_converter(converter: T, metrics: Optional[Metrics]) -> T:
+    if metrics is None:
+        return converter
+    return instrument(converter, metrics.converter_calls)
+
+
+def track_user_cache(cache: UserCache, metrics: Optional[Metrics]) -> None:
+    if metrics is None:
+        return
+    stats = cache.stats
+    metrics.user_cache_lookups.track(("hit",), lambda: stats.hits)
+    metrics.user_cache_lookups.track(("miss",), lambda: stats.misses)
+    metrics.user_cache_lookups.track(("negative_hit",), lambda: stats.negative_hits)
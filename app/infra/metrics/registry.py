@@ -0,0 +1,160 @@
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+
+# seconds, from a cached sqlite lookup up to a slow ticker call
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+Labels = Tuple[str, ...]
+
+
+def escape(label_value: str) -> str:
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(names: Labels, values: Labels) -> str:
+    return ",".join(f'{n}="{escape(v)}"' for n, v in zip(names, values))
+
+
+@dataclass
+class HistogramSeries:
+    # one count per bucket plus the overflow, not cumulative
+    counts: List[int]
+    total: float = 0.0
+
+
+@dataclass
+class Histogram:
+    name: str
+    description: str
+    label_names: Labels
+    buckets: Tuple[float, ...] = LATENCY_BUCKETS
+
+    _series: Dict[Labels, HistogramSeries] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def observe(self, labels: Labels, value: float) -> None:
+        # le is inclusive, a value equal to a bound lands in that bucket
+        bucket = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = HistogramSeries(
+                    [0] * (len(self.buckets) + 1)
+                )
+            series.counts[bucket] += 1
+            series.total += value
+
+    def snapshot(self) -> Dict[Labels, HistogramSeries]:
+        with self._lock:
+            return {
+                labels: HistogramSeries(list(series.counts), series.total)
+                for labels, series in self._series.items()
+            }
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, series in sorted(self.snapshot().items()):
+            prefix = format_labels(self.label_names, labels)
+            prefix = prefix + "," if prefix else ""
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{self.name}_bucket{{{prefix}le="{le}"}} {cumulative}')
+            suffix = f"{{{prefix[:-1]}}}" if prefix else ""
+            lines.append(f"{self.name}_sum{suffix} {series.total!r}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+@dataclass
+class Counter:
+    # counts kept by their owner, e.g. a cache's stats, read when rendered
+    name: str
+    description: str
+    label_names: Labels
+
+    _sources: Dict[Labels, Callable[[], float]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def track(self, labels: Labels, read: Callable[[], float]) -> None:
+        self._sources[labels] = read
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} counter",
+        ]
+        for labels, read in sorted(self._sources.items()):
+            prefix = format_labels(self.label_names, labels)
+            suffix = f"{{{prefix}}}" if prefix else ""
+            lines.append(f"{self.name}{suffix} {read()!r}")
+        return lines
+
+
+@dataclass
+class Metrics:
+    requests: Histogram = field(
+        default_factory=lambda: Histogram(
+            "http_request_duration_seconds",
+            "Time to answer an HTTP request, by route template and status code.",
+            ("method", "route", "status"),
+        )
+    )
+    repository_calls: Histogram = field(
+        default_factory=lambda: Histogram(
+            "repository_call_duration_seconds",
+            "Time spent in a repository method.",
+            ("repository", "method"),
+        )
+    )
+    converter_calls: Histogram = field(
+        default_factory=lambda: Histogram(
+            "currency_converter_call_duration_seconds",
+            "Time spent in a currency converter method.",
+            ("method",),
+        )
+    )
+
+    user_cache_lookups: Counter = field(
+        default_factory=lambda: Counter(
+            "user_cache_lookups_total",
+            "Api key lookups answered by the user cache, by result.",
+            ("result",),
+        )
+    )
+
+    def render(self) -> str:
+        # the prometheus text exposition format, version 0.0.4
+        lines: List[str] = []
+        for histogram in [self.requests, self.repository_calls, self.converter_calls]:
+            lines.extend(histogram.render())
+        lines.extend(self.user_cache_lookups.render())
+        return "\n".join(lines) + "\n"
@@ -6,6 +6,8 @@ from app.core.transaction.entity import Transaction
 
 @dataclass(eq=False)
 class IdTransaction:
+    __slots__ = ("id", "transaction")
+
     id: int
     transaction: Transaction
 
@@ -0,0 +1,123 @@
+import queue
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+
+from app.infra.sqlite.migrations import migrate
+
+MEMORY = ":memory:"
+
+
+@dataclass(frozen=True)
+class SqliteSettings:
+    pool_size: int = 8
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    mmap_size: int = 256 * 1024 * 1024
+
+
+def connect(filename: str, settings: SqliteSettings) -> sqlite3.Connection:
+    # connections move between threadpool workers, the pool makes sure that
+    # only one thread uses a connection at a time
+    conn = sqlite3.connect(filename, check_same_thread=False, uri=True)
+    conn.execute(f"PRAGMA busy_timeout = {int(settings.busy_timeout_ms)}")
+    conn.execute(f"PRAGMA journal_mode = {settings.journal_mode}")
+    conn.execute(f"PRAGMA synchronous = {settings.synchronous}")
+    conn.execute(f"PRAGMA mmap_size = {int(settings.mmap_size)}")
+    return conn
+
+
+class SqliteDatabase:
+    def __init__(
+        self,
+        filename: str,
+        schema_version: Optional[int] = None,
+        settings: SqliteSettings = SqliteSettings(),
+    ) -> None:
+        if filename == MEMORY:
+            # every connection to ":memory:" is a database of its own, a named
+            # shared-cache one lives as long as one of its connections is open.
+            # shared-cache locks are not retried by busy_timeout, so keep one.
+            filename = f"file:{uuid.uuid4().hex}?mode=memory&cache=shared"
+            settings = SqliteSettings(
+                pool_size=1,
+                journal_mode="MEMORY",
+                synchronous=settings.synchronous,
+                busy_timeout_ms=settings.busy_timeout_ms,
+                mmap_size=0,
+            )
+        self.filename = filename
+        self.settings = settings
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._opened: List[sqlite3.Connection] = []
+        self._open_lock = threading.Lock()
+        self._local = threading.local()
+
+        conn = self._open()
+        migrate(conn, schema_version)
+        self._idle.put(conn)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = connect(self.filename, self.settings)
+        self._opened.append(conn)
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._open_lock:
+            if len(self._opened) < self.settings.pool_size:
+                return self._open()
+        return self._idle.get()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is not None:
+            # nested use, e.g. inside atomic(), the outermost one commits
+            yield conn
+            return
+
+        conn = self._acquire()
+        self._local.conn = conn
+        self._local.undo = []
+        try:
+            yield conn
+            if conn.in_transaction:
+                conn.commit()
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            for undo in reversed(self._local.undo):
+                undo()
+            raise
+        finally:
+            self._local.conn = None
+            self._local.undo = []
+            self._idle.put(conn)
+
+    def on_rollback(self, undo: Callable[[], None]) -> None:
+        # for state kept outside the database, undo runs if the enclosing
+        # connection() block rolls back instead of committing
+        self._local.undo.append(undo)
+
+    @contextmanager
+    def atomic(self) -> Iterator[None]:
+        with self.connection() as conn:
+            if not conn.in_transaction:
+                # take the write lock up front, so that a read-check-write
+                # sequence cannot interleave with another writer
+                conn.execute("BEGIN IMMEDIATE")
+            yield
+
+    def close(self) -> None:
+        with self._open_lock:
+            for conn in self._opened:
+                conn.close()
+            self._opened.clear()
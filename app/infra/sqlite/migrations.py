@@ -0,0 +1,181 @@
+import sqlite3
+from typing import List, Optional, Tuple
+
+# Each entry upgrades the schema by one version; the position in the list
+# (starting from 1) is the version stored in PRAGMA user_version.
+# Never edit an entry that has shipped, append a new one instead.
+MIGRATIONS: List[Tuple[str, ...]] = [
+    # 1: schema as originally created by the repositories
+    (
+        """
+        create table if not exists Users (
+            api_key text primary key
+        )
+        """,
+        """
+        create table if not exists Wallet (
+            address text,
+            owner_key text,
+            balance integer not null
+        )
+        """,
+        """
+        create table if not exists Transaction_tbl (
+            transaction_id integer PRIMARY KEY AUTOINCREMENT,
+            source_wallet text,
+            destination_wallet text,
+            amount integer not null,
+            fee integer not null
+        )
+        """,
+    ),
+    # 2: key wallets by address and index every column used for lookups
+    (
+        """
+        create table Wallet_v2 (
+            address text primary key,
+            owner_key text not null,
+            balance integer not null
+        )
+        """,
+        """
+        insert into Wallet_v2
+            select address, owner_key, balance from Wallet order by rowid
+        """,
+        "drop table Wallet",
+        "alter table Wallet_v2 rename to Wallet",
+        "create index Wallet_owner_key on Wallet (owner_key)",
+        """
+        create index Transaction_tbl_source_wallet
+            on Transaction_tbl (source_wallet)
+        """,
+        """
+        create index Transaction_tbl_destination_wallet
+            on Transaction_tbl (destination_wallet)
+        """,
+    ),
+    # 3: running admin statistics, kept in step with Transaction_tbl by a trigger
+    (
+        """
+        create table Transaction_statistics (
+            id integer primary key check (id = 0),
+            number_of_transactions integer not null,
+            profit integer not null
+        )
+        """,
+        """
+        insert into Transaction_statistics
+            select 0, count(*), coalesce(sum(fee), 0) from Transaction_tbl
+        """,
+        """
+        create trigger Transaction_statistics_on_insert
+            after insert on Transaction_tbl
+        begin
+            update Transaction_statistics
+            set number_of_transactions = number_of_transactions + 1,
+                profit = profit + new.fee
+            where id = 0;
+        end
+        """,
+    ),
+    # 4: balance changes not yet applied to Wallet, by the since removed
+    # write-behind wallet repository
+    (
+        """
+        create table Balance_journal (
+            journal_id integer primary key,
+            address text not null,
+            amount integer not null
+        )
+        """,
+        "create index Balance_journal_address on Balance_journal (address)",
+    ),
+    # 5: transaction timestamps and per minute/hour/day rollups kept in step
+    # with Transaction_tbl by a trigger, rows from before have no time and are
+    # counted at the epoch
+    (
+        """
+        alter table Transaction_tbl
+            add column created_at integer not null default 0
+        """,
+        """
+        create table Transaction_rollup (
+            granularity integer not null,
+            bucket_start integer not null,
+            number_of_transactions integer not null,
+            volume integer not null,
+            profit integer not null,
+            primary key (granularity, bucket_start)
+        ) without rowid
+        """,
+        """
+        insert into Transaction_rollup
+            select g, created_at - created_at % g, count(*), sum(amount), sum(fee)
+            from Transaction_tbl,
+                (select 60 as g union all select 3600 union all select 86400)
+            group by 1, 2
+        """,
+        """
+        create trigger Transaction_rollup_on_insert
+            after insert on Transaction_tbl
+        begin
+            insert into Transaction_rollup values (
+                60, new.created_at - new.created_at % 60, 1, new.amount, new.fee
+            ) on conflict (granularity, bucket_start) do update
+            set number_of_transactions = number_of_transactions + 1,
+                volume = volume + excluded.volume,
+                profit = profit + excluded.profit;
+            insert into Transaction_rollup values (
+                3600, new.created_at - new.created_at % 3600, 1, new.amount, new.fee
+            ) on conflict (granularity, bucket_start) do update
+            set number_of_transactions = number_of_transactions + 1,
+                volume = volume + excluded.volume,
+                profit = profit + excluded.profit;
+            insert into Transaction_rollup values (
+                86400, new.created_at - new.created_at % 86400, 1, new.amount, new.fee
+            ) on conflict (granularity, bucket_start) do update
+            set number_of_transactions = number_of_transactions + 1,
+                volume = volume + excluded.volume,
+                profit = profit + excluded.profit;
+        end
+        """,
+    ),
+    # 6: fold the balance changes left by 4 into Wallet and drop the journal
+    (
+        """
+        update Wallet set balance = balance + (
+            select sum(amount) from Balance_journal j where j.address = Wallet.address
+        )
+        where address in (select address from Balance_journal)
+        """,
+        "drop table Balance_journal",
+    ),
+]
+
+LATEST_VERSION = len(MIGRATIONS)
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    version: int = conn.execute("PRAGMA user_version").fetchone()[0]
+    return version
+
+
+def migrate(conn: sqlite3.Connection, target_version: Optional[int] = None) -> None:
+    if target_version is None:
+        target_version = LATEST_VERSION
+    if schema_version(conn) >= target_version:
+        return
+
+    # take the write lock before re-reading the version, so that repositories
+    # opening the same file concurrently apply every migration exactly once
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        version = schema_version(conn)
+        for statements in MIGRATIONS[version:target_version]:
+            for statement in statements:
+                conn.execute(statement)
+        conn.execute(f"PRAGMA user_version = {max(version, target_version)}")
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
@@ -1,78 +1,165 @@
-import sqlite3
 from dataclasses import dataclass
-from typing import List, Set
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 
+from app.core.admin.interactor import (
+    Granularity,
+    TransactionBucket,
+    TransactionStatistics,
+    bucket_start,
+)
 from app.core.transaction.entity import Transaction
-from app.core.wallet.interactor import IWalletRepository
+from app.core.transaction.interactor import TransactionPage
 from app.infra.repository.id_transaction import IdTransaction
+from app.infra.sqlite.database import SqliteDatabase
+
+USER_WALLETS = "(SELECT address FROM Wallet WHERE owner_key = ?)"
+SINGLE_WALLET = "(?)"
+ITER_BATCH_SIZE = 1000
+# walks the primary key from the first bucket on, O(buckets in range)
+SELECT_BUCKETS = """
+    SELECT bucket_start, number_of_transactions, volume, profit
+    FROM Transaction_rollup
+    WHERE granularity = ? and bucket_start >= ? and bucket_start < ?
+    ORDER BY bucket_start
+"""
+
+
+def select_buckets(
+    granularity: Granularity, start: int, end: int
+) -> Tuple[str, Tuple[int, int, int]]:
+    return (
+        SELECT_BUCKETS,
+        (granularity.seconds, bucket_start(start, granularity), end),
+    )
+
+
+def select_transactions(
+    wallets: str, key: str, cursor: Optional[int], limit: Optional[int]
+) -> Tuple[str, Tuple[Any, ...]]:
+    after_id = 0 if cursor is None else cursor
+    # one row past the page tells whether there is a next one
+    limit = -1 if limit is None else limit + 1
+    # each branch walks its wallet index in transaction_id order and stops
+    # after limit rows, UNION drops transfers between own wallets
+    return (
+        f"""
+        SELECT * FROM (
+            SELECT * FROM Transaction_tbl
+            WHERE source_wallet IN {wallets} and transaction_id > ?
+            ORDER BY transaction_id LIMIT ?
+        )
+        UNION
+        SELECT * FROM (
+            SELECT * FROM Transaction_tbl
+            WHERE destination_wallet IN {wallets} and transaction_id > ?
+            ORDER BY transaction_id LIMIT ?
+        )
+        ORDER BY transaction_id LIMIT ?
+        """,
+        (key, after_id, limit, key, after_id, limit, limit),
+    )
+
+
+def to_transaction_page(rows: Iterable[Any], limit: Optional[int]) -> TransactionPage:
+    rows = list(rows)
+    if limit is None or len(rows) <= limit:
+        return TransactionPage([Transaction(*row[1:]) for row in rows])
+    return TransactionPage(
+        [Transaction(*row[1:]) for row in rows[:limit]], next_cursor=rows[limit - 1][0]
+    )
 
 
 @dataclass(init=False)
 class SqlTransactionRepository:
-    def __init__(self, filename: str, wallet_repository: IWalletRepository) -> None:
-        self.conn = sqlite3.connect(filename, check_same_thread=False)
-        self.wallet_repository = wallet_repository
-        self.conn.executescript(
-            """
-            create table if not exists Transaction_tbl (
-                transaction_id integer PRIMARY KEY AUTOINCREMENT,
-                source_wallet text,
-                destination_wallet text,
-                amount integer not null,
-                fee integer not null
-            );
-            """
-        )
-        self.conn.commit()
+    def __init__(self, database: SqliteDatabase) -> None:
+        self.database = database
 
     def create_transaction(self, transaction: Transaction) -> None:
-        self.conn.execute(
-            " INSERT INTO Transaction_tbl VALUES (?, ?, ?, ?, ?)",
-            (
-                None,
-                transaction.source,
-                transaction.destination,
-                transaction.amount,
-                transaction.fee,
-            ),
-        )
-        self.conn.commit()
+        with self.database.connection() as conn:
+            conn.execute(
+                " INSERT INTO Transaction_tbl VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    None,
+                    transaction.source,
+                    transaction.destination,
+                    transaction.amount,
+                    transaction.fee,
+                    transaction.created_at,
+                ),
+            )
+
+    def create_transactions(self, transactions: List[Transaction]) -> None:
+        with self.database.connection() as conn:
+            conn.executemany(
+                " INSERT INTO Transaction_tbl VALUES (NULL, ?, ?, ?, ?, ?)",
+                (
+                    (t.source, t.destination, t.amount, t.fee, t.created_at)
+                    for t in transactions
+                ),
+            )
 
     def get_all_user_transactions(self, user_api_key: str) -> List[Transaction]:
-        user_wallets = self.wallet_repository.get_user_wallets(user_api_key)
-        user_wallet_addresses = list(w.address for w in user_wallets)
-
-        idtransactions: Set[IdTransaction] = set()
-
-        for a in user_wallet_addresses:
-            idtransactions.update(self._get_all_wallet_idtransactions(a))
-
-        return [t.transaction for t in idtransactions]
-
-    def _get_all_wallet_idtransactions(
-        self, wallet_address: str
-    ) -> List[IdTransaction]:
-        idtransactions: List[IdTransaction] = list()
-        for row in self.conn.execute(
-            " SELECT * FROM Transaction_tbl WHERE source_wallet = ? or destination_wallet = ?",
-            (
-                wallet_address,
-                wallet_address,
-            ),
-        ):
-            idtransactions.append(IdTransaction.from_row(row))
-        return idtransactions
+        return self.get_user_transactions_page(user_api_key, None, None).transactions
 
     def get_all_wallet_transactions(self, wallet_address: str) -> List[Transaction]:
-        return [
-            t.transaction for t in self._get_all_wallet_idtransactions(wallet_address)
-        ]
+        return self.get_wallet_transactions_page(
+            wallet_address, None, None
+        ).transactions
+
+    def get_user_transactions_page(
+        self, user_api_key: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        return self._get_transactions_page(USER_WALLETS, user_api_key, cursor, limit)
+
+    def get_wallet_transactions_page(
+        self, wallet_address: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        return self._get_transactions_page(SINGLE_WALLET, wallet_address, cursor, limit)
+
+    def iter_user_transactions(self, user_api_key: str) -> Iterator[Transaction]:
+        return self._iter_transactions(USER_WALLETS, user_api_key)
+
+    def iter_wallet_transactions(self, wallet_address: str) -> Iterator[Transaction]:
+        return self._iter_transactions(SINGLE_WALLET, wallet_address)
+
+    def _iter_transactions(self, wallets: str, key: str) -> Iterator[Transaction]:
+        # an unbounded select makes sqlite sort the whole history before the
+        # first row, keyset batches keep both time to first row and memory flat
+        cursor = None
+        while True:
+            page = self._get_transactions_page(wallets, key, cursor, ITER_BATCH_SIZE)
+            yield from page.transactions
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def _get_transactions_page(
+        self, wallets: str, key: str, cursor: Optional[int], limit: Optional[int]
+    ) -> TransactionPage:
+        with self.database.connection() as conn:
+            rows = conn.execute(*select_transactions(wallets, key, cursor, limit))
+            return to_transaction_page(rows, limit)
 
     def get_all_transactions(self) -> List[Transaction]:
         idtransactions: List[Transaction] = list()
-        for row in self.conn.execute(
-            " SELECT * FROM Transaction_tbl",
-        ):
-            idtransactions.append(IdTransaction.from_row(row).transaction)
+        with self.database.connection() as conn:
+            for row in conn.execute(
+                " SELECT * FROM Transaction_tbl",
+            ):
+                idtransactions.append(IdTransaction.from_row(row).transaction)
 
         return idtransactions
+
+    def get_transaction_statistics(self) -> TransactionStatistics:
+        with self.database.connection() as conn:
+            number_of_transactions, profit = conn.execute(
+                " SELECT number_of_transactions, profit FROM Transaction_statistics"
+            ).fetchone()
+        return TransactionStatistics(number_of_transactions, profit)
+
+    def get_transaction_buckets(
+        self, granularity: Granularity, start: int, end: int
+    ) -> List[TransactionBucket]:
+        with self.database.connection() as conn:
+            rows = conn.execute(*select_buckets(granularity, start, end))
+            return [TransactionBucket(*row) for row in rows]
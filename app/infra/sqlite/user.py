@@ -1,32 +1,32 @@
-import sqlite3
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 from app.core.user.entity import User
+from app.infra.sqlite.database import SqliteDatabase
 
 
 @dataclass
 class SqlUserRepository:
-    def __init__(self, filename: str) -> None:
-        self.conn = sqlite3.connect(filename, check_same_thread=False)
-        self.conn.executescript(
-            """
-            create table if not exists Users (
-                api_key text primary key
-            );
-            """
-        )
-        self.conn.commit()
+    def __init__(self, database: SqliteDatabase) -> None:
+        self.database = database
 
     def create_user(self, api_key: str) -> User:
-        self.conn.execute(" INSERT INTO Users VALUES (?)", (api_key,))
-        self.conn.commit()
+        with self.database.connection() as conn:
+            conn.execute(" INSERT INTO Users VALUES (?)", (api_key,))
         return User(api_key)
 
+    def create_users(self, api_keys: List[str]) -> List[User]:
+        with self.database.connection() as conn:
+            conn.executemany(
+                " INSERT INTO Users VALUES (?)", ((api_key,) for api_key in api_keys)
+            )
+        return [User(api_key) for api_key in api_keys]
+
     def get_user(self, user_api_key: str) -> Optional[User]:
-        for row in self.conn.execute(
-            " SELECT * FROM Users WHERE api_key = ?", (user_api_key,)
-        ):
-            return User(*row)
+        with self.database.connection() as conn:
+            for row in conn.execute(
+                " SELECT * FROM Users WHERE api_key = ?", (user_api_key,)
+            ):
+                return User(*row)
 
         return None
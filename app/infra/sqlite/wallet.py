@@ -1,59 +1,82 @@
-import sqlite3
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from app.core.wallet.entity import Wallet
+from app.infra.sqlite.database import SqliteDatabase
 
 INITIAL_BALANCE = 1
+# stays well below sqlite's limit on the number of ? in one statement
+MAX_VARIABLES = 500
 
 
 @dataclass
 class SqlWalletRepository:
-    def __init__(self, filename: str) -> None:
-        self.conn = sqlite3.connect(filename, check_same_thread=False)
-        self.conn.executescript(
-            """
-            create table if not exists Wallet (
-                address text,
-                owner_key text,
-                balance integer not null
-            );
-            """
-        )
-        self.conn.commit()
+    def __init__(self, database: SqliteDatabase) -> None:
+        self.database = database
 
     def create_wallet(
         self, user_api_key: str, wallet_address: str, initial_balance: int
     ) -> Wallet:
-        self.conn.execute(
-            " INSERT INTO Wallet VALUES (?, ?, ?)",
-            (wallet_address, user_api_key, initial_balance),
-        )
-        self.conn.commit()
+        with self.database.connection() as conn:
+            conn.execute(
+                " INSERT INTO Wallet VALUES (?, ?, ?)",
+                (wallet_address, user_api_key, initial_balance),
+            )
         return Wallet(wallet_address, user_api_key, initial_balance)
 
+    def create_wallets(self, wallets: List[Wallet]) -> None:
+        with self.database.connection() as conn:
+            conn.executemany(
+                " INSERT INTO Wallet VALUES (?, ?, ?)",
+                ((w.address, w.owner_key, w.balance) for w in wallets),
+            )
+
     def get_wallet(self, wallet_address: str) -> Optional[Wallet]:
-        for row in self.conn.execute(
-            " SELECT * FROM Wallet WHERE address = ?", (wallet_address,)
-        ):
-            return Wallet(*row)
+        with self.database.connection() as conn:
+            for row in conn.execute(
+                " SELECT * FROM Wallet WHERE address = ?", (wallet_address,)
+            ):
+                return Wallet(*row)
         return None
 
     def get_user_wallets(self, user_api_key: str) -> List[Wallet]:
         wallets: List[Wallet] = list()
-        for row in self.conn.execute(
-            " SELECT * FROM Wallet WHERE owner_key = ?", (user_api_key,)
-        ):
-            wallets.append(Wallet(*row))
+        with self.database.connection() as conn:
+            for row in conn.execute(
+                " SELECT * FROM Wallet WHERE owner_key = ?", (user_api_key,)
+            ):
+                wallets.append(Wallet(*row))
+
+        return wallets
+
+    def get_wallets(self, wallet_addresses: List[str]) -> List[Wallet]:
+        wallets: List[Wallet] = list()
+        with self.database.connection() as conn:
+            for start in range(0, len(wallet_addresses), MAX_VARIABLES):
+                end = start + MAX_VARIABLES
+                chunk = wallet_addresses[start:end]
+                for row in conn.execute(
+                    " SELECT * FROM Wallet WHERE address IN"
+                    f" ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ):
+                    wallets.append(Wallet(*row))
 
         return wallets
 
     def update_balance(self, wallet_address: str, balance: int) -> None:
-        self.conn.execute(
-            "UPDATE Wallet SET balance = ? WHERE address = ?",
-            (
-                balance,
-                wallet_address,
-            ),
-        )
-        self.conn.commit()
+        with self.database.connection() as conn:
+            conn.execute(
+                "UPDATE Wallet SET balance = ? WHERE address = ?",
+                (
+                    balance,
+                    wallet_address,
+                ),
+            )
+
+    def apply_balance_changes(self, balance_changes: Dict[str, int]) -> None:
+        with self.database.connection() as conn:
+            conn.executemany(
+                "UPDATE Wallet SET balance = balance + ? WHERE address = ?",
+                ((amount, address) for address, amount in balance_changes.items()),
+            )
@@ -1,3 +1,19 @@
-from app.runner.server_setup import setup
+import os
 
-app = setup()
+from app.infra.metrics.registry import Metrics
+from app.runner.server_setup import setup, setup_async, setup_inmemory
+
+# WALLET_API_ASYNC=1 serves every route on the event loop through aiosqlite,
+# WALLET_API_COLUMNAR=1 keeps everything in memory, transactions in columns,
+# WALLET_API_FAST_SERIALIZATION=1 encodes transaction lists with orjson,
+# WALLET_API_METRICS=1 records latencies and serves them on /metrics
+fast_serialization = os.environ.get("WALLET_API_FAST_SERIALIZATION") == "1"
+metrics = Metrics() if os.environ.get("WALLET_API_METRICS") == "1" else None
+if os.environ.get("WALLET_API_ASYNC") == "1":
+    app = setup_async(fast_serialization, metrics)
+elif os.environ.get("WALLET_API_COLUMNAR") == "1":
+    app = setup_inmemory(
+        fast_serialization=fast_serialization, metrics=metrics, columnar=True
+    )
+else:
+    app = setup(fast_serialization=fast_serialization, metrics=metrics)
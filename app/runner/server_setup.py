@@ -1,13 +1,40 @@
-from typing import Protocol
+from typing import Optional, Protocol
 
 from fastapi import FastAPI
 
 from app.core.admin.interactor import IAdminRepository
+from app.core.async_facade import AsyncWalletService
+from app.core.currency_converter import (
+    AsyncBlockChainTickerCurrencyConverter,
+    BlockChainTickerCurrencyConverter,
+    ICurrencyConverter,
+)
 from app.core.facade import WalletService
 from app.core.transaction.interactor import ITransactionRepository
 from app.core.user.interactor import IUserRepository
 from app.core.wallet.interactor import IWalletRepository
-from app.infra.fastapi.api_main import setup_fastapi
+from app.infra.async_sqlite.database import AsyncSqliteDatabase
+from app.infra.async_sqlite.transaction import AsyncSqlTransactionRepository
+from app.infra.async_sqlite.user import AsyncSqlUserRepository
+from app.infra.async_sqlite.wallet import AsyncSqlWalletRepository
+from app.infra.cache.user import (
+    AsyncCachedUserRepository,
+    CachedUserRepository,
+    UserCache,
+)
+from app.infra.fastapi.api_main import setup_async_fastapi, setup_fastapi
+from app.infra.inmemory.columnar_transaction import ColumnarTransactionRepository
+from app.infra.inmemory.transaction import InMemoryTransactionRepository
+from app.infra.inmemory.unit_of_work import InMemoryUnitOfWork
+from app.infra.inmemory.user import InMemoryUserRepository
+from app.infra.inmemory.wallet import InMemoryWalletRepository
+from app.infra.metrics.instrumented import (
+    instrument_converter,
+    instrument_repository,
+    track_user_cache,
+)
+from app.infra.metrics.registry import Metrics
+from app.infra.sqlite.database import SqliteDatabase
 from app.infra.sqlite.transaction import SqlTransactionRepository
 from app.infra.sqlite.user import SqlUserRepository
 from app.infra.sqlite.wallet import SqlWalletRepository
@@ -20,31 +47,147 @@ class IAdminAndTransactionRepository(
     pass
 
 
-def setup_user_repository() -> IUserRepository:
-    return SqlUserRepository("db.db")
+def setup_user_repository(
+    database: SqliteDatabase, user_cache: UserCache, metrics: Optional[Metrics] = None
+) -> IUserRepository:
+    # every request checks its api key, the cache saves a query per request.
+    # Metrics time the queries behind the cache and count its hits and misses
+    track_user_cache(user_cache, metrics)
+    return CachedUserRepository(
+        instrument_repository(SqlUserRepository(database), metrics, "user"),
+        user_cache,
+    )
 
 
-def setup_wallet_repository() -> IWalletRepository:
-    return SqlWalletRepository("db.db")
+def setup_wallet_repository(database: SqliteDatabase) -> IWalletRepository:
+    return SqlWalletRepository(database)
 
 
 def setup_admin_and_transaction_repository(
-    wallet_repository: IWalletRepository,
+    database: SqliteDatabase,
 ) -> IAdminAndTransactionRepository:
-    return SqlTransactionRepository("db.db", wallet_repository)
+    return SqlTransactionRepository(database)
+
+
+def setup_currency_converter() -> BlockChainTickerCurrencyConverter:
+    currency_converter = BlockChainTickerCurrencyConverter()
+    currency_converter.start()
+    return currency_converter
 
 
-def setup() -> FastAPI:
-    user_repository = setup_user_repository()
-    wallet_repository = setup_wallet_repository()
-    transaction_and_admin_repository = setup_admin_and_transaction_repository(
-        wallet_repository
+def setup(
+    filename: str = "db.db",
+    currency_converter: Optional[ICurrencyConverter] = None,
+    fast_serialization: bool = False,
+    metrics: Optional[Metrics] = None,
+) -> FastAPI:
+    # the ticker is only started, and stopped on shutdown, when none is given
+    ticker: Optional[BlockChainTickerCurrencyConverter] = None
+    if currency_converter is None:
+        currency_converter = ticker = setup_currency_converter()
+    # one database shared by all repositories, so a transfer can span them
+    database = SqliteDatabase(filename)
+    # kept on app.state, its stats are the cache's hit rate
+    user_cache = UserCache()
+    user_repository = setup_user_repository(database, user_cache, metrics)
+    wallet_repository = setup_wallet_repository(database)
+    transaction_and_admin_repository = instrument_repository(
+        setup_admin_and_transaction_repository(database), metrics, "transaction"
     )
-    return setup_fastapi(
+    app = setup_fastapi(
         WalletService.create(
             user_repository=user_repository,
-            wallet_repository=wallet_repository,
+            wallet_repository=instrument_repository(
+                wallet_repository, metrics, "wallet"
+            ),
+            transaction_repository=transaction_and_admin_repository,
+            admin_repository=transaction_and_admin_repository,
+            currency_converter=instrument_converter(currency_converter, metrics),
+            unit_of_work=database,
+        ),
+        fast_serialization,
+        metrics,
+    )
+    app.state.user_cache = user_cache
+    if ticker is not None:
+        app.add_event_handler("shutdown", ticker.stop)
+    return app
+
+
+def setup_inmemory(
+    currency_converter: Optional[ICurrencyConverter] = None,
+    fast_serialization: bool = False,
+    metrics: Optional[Metrics] = None,
+    columnar: bool = False,
+) -> FastAPI:
+    ticker: Optional[BlockChainTickerCurrencyConverter] = None
+    if currency_converter is None:
+        currency_converter = ticker = setup_currency_converter()
+    # nothing is persisted, used by the benchmarks as the baseline backend
+    wallet_repository = InMemoryWalletRepository()
+    # the columnar store holds a long history in a fraction of the memory
+    transaction_repository: IAdminAndTransactionRepository = (
+        ColumnarTransactionRepository(wallet_repository)
+        if columnar
+        else InMemoryTransactionRepository(wallet_repository)
+    )
+    transaction_and_admin_repository = instrument_repository(
+        transaction_repository, metrics, "transaction"
+    )
+    app = setup_fastapi(
+        WalletService.create(
+            user_repository=instrument_repository(
+                InMemoryUserRepository(), metrics, "user"
+            ),
+            wallet_repository=instrument_repository(
+                wallet_repository, metrics, "wallet"
+            ),
+            transaction_repository=transaction_and_admin_repository,
+            admin_repository=transaction_and_admin_repository,
+            currency_converter=instrument_converter(currency_converter, metrics),
+            unit_of_work=InMemoryUnitOfWork(),
+        ),
+        fast_serialization,
+        metrics,
+    )
+    if ticker is not None:
+        app.add_event_handler("shutdown", ticker.stop)
+    return app
+
+
+def setup_async(
+    fast_serialization: bool = False, metrics: Optional[Metrics] = None
+) -> FastAPI:
+    ticker = setup_currency_converter()
+    user_cache = UserCache()
+    track_user_cache(user_cache, metrics)
+    database = AsyncSqliteDatabase("db.db")
+    transaction_and_admin_repository = instrument_repository(
+        AsyncSqlTransactionRepository(database), metrics, "transaction"
+    )
+    app = setup_async_fastapi(
+        AsyncWalletService.create(
+            user_repository=AsyncCachedUserRepository(
+                instrument_repository(
+                    AsyncSqlUserRepository(database), metrics, "user"
+                ),
+                user_cache,
+            ),
+            wallet_repository=instrument_repository(
+                AsyncSqlWalletRepository(database), metrics, "wallet"
+            ),
             transaction_repository=transaction_and_admin_repository,
             admin_repository=transaction_and_admin_repository,
-        )
+            currency_converter=instrument_converter(
+                AsyncBlockChainTickerCurrencyConverter(ticker),
+                metrics,
+            ),
+            unit_of_work=database,
+        ),
+        fast_serialization,
+        metrics,
     )
+    app.state.user_cache = user_cache
+    app.add_event_handler("shutdown", database.close)
+    app.add_event_handler("shutdown", ticker.stop)
+    return app
@@ -0,0 +1,106 @@
+"""Users provisioned per second, one request at a time and in one batch.
+
+python -m benchmarks.bulk_provisioning --users 100000 --wallets 3
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from result import Ok, Result
+
+from app.core.admin.interactor import ADMIN_KEY
+from app.core.currency_converter import ConversionError, FiatAmounts, FiatCurrency
+from app.core.facade import WalletService
+from app.core.provisioning.interactor import ProvisionUsersRequest
+from app.core.wallet.interactor import CreateWalletRequest
+from app.infra.sqlite.database import SqliteDatabase
+from app.infra.sqlite.transaction import SqlTransactionRepository
+from app.infra.sqlite.user import SqlUserRepository
+from app.infra.sqlite.wallet import SqlWalletRepository
+
+
+class CountingCurrencyConverter:
+    # a fixed rate, so that only the lookups are counted and not their latency
+    lookups: int = 0
+
+    def convert_btc_to_fiat(
+        self, satoshis: int, currency: FiatCurrency
+    ) -> Result[float, ConversionError]:
+        self.lookups += 1
+        return Ok(satoshis / 5000)
+
+    def convert_many(
+        self, satoshis: List[int], currencies: List[FiatCurrency]
+    ) -> Result[List[FiatAmounts], ConversionError]:
+        self.lookups += 1
+        return Ok([{c: amount / 5000 for c in currencies} for amount in satoshis])
+
+
+def setup(filename: str, converter: CountingCurrencyConverter) -> WalletService:
+    database = SqliteDatabase(filename)
+    transaction_repository = SqlTransactionRepository(database)
+    return WalletService.create(
+        user_repository=SqlUserRepository(database),
+        wallet_repository=SqlWalletRepository(database),
+        transaction_repository=transaction_repository,
+        admin_repository=transaction_repository,
+        currency_converter=converter,
+        unit_of_work=database,
+    )
+
+
+def one_by_one(core: WalletService, users: int, wallets: int) -> float:
+    start = time.perf_counter()
+    for _ in range(users):
+        api_key = core.create_user().user.api_key
+        for _ in range(wallets):
+            core.create_wallet(CreateWalletRequest(api_key))
+    return time.perf_counter() - start
+
+
+def batched(core: WalletService, users: int, wallets: int) -> float:
+    start = time.perf_counter()
+    response = core.provision_users(ProvisionUsersRequest(ADMIN_KEY, users, wallets))
+    assert isinstance(response, Ok)
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--wallets", type=int, default=3)
+    # the one by one path is slow, its rate is measured on fewer users
+    parser.add_argument("--sample", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        sample = min(args.sample, args.users)
+        single_converter = CountingCurrencyConverter()
+        single = one_by_one(
+            setup(str(Path(directory) / "single.db"), single_converter),
+            sample,
+            args.wallets,
+        )
+        batch_converter = CountingCurrencyConverter()
+        batch = batched(
+            setup(str(Path(directory) / "batch.db"), batch_converter),
+            args.users,
+            args.wallets,
+        )
+
+    print(f"{'':>12} {'users':>8} {'seconds':>8} {'users/s':>9} {'lookups':>8}")
+    print(
+        f"{'one by one':>12} {sample:>8} {single:>8.2f} {sample / single:>9.0f}"
+        f" {single_converter.lookups:>8}"
+    )
+    print(
+        f"{'batch':>12} {args.users:>8} {batch:>8.2f} {args.users / batch:>9.0f}"
+        f" {batch_converter.lookups:>8}"
+    )
+
+
+if __name__ == "__main__":
+    main()
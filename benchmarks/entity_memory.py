@@ -0,0 +1,89 @@
+"""Bytes per transaction held by a history of --rows transactions.
+
+python -m benchmarks.entity_memory --rows 1000000 --wallets 10000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, List, Optional, Tuple
+
+from app.core.transaction.entity import Transaction
+from app.core.transaction.interactor import ITransactionRepository
+from app.core.wallet.interactor import IWalletRepository
+from app.infra.inmemory.columnar_transaction import ColumnarTransactionRepository
+from app.infra.inmemory.transaction import InMemoryTransactionRepository
+from app.infra.inmemory.wallet import InMemoryWalletRepository
+from app.infra.sqlite.database import SqliteDatabase
+from app.infra.sqlite.transaction import SqlTransactionRepository
+
+WALLET = "wallet"
+
+
+def allocated(build: Callable[[], object]) -> Tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size, peak
+
+
+def store(
+    create: Callable[[IWalletRepository], ITransactionRepository],
+    rows: int,
+    wallets: int,
+) -> Tuple[int, int]:
+    # everything the repository keeps per transaction, index included
+    def build() -> object:
+        repository = create(InMemoryWalletRepository())
+        for i in range(rows):
+            repository.create_transaction(
+                Transaction(WALLET, f"other-{i % wallets}", i, 0, i)
+            )
+        return repository
+
+    return allocated(build)
+
+
+def inmemory_store(rows: int, wallets: int) -> Tuple[int, int]:
+    return store(InMemoryTransactionRepository, rows, wallets)
+
+
+def columnar_store(rows: int, wallets: int) -> Tuple[int, int]:
+    return store(ColumnarTransactionRepository, rows, wallets)
+
+
+def sqlite_load(rows: int, wallets: int) -> Tuple[int, int]:
+    # what a single history query materialises
+    database = SqliteDatabase(":memory:")
+    with database.connection() as conn:
+        conn.executemany(
+            "INSERT INTO Transaction_tbl VALUES (NULL, ?, ?, ?, 0, ?)",
+            ((WALLET, f"other-{i % wallets}", i, i) for i in range(rows)),
+        )
+    repository = SqlTransactionRepository(database)
+
+    return allocated(lambda: repository.get_all_wallet_transactions(WALLET))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    # every transaction goes from one wallet to one of this many others
+    parser.add_argument("--wallets", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    print(f"{'bytes/transaction':<34} {'kept':>8} {'peak':>8}")
+    for name, measure in [
+        ("in-memory create_transaction", inmemory_store),
+        ("columnar create_transaction", columnar_store),
+        ("sqlite get_all_wallet_transactions", sqlite_load),
+    ]:
+        size, peak = measure(args.rows, args.wallets)
+        print(f"{name:<34} {size / args.rows:>8.1f} {peak / args.rows:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""Throughput and latency of the HTTP API under a mix of requests.
+
+python -m benchmarks.http_load --backends inmemory sqlite --requests 5000
+python -m benchmarks.http_load --output after.json --baseline before.json
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from result import Ok, Result
+
+from app.core.admin.interactor import ADMIN_KEY
+from app.core.currency_converter import ConversionError, FiatAmounts, FiatCurrency
+from app.core.wallet.interactor import MAX_WALLETS_PER_PERSON
+from app.infra.metrics.registry import Metrics
+from app.runner.server_setup import setup, setup_inmemory
+
+# requests per hundred, reads dominate like on a real wallet service
+MIX = {
+    "POST /users": 5,
+    "POST /wallets": 10,
+    "POST /transactions": 35,
+    "GET /transactions": 40,
+    "GET /statistics": 10,
+}
+TRANSFER_AMOUNT = 1000
+
+
+class StubCurrencyConverter:
+    # a fixed rate, the ticker's latency is not what is measured
+    def convert_btc_to_fiat(
+        self, satoshis: int, currency: FiatCurrency
+    ) -> Result[float, ConversionError]:
+        return Ok(satoshis / 5000)
+
+    def convert_many(
+        self, satoshis: List[int], currencies: List[FiatCurrency]
+    ) -> Result[List[FiatAmounts], ConversionError]:
+        return Ok([{c: amount / 5000 for c in currencies} for amount in satoshis])
+
+
+def setup_backend(backend: str, directory: str, metrics: bool) -> FastAPI:
+    converter = StubCurrencyConverter()
+    if backend in ("inmemory", "columnar"):
+        return setup_inmemory(
+            currency_converter=converter,
+            metrics=Metrics() if metrics else None,
+            columnar=backend == "columnar",
+        )
+    return setup(
+        filename=str(Path(directory) / f"{backend}.db"),
+        currency_converter=converter,
+        metrics=Metrics() if metrics else None,
+    )
+
+
+@dataclass
+class Population:
+    # users and their wallets, shared by every client
+    api_keys: List[str] = field(default_factory=list)
+    wallets: Dict[str, List[str]] = field(default_factory=dict)
+    addresses: List[str] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add_user(self, api_key: str) -> None:
+        with self.lock:
+            self.api_keys.append(api_key)
+            self.wallets[api_key] = []
+
+    def add_wallet(self, api_key: str, address: str) -> None:
+        with self.lock:
+            self.wallets[api_key].append(address)
+            self.addresses.append(address)
+
+    def user_with_room(self) -> Optional[str]:
+        with self.lock:
+            for api_key in reversed(self.api_keys):
+                if len(self.wallets[api_key]) < MAX_WALLETS_PER_PERSON:
+                    return api_key
+        return None
+
+
+Operation = Callable[[TestClient, Population, random.Random], int]
+
+
+def create_user(client: TestClient, population: Population, _: random.Random) -> int:
+    response = client.post("/users")
+    if response.status_code == 200:
+        population.add_user(response.json()["api_key"])
+    return response.status_code
+
+
+def create_wallet(client: TestClient, population: Population, _: random.Random) -> int:
+    api_key = population.user_with_room()
+    if api_key is None:
+        # every user is full, the limit is what gets measured then
+        api_key = population.api_keys[-1]
+    response = client.post("/wallets", params={"api_key": api_key})
+    if response.status_code == 200:
+        population.add_wallet(api_key, response.json()["wallet_address"])
+    return response.status_code
+
+
+def make_transaction(
+    client: TestClient, population: Population, rng: random.Random
+) -> int:
+    api_key = rng.choice(population.api_keys)
+    while not population.wallets[api_key]:
+        api_key = rng.choice(population.api_keys)
+    response = client.post(
+        "/transactions",
+        params={
+            "api_key": api_key,
+            "source": rng.choice(population.wallets[api_key]),
+            "destination": rng.choice(population.addresses),
+            "amount": TRANSFER_AMOUNT,
+        },
+    )
+    return response.status_code
+
+
+def get_transactions(
+    client: TestClient, population: Population, rng: random.Random
+) -> int:
+    api_key = rng.choice(population.api_keys)
+    return client.get("/transactions", params={"api_key": api_key}).status_code
+
+
+def get_wallets(client: TestClient, population: Population, rng: random.Random) -> int:
+    api_key = rng.choice(population.api_keys)
+    return client.get("/wallets", params={"api_key": api_key}).status_code
+
+
+def get_statistics(client: TestClient, _: Population, __: random.Random) -> int:
+    return client.get("/statistics", params={"admin_key": ADMIN_KEY}).status_code
+
+
+OPERATIONS: Dict[str, Operation] = {
+    "POST /users": create_user,
+    "POST /wallets": create_wallet,
+    "POST /transactions": make_transaction,
+    "GET /transactions": get_transactions,
+    # not in MIX, so that earlier runs stay comparable: --mix "GET /wallets=10"
+    "GET /wallets": get_wallets,
+    "GET /statistics": get_statistics,
+}
+
+
+def seed(client: TestClient, population: Population, users: int) -> None:
+    rng = random.Random(0)
+    for _ in range(users):
+        create_user(client, population, rng)
+        for _ in range(MAX_WALLETS_PER_PERSON):
+            create_wallet(client, population, rng)
+
+
+def percentile(latencies: List[float], p: float) -> float:
+    # nearest rank, latencies are sorted
+    return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))]
+
+
+@dataclass
+class EndpointResult:
+    requests: int
+    errors: int
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+@dataclass
+class BackendResult:
+    requests: int
+    seconds: float
+    throughput: float
+    endpoints: Dict[str, EndpointResult]
+
+
+def summarize(
+    samples: Dict[str, List[Tuple[float, int]]], seconds: float
+) -> BackendResult:
+    endpoints = {}
+    for name, endpoint_samples in sorted(samples.items()):
+        latencies = sorted(latency * 1000 for latency, _ in endpoint_samples)
+        endpoints[name] = EndpointResult(
+            requests=len(latencies),
+            errors=sum(1 for _, status in endpoint_samples if status >= 400),
+            p50_ms=percentile(latencies, 50),
+            p90_ms=percentile(latencies, 90),
+            p99_ms=percentile(latencies, 99),
+            max_ms=latencies[-1],
+        )
+    requests = sum(e.requests for e in endpoints.values())
+    return BackendResult(requests, seconds, requests / seconds, endpoints)
+
+
+def run(
+    app: FastAPI, requests: int, clients: int, users: int, mix: Dict[str, int]
+) -> BackendResult:
+    population = Population()
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    samples: Dict[str, List[Tuple[float, int]]] = defaultdict(list)
+    lock = threading.Lock()
+
+    def worker(client: TestClient, w: int) -> None:
+        rng = random.Random(w)
+        own: Dict[str, List[Tuple[float, int]]] = defaultdict(list)
+        for name in rng.choices(names, weights, k=requests // clients):
+            start = time.perf_counter()
+            status = OPERATIONS[name](client, population, rng)
+            own[name].append((time.perf_counter() - start, status))
+        with lock:
+            for name, endpoint_samples in own.items():
+                samples[name].extend(endpoint_samples)
+
+    # entering the client runs startup and shutdown once and keeps one event
+    # loop, the clients share it like connections to one server process
+    with TestClient(app) as client:
+        seed(client, population, users)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(clients) as pool:
+            list(pool.map(lambda w: worker(client, w), range(clients)))
+        seconds = time.perf_counter() - start
+    return summarize(samples, seconds)
+
+
+def print_result(backend: str, result: BackendResult) -> None:
+    print(f"{backend}: {result.requests} requests, {result.throughput:.0f} req/s")
+    print(
+        f"  {'endpoint':<20} {'requests':>8} {'errors':>7}"
+        f" {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    for name, e in result.endpoints.items():
+        print(
+            f"  {name:<20} {e.requests:>8} {e.errors:>7} {e.p50_ms:>8.2f}"
+            f" {e.p90_ms:>8.2f} {e.p99_ms:>8.2f} {e.max_ms:>8.2f}"
+        )
+
+
+def compare(results: Dict[str, BackendResult], baseline_path: str) -> None:
+    baseline = json.loads(Path(baseline_path).read_text())["results"]
+    print(f"against {baseline_path}:")
+    for backend, result in results.items():
+        if backend not in baseline:
+            continue
+        before = baseline[backend]
+        print(
+            f"  {backend}: throughput x{result.throughput / before['throughput']:.2f}"
+        )
+        for name, e in result.endpoints.items():
+            if name in before["endpoints"]:
+                p99 = before["endpoints"][name]["p99_ms"]
+                print(f"    {name:<20} p99 x{e.p99_ms / p99:.2f}")
+
+
+def parse_mix(pairs: List[str]) -> Dict[str, int]:
+    mix = dict(MIX)
+    for pair in pairs:
+        name, weight = pair.rsplit("=", 1)
+        if name not in OPERATIONS:
+            raise SystemExit(f"unknown endpoint {name!r}, one of {list(OPERATIONS)}")
+        mix[name] = int(weight)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=["inmemory", "sqlite"],
+        choices=["inmemory", "columnar", "sqlite"],
+    )
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=1)
+    parser.add_argument("--users", type=int, default=100)
+    # e.g. --mix "GET /statistics=0" "POST /transactions=60"
+    parser.add_argument("--mix", nargs="*", default=[])
+    # records every request and repository call, to see what that costs
+    parser.add_argument("--metrics", action="store_true")
+    parser.add_argument("--output", help="write the results as json")
+    parser.add_argument("--baseline", help="json of an earlier run to compare with")
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for backend in args.backends:
+            app = setup_backend(backend, directory, args.metrics)
+            results[backend] = run(app, args.requests, args.clients, args.users, mix)
+            print_result(backend, results[backend])
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(
+                {
+                    "settings": {
+                        "requests": args.requests,
+                        "clients": args.clients,
+                        "users": args.users,
+                        "mix": mix,
+                        "metrics": args.metrics,
+                    },
+                    "results": {b: asdict(r) for b, r in results.items()},
+                },
+                indent=2,
+            )
+        )
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Lookup latency of the in-memory wallet repository, list scan vs dict index.
+
+python -m benchmarks.inmemory_wallets --sizes 1000 100000 1000000
+"""
+
+import argparse
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from app.core.wallet.entity import Wallet
+from app.core.wallet.interactor import IWalletRepository
+from app.infra.inmemory.wallet import InMemoryWalletRepository
+
+WALLETS_PER_USER = 3
+
+
+@dataclass
+class ListWalletRepository:
+    # the repository before it was indexed, kept here as the baseline
+    data: List[Wallet] = field(default_factory=list)
+
+    def create_wallet(
+        self, user_api_key: str, wallet_address: str, initial_balance: int
+    ) -> Wallet:
+        wallet = Wallet(wallet_address, user_api_key, initial_balance)
+        self.data.append(wallet)
+        return wallet
+
+    def create_wallets(self, wallets: List[Wallet]) -> None:
+        self.data.extend(wallets)
+
+    def get_wallet(self, wallet_address: str) -> Optional[Wallet]:
+        found_wallet = [w for w in self.data if w.address == wallet_address]
+        if len(found_wallet) == 0:
+            return None
+        return found_wallet[0]
+
+    def get_user_wallets(self, user_api_key: str) -> List[Wallet]:
+        return [w for w in self.data if w.owner_key == user_api_key]
+
+    def get_wallets(self, wallet_addresses: List[str]) -> List[Wallet]:
+        return [w for w in self.data if w.address in wallet_addresses]
+
+    def update_balance(self, wallet_address: str, balance: int) -> None:
+        wallet = self.get_wallet(wallet_address)
+        assert wallet is not None
+        wallet.balance = balance
+
+    def apply_balance_changes(self, balance_changes: Dict[str, int]) -> None:
+        for wallet_address, amount in balance_changes.items():
+            wallet = self.get_wallet(wallet_address)
+            assert wallet is not None
+            wallet.balance += amount
+
+
+def populate(repository: IWalletRepository, rows: int) -> None:
+    for i in range(rows):
+        repository.create_wallet(f"user-{i // WALLETS_PER_USER}", f"wallet-{i}", 1000)
+
+
+def measure(lookup: Callable[[int], object], rows: int, lookups: int) -> float:
+    keys = [random.randrange(rows) for _ in range(lookups)]
+    start = time.perf_counter()
+    for key in keys:
+        lookup(key)
+    return (time.perf_counter() - start) / lookups * 1e6
+
+
+def benchmark(
+    repository: IWalletRepository, rows: int, lookups: int
+) -> Dict[str, float]:
+    populate(repository, rows)
+    return {
+        "get_wallet": measure(
+            lambda i: repository.get_wallet(f"wallet-{i}"), rows, lookups
+        ),
+        "get_user_wallets": measure(
+            lambda i: repository.get_user_wallets(f"user-{i // WALLETS_PER_USER}"),
+            rows,
+            lookups,
+        ),
+        "update_balance": measure(
+            lambda i: repository.update_balance(f"wallet-{i}", i), rows, lookups
+        ),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--lookups", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    random.seed(0)
+    print(f"{'rows':>10} {'lookup':<20} {'list (us)':>12} {'dict (us)':>12} {'x':>10}")
+    for rows in args.sizes:
+        before = benchmark(ListWalletRepository(), rows, args.lookups)
+        after = benchmark(InMemoryWalletRepository(), rows, args.lookups)
+        for name in before:
+            print(
+                f"{rows:>10} {name:<20} {before[name]:>12.2f} {after[name]:>12.2f}"
+                f" {before[name] / after[name]:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""CPU time to serialize one GET /transactions response of --rows transactions.
+
+python -m benchmarks.response_serialization --rows 10000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Callable, List, Optional
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from app.core.transaction.entity import Transaction
+from app.core.transaction.interactor import GetTransactionsResponse
+from app.infra.fastapi.serialization import transactions_response
+from app.infra.fastapi.transaction import transaction_api
+
+
+def history(rows: int) -> GetTransactionsResponse:
+    return GetTransactionsResponse(
+        [
+            Transaction(f"wallet-{i % 100}", f"wallet-{i % 97}", i, i // 100, i)
+            for i in range(rows)
+        ],
+        next_cursor=rows,
+    )
+
+
+ROUTE = next(
+    r
+    for r in transaction_api.routes
+    if isinstance(r, APIRoute) and r.path == "/transactions" and "GET" in r.methods
+)
+
+
+def response_model_body(response: GetTransactionsResponse) -> bytes:
+    # what fastapi does with a returned dataclass: validate it against the
+    # response_model, encode the copy with jsonable_encoder, then json.dumps
+    content = asyncio.run(
+        serialize_response(
+            field=ROUTE.secure_cloned_response_field, response_content=response
+        )
+    )
+    return JSONResponse(content).body
+
+
+def fast_body(response: GetTransactionsResponse) -> bytes:
+    return transactions_response(response).body
+
+
+def cpu_ms(
+    serialize: Callable[[GetTransactionsResponse], bytes], rows: int, repeat: int
+) -> float:
+    response = history(rows)
+    serialize(response)
+    start = time.process_time()
+    for _ in range(repeat):
+        serialize(response)
+    return (time.process_time() - start) / repeat * 1000
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    # both paths must send the same json
+    sample = history(100)
+    assert json.loads(response_model_body(sample)) == json.loads(fast_body(sample))
+
+    default = cpu_ms(response_model_body, args.rows, args.repeat)
+    fast = cpu_ms(fast_body, args.rows, args.repeat)
+    print(f"cpu ms per {args.rows}-row response")
+    print(f"  response_model      {default:>8.2f}")
+    print(f"  fast serialization  {fast:>8.2f}  x{default / fast:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Lookup latency of the sqlite repositories before and after schema version 2.
+
+python -m benchmarks.sqlite_indexes --sizes 10000 100000 1000000
+"""
+
+import argparse
+import random
+import sqlite3
+import time
+from typing import Callable, Dict, List, Optional
+
+from app.infra.sqlite.database import SqliteDatabase
+from app.infra.sqlite.migrations import LATEST_VERSION
+from app.infra.sqlite.transaction import SqlTransactionRepository
+from app.infra.sqlite.wallet import SqlWalletRepository
+
+WALLETS_PER_USER = 3
+
+
+def populate(conn: sqlite3.Connection, rows: int) -> None:
+    if "created_at" not in [
+        c[1] for c in conn.execute("PRAGMA table_info(Transaction_tbl)")
+    ]:
+        # the repositories read the timestamp column of version 5, adding it
+        # alone keeps version 1 without any of the indexes
+        conn.execute(
+            "ALTER TABLE Transaction_tbl ADD COLUMN created_at integer not null default 0"
+        )
+    conn.executemany(
+        "INSERT INTO Wallet VALUES (?, ?, ?)",
+        ((f"wallet-{i}", f"user-{i // WALLETS_PER_USER}", 1000) for i in range(rows)),
+    )
+    conn.executemany(
+        "INSERT INTO Transaction_tbl VALUES (NULL, ?, ?, 1, 0, 0)",
+        (
+            (f"wallet-{random.randrange(rows)}", f"wallet-{random.randrange(rows)}")
+            for _ in range(rows)
+        ),
+    )
+    conn.commit()
+
+
+def measure(lookup: Callable[[int], object], rows: int, lookups: int) -> float:
+    keys = [random.randrange(rows) for _ in range(lookups)]
+    start = time.perf_counter()
+    for key in keys:
+        lookup(key)
+    return (time.perf_counter() - start) / lookups * 1e6
+
+
+def benchmark(rows: int, schema_version: int, lookups: int) -> Dict[str, float]:
+    database = SqliteDatabase(":memory:", schema_version)
+    with database.connection() as conn:
+        populate(conn, rows)
+
+    wallet_repository = SqlWalletRepository(database)
+    transaction_repository = SqlTransactionRepository(database)
+
+    return {
+        "get_wallet": measure(
+            lambda i: wallet_repository.get_wallet(f"wallet-{i}"), rows, lookups
+        ),
+        "get_user_wallets": measure(
+            lambda i: wallet_repository.get_user_wallets(
+                f"user-{i // WALLETS_PER_USER}"
+            ),
+            rows,
+            lookups,
+        ),
+        "get_all_wallet_transactions": measure(
+            lambda i: transaction_repository.get_all_wallet_transactions(f"wallet-{i}"),
+            rows,
+            lookups,
+        ),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--lookups", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    random.seed(0)
+    print(f"{'rows':>10} {'lookup':<28} {'v1 (us)':>12} {'v2 (us)':>12} {'x':>8}")
+    for rows in args.sizes:
+        before = benchmark(rows, 1, args.lookups)
+        after = benchmark(rows, LATEST_VERSION, args.lookups)
+        for name in before:
+            print(
+                f"{rows:>10} {name:<28} {before[name]:>12.1f} {after[name]:>12.1f}"
+                f" {before[name] / after[name]:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
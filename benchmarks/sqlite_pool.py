@@ -0,0 +1,110 @@
+"""Throughput of the shared sqlite database with growing numbers of workers.
+
+python -m benchmarks.sqlite_pool --workers 1 2 4 8 --seconds 3
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+from app.core.transaction.fee_calculator import FeeCalculator
+from app.core.transaction.interactor import (
+    GetTransactionsRequest,
+    MakeTransactionRequest,
+    TransactionInteractor,
+)
+from app.infra.sqlite.database import SqliteDatabase, SqliteSettings
+from app.infra.sqlite.transaction import SqlTransactionRepository
+from app.infra.sqlite.user import SqlUserRepository
+from app.infra.sqlite.wallet import SqlWalletRepository
+
+USERS = 100
+WALLETS_PER_USER = 3
+HISTORY = 100_000
+
+
+def setup(filename: str, pool_size: int) -> TransactionInteractor:
+    database = SqliteDatabase(filename, settings=SqliteSettings(pool_size=pool_size))
+    with database.connection() as conn:
+        conn.executemany(
+            "INSERT INTO Users VALUES (?)", ((f"user-{u}",) for u in range(USERS))
+        )
+        conn.executemany(
+            "INSERT INTO Wallet VALUES (?, ?, ?)",
+            (
+                (f"wallet-{i}", f"user-{i // WALLETS_PER_USER}", 10**12)
+                for i in range(USERS * WALLETS_PER_USER)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO Transaction_tbl VALUES (NULL, ?, ?, 1, 0, 0)",
+            (
+                (
+                    f"wallet-{random.randrange(USERS * WALLETS_PER_USER)}",
+                    f"wallet-{random.randrange(USERS * WALLETS_PER_USER)}",
+                )
+                for _ in range(HISTORY)
+            ),
+        )
+    return TransactionInteractor(
+        SqlTransactionRepository(database),
+        SqlUserRepository(database),
+        SqlWalletRepository(database),
+        FeeCalculator(),
+        database,
+    )
+
+
+def run(
+    interactor: TransactionInteractor, workers: int, seconds: float, writes: float
+) -> float:
+    deadline = time.perf_counter() + seconds
+    done = [0] * workers
+
+    def worker(w: int) -> None:
+        rng = random.Random(w)
+        while time.perf_counter() < deadline:
+            i = rng.randrange(USERS * WALLETS_PER_USER)
+            user = f"user-{i // WALLETS_PER_USER}"
+            if rng.random() < writes:
+                interactor.make_transaction(
+                    MakeTransactionRequest(
+                        user,
+                        f"wallet-{i}",
+                        f"wallet-{(i + 1) % (USERS * WALLETS_PER_USER)}",
+                        1,
+                    )
+                )
+            else:
+                interactor.get_transactions(GetTransactionsRequest(user, limit=100))
+            done[w] += 1
+
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(worker, range(workers)))
+    return sum(done) / seconds
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seconds", type=float, default=3)
+    parser.add_argument("--writes", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    random.seed(0)
+    print(f"{'workers':>8} {'1 connection (ops/s)':>22} {'pool (ops/s)':>14} {'x':>6}")
+    with tempfile.TemporaryDirectory() as directory:
+        single = setup(str(Path(directory) / "single.db"), 1)
+        pooled = setup(str(Path(directory) / "pooled.db"), max(args.workers))
+        for workers in args.workers:
+            before = run(single, workers, args.seconds, args.writes)
+            after = run(pooled, workers, args.seconds, args.writes)
+            print(f"{workers:>8} {before:>22.0f} {after:>14.0f} {after / before:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,15 @@
+import time
 from typing import Callable, Dict
 
 from starlette.testclient import TestClient
 
-from tests.test_api import API_ADMIN_KEY, StatusCode
+from app.core.admin.interactor import ADMIN_KEY
+from tests.test_api import (
+    API_ADMIN_KEY,
+    API_ARG_KEY_NAME,
+    WALLET_ADDRES_KEY_NAME,
+    StatusCode,
+)
 
 
 def test_api_error_messages_admin(
@@ -16,3 +23,58 @@ def test_api_error_messages_admin(
     )
     assert response.status_code == StatusCode.WRONG_ADMIN_KEY
     assert response.json() == from_msg("Incorrect api key for admin")
+
+
+def test_api_transaction_timeseries(
+    api_client: TestClient, from_msg: Callable[[str], Dict[str, str]]
+) -> None:
+    user = api_client.post("/users").json()[API_ARG_KEY_NAME]
+    source, destination = [
+        api_client.post("/wallets", params={API_ARG_KEY_NAME: user}).json()[
+            WALLET_ADDRES_KEY_NAME
+        ]
+        for _ in range(2)
+    ]
+    started = int(time.time())
+    for amount in [1000, 2000]:
+        api_client.post(
+            "/transactions",
+            params={
+                API_ARG_KEY_NAME: user,
+                "source": source,
+                "destination": destination,
+                "amount": amount,
+            },
+        )
+
+    response = api_client.get(
+        "/statistics/timeseries",
+        params={
+            API_ADMIN_KEY: ADMIN_KEY,
+            "from": started - started % 60 - 3600,
+            "to": started - started % 60 + 3600,
+            "granularity": "minute",
+        },
+    )
+    assert response.status_code == StatusCode.OK
+    timeseries = response.json()
+    assert timeseries["granularity"] == "minute"
+    assert len(timeseries["buckets"]) == 120
+    assert sum(b["number_of_transactions"] for b in timeseries["buckets"]) == 2
+    assert sum(b["volume"] for b in timeseries["buckets"]) == 3000
+
+    for params, status_code, message in [
+        ({"from": 60, "to": 0}, 411, "to must be later than from"),
+        ({"from": 0, "to": 10**9}, 412, "Cannot return more than 2000 buckets"),
+    ]:
+        response = api_client.get(
+            "/statistics/timeseries", params={API_ADMIN_KEY: ADMIN_KEY, **params}
+        )
+        assert response.status_code == status_code
+        assert response.json() == from_msg(message)
+
+    response = api_client.get(
+        "/statistics/timeseries",
+        params={API_ADMIN_KEY: ADMIN_KEY, "from": 0, "to": 60, "granularity": "week"},
+    )
+    assert response.status_code == StatusCode.VALIDATION_ERROR
@@ -2,9 +2,13 @@ from result import Err, Ok
 
 from app.core.admin.interactor import (
     ADMIN_KEY,
+    MAX_TIMESERIES_BUCKETS,
     AdminError,
     AdminInteractor,
     GetStatisticsRequest,
+    GetTransactionTimeseriesRequest,
+    Granularity,
+    TransactionBucket,
 )
 from app.core.transaction.entity import Transaction
 from tests.conftest import IAdminAndTransactionRepository
@@ -13,7 +17,9 @@ from tests.conftest import IAdminAndTransactionRepository
 def test_admin_interactor_one_transaction(
     transaction_and_admin_repository: IAdminAndTransactionRepository,
 ) -> None:
-    transaction_and_admin_repository.create_transaction(Transaction("a", "b", 1000, 10))
+    transaction_and_admin_repository.create_transaction(
+        Transaction("a", "b", 1000, 10, 0)
+    )
 
     admin_interactor = AdminInteractor(transaction_and_admin_repository)
     response = admin_interactor.get_statistics(GetStatisticsRequest(ADMIN_KEY))
@@ -27,11 +33,11 @@ def test_admin_interactor_many_transactions(
     transaction_and_admin_repository: IAdminAndTransactionRepository,
 ) -> None:
     transactions = [
-        Transaction("a", "b", 1000, 10),
-        Transaction("a", "b", 1000, 0),
-        Transaction("a", "b", 1000, 100),
-        Transaction("b", "a", 2000, 200),
-        Transaction("b", "a", 2000, 0),
+        Transaction("a", "b", 1000, 10, 0),
+        Transaction("a", "b", 1000, 0, 0),
+        Transaction("a", "b", 1000, 100, 0),
+        Transaction("b", "a", 2000, 200, 0),
+        Transaction("b", "a", 2000, 0, 0),
     ]
 
     for transaction in transactions:
@@ -48,10 +54,91 @@ def test_admin_interactor_many_transactions(
 def test_wrong_admin_key(
     transaction_and_admin_repository: IAdminAndTransactionRepository,
 ) -> None:
-    transaction_and_admin_repository.create_transaction(Transaction("a", "b", 1000, 10))
+    transaction_and_admin_repository.create_transaction(
+        Transaction("a", "b", 1000, 10, 0)
+    )
 
     admin_interactor = AdminInteractor(transaction_and_admin_repository)
     response = admin_interactor.get_statistics(GetStatisticsRequest("ABC ABC"))
 
     assert isinstance(response, Err)
     assert response.value == AdminError.INCORRECT_ADMIN_KEY
+
+
+def test_transaction_timeseries(
+    transaction_and_admin_repository: IAdminAndTransactionRepository,
+) -> None:
+    day = 1_700_006_400  # a utc midnight
+    transaction_and_admin_repository.create_transactions(
+        [
+            Transaction("a", "b", 1000, 10, day + 5),
+            Transaction("a", "b", 2000, 20, day + 59),
+            Transaction("b", "a", 3000, 30, day + 60),
+            Transaction("b", "a", 4000, 40, day + 3 * 3600),
+            Transaction("a", "b", 5000, 50, day - 1),
+        ]
+    )
+    admin_interactor = AdminInteractor(transaction_and_admin_repository)
+
+    by_minute = admin_interactor.get_transaction_timeseries(
+        GetTransactionTimeseriesRequest(
+            ADMIN_KEY, day + 30, day + 150, Granularity.MINUTE
+        )
+    )
+    assert isinstance(by_minute, Ok)
+    assert by_minute.value.buckets == [
+        TransactionBucket(day, 2, 3000, 30),
+        TransactionBucket(day + 60, 1, 3000, 30),
+        TransactionBucket(day + 120, 0, 0, 0),
+    ]
+
+    by_hour = admin_interactor.get_transaction_timeseries(
+        GetTransactionTimeseriesRequest(
+            ADMIN_KEY, day, day + 4 * 3600, Granularity.HOUR
+        )
+    )
+    assert isinstance(by_hour, Ok)
+    assert [b.number_of_transactions for b in by_hour.value.buckets] == [3, 0, 0, 1]
+
+    by_day = admin_interactor.get_transaction_timeseries(
+        GetTransactionTimeseriesRequest(ADMIN_KEY, day - 1, day + 1, Granularity.DAY)
+    )
+    assert isinstance(by_day, Ok)
+    assert by_day.value.buckets == [
+        TransactionBucket(day - 86400, 1, 5000, 50),
+        TransactionBucket(day, 4, 10000, 100),
+    ]
+
+
+def test_transaction_timeseries_errors(
+    transaction_and_admin_repository: IAdminAndTransactionRepository,
+) -> None:
+    admin_interactor = AdminInteractor(transaction_and_admin_repository)
+
+    for request, error in [
+        (
+            GetTransactionTimeseriesRequest("hacker", 0, 60, Granularity.MINUTE),
+            AdminError.INCORRECT_ADMIN_KEY,
+        ),
+        (
+            GetTransactionTimeseriesRequest(ADMIN_KEY, 60, 60, Granularity.MINUTE),
+            AdminError.INVALID_TIME_RANGE,
+        ),
+        (
+            GetTransactionTimeseriesRequest(
+                ADMIN_KEY, 0, (MAX_TIMESERIES_BUCKETS + 1) * 60, Granularity.MINUTE
+            ),
+            AdminError.TOO_MANY_BUCKETS,
+        ),
+    ]:
+        response = admin_interactor.get_transaction_timeseries(request)
+        assert isinstance(response, Err)
+        assert response.value == error
+
+    response = admin_interactor.get_transaction_timeseries(
+        GetTransactionTimeseriesRequest(
+            ADMIN_KEY, 0, MAX_TIMESERIES_BUCKETS * 60, Granularity.MINUTE
+        )
+    )
+    assert isinstance(response, Ok)
+    assert len(response.value.buckets) == MAX_TIMESERIES_BUCKETS
@@ -0,0 +1,158 @@
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pytest
+from _pytest.python import Metafunc
+
+from app.core.transaction.entity import Transaction
+from app.core.transaction.interactor import ITransactionRepository
+from app.core.user.interactor import IUserRepository
+from app.core.wallet.entity import Wallet
+from app.core.wallet.interactor import IWalletRepository
+
+# every user owns one wallet and every wallet took part in about
+# TRANSACTIONS_PER_WALLET transfers, whatever the size. A lookup of one user
+# or wallet should cost the same at every size, a scan grows with it
+TRANSACTIONS_PER_WALLET = 10
+# the history starts here and has a transaction every SECONDS_APART seconds
+HISTORY_START = 1_700_000_000
+SECONDS_APART = 10
+# each benchmark runs for at least this long and at least MIN_ROUNDS times
+MIN_SECONDS = 0.05
+MIN_ROUNDS = 5
+
+
+def pytest_generate_tests(metafunc: Metafunc) -> None:
+    if "size" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "size", metafunc.config.getoption("--repo-benchmark-sizes")
+        )
+
+
+def backend_name(config: pytest.Config) -> str:
+    if config.getoption("--sql"):
+        return "sqlite"
+    if config.getoption("--columnar"):
+        return "columnar"
+    return "inmemory"
+
+
+@dataclass
+class BenchmarkResult:
+    rounds: int
+    mean_us: float
+    min_us: float
+
+
+@dataclass
+class BenchmarkSession:
+    json_path: Optional[str]
+    baseline: Dict[str, Any]
+    max_slowdown: float
+    results: Dict[str, BenchmarkResult] = field(default_factory=dict)
+
+    def write(self) -> None:
+        if self.json_path is None:
+            return
+        # runs with different switches add to the same file
+        path = Path(self.json_path)
+        stored = json.loads(path.read_text()) if path.exists() else {}
+        stored.update({key: asdict(r) for key, r in self.results.items()})
+        path.write_text(json.dumps(stored, indent=2, sort_keys=True))
+
+
+@pytest.fixture(scope="session")
+def repo_benchmark_session(
+    request: pytest.FixtureRequest,
+) -> Iterator[BenchmarkSession]:
+    baseline_path = request.config.getoption("--repo-benchmark-compare")
+    session = BenchmarkSession(
+        json_path=request.config.getoption("--repo-benchmark-json"),
+        baseline=json.loads(Path(baseline_path).read_text()) if baseline_path else {},
+        max_slowdown=request.config.getoption("--repo-benchmark-max-slowdown"),
+    )
+    yield session
+    session.write()
+
+
+Benchmark = Callable[[Callable[[int], Any]], BenchmarkResult]
+
+
+@pytest.fixture(scope="function")
+def repo_benchmark(
+    request: pytest.FixtureRequest, repo_benchmark_session: BenchmarkSession
+) -> Benchmark:
+    if not request.config.getoption("--repo-benchmark"):
+        pytest.skip("benchmarks only run with --repo-benchmark")
+    key = f"{backend_name(request.config)}/{request.node.name}"
+
+    def run(fn: Callable[[int], Any]) -> BenchmarkResult:
+        # fn gets the round number, so that writes can use fresh keys
+        timings: List[float] = []
+        started = time.perf_counter()
+        while len(timings) < MIN_ROUNDS or time.perf_counter() - started < MIN_SECONDS:
+            start = time.perf_counter()
+            fn(len(timings))
+            timings.append(time.perf_counter() - start)
+        result = BenchmarkResult(
+            rounds=len(timings),
+            mean_us=sum(timings) / len(timings) * 1e6,
+            min_us=min(timings) * 1e6,
+        )
+        repo_benchmark_session.results[key] = result
+
+        before = repo_benchmark_session.baseline.get(key)
+        if before is not None:
+            # min is the least noisy estimate of what the code itself costs
+            limit = before["min_us"] * repo_benchmark_session.max_slowdown
+            assert result.min_us <= limit, (
+                f"{key} takes {result.min_us:.1f}us,"
+                f" was {before['min_us']:.1f}us in the baseline"
+            )
+        return result
+
+    return run
+
+
+@dataclass
+class Dataset:
+    size: int
+
+    def user(self, i: int) -> str:
+        return f"user-{i % self.size}"
+
+    def wallet(self, i: int) -> str:
+        return f"wallet-{i % self.size}"
+
+    def created_at(self, i: int) -> int:
+        return HISTORY_START + i * SECONDS_APART
+
+
+@pytest.fixture(scope="function")
+def dataset(
+    request: pytest.FixtureRequest,
+    size: int,
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    transaction_repository: ITransactionRepository,
+) -> Dataset:
+    if not request.config.getoption("--repo-benchmark"):
+        pytest.skip("benchmarks only run with --repo-benchmark")
+    data = Dataset(size)
+    user_repository.create_users([data.user(i) for i in range(size)])
+    wallet_repository.create_wallets(
+        [Wallet(data.wallet(i), data.user(i), 10**12) for i in range(size)]
+    )
+    # deterministic, so that every run and every backend gets the same history
+    transaction_repository.create_transactions(
+        [
+            Transaction(
+                data.wallet(i), data.wallet(i * 7919 + 1), 1, 0, data.created_at(i)
+            )
+            for i in range(size * TRANSACTIONS_PER_WALLET // 2)
+        ]
+    )
+    return data
@@ -0,0 +1,231 @@
+from typing import Any, Iterator
+
+from app.core.admin.interactor import Granularity, IAdminRepository
+from app.core.transaction.entity import Transaction
+from app.core.transaction.interactor import ITransactionRepository
+from app.core.user.interactor import IUserRepository
+from app.core.wallet.entity import Wallet
+from app.core.wallet.interactor import IWalletRepository
+from tests.benchmarks.conftest import Benchmark, Dataset
+
+BATCH = 100
+
+
+def consume(iterator: Iterator[Any]) -> None:
+    for _ in iterator:
+        pass
+
+
+def test_create_user(
+    dataset: Dataset, repo_benchmark: Benchmark, user_repository: IUserRepository
+) -> None:
+    repo_benchmark(lambda i: user_repository.create_user(f"new-user-{i}"))
+
+
+def test_create_users(
+    dataset: Dataset, repo_benchmark: Benchmark, user_repository: IUserRepository
+) -> None:
+    repo_benchmark(
+        lambda i: user_repository.create_users(
+            [f"new-user-{i}-{j}" for j in range(BATCH)]
+        )
+    )
+
+
+def test_get_user(
+    dataset: Dataset, repo_benchmark: Benchmark, user_repository: IUserRepository
+) -> None:
+    repo_benchmark(lambda i: user_repository.get_user(dataset.user(i * 31)))
+
+
+def test_get_missing_user(
+    dataset: Dataset, repo_benchmark: Benchmark, user_repository: IUserRepository
+) -> None:
+    repo_benchmark(lambda i: user_repository.get_user(f"missing-{i}"))
+
+
+def test_create_wallet(
+    dataset: Dataset, repo_benchmark: Benchmark, wallet_repository: IWalletRepository
+) -> None:
+    repo_benchmark(
+        lambda i: wallet_repository.create_wallet(dataset.user(i), f"new-{i}", 100)
+    )
+
+
+def test_create_wallets(
+    dataset: Dataset, repo_benchmark: Benchmark, wallet_repository: IWalletRepository
+) -> None:
+    repo_benchmark(
+        lambda i: wallet_repository.create_wallets(
+            [Wallet(f"new-{i}-{j}", dataset.user(j), 100) for j in range(BATCH)]
+        )
+    )
+
+
+def test_get_wallet(
+    dataset: Dataset, repo_benchmark: Benchmark, wallet_repository: IWalletRepository
+) -> None:
+    repo_benchmark(lambda i: wallet_repository.get_wallet(dataset.wallet(i * 31)))
+
+
+def test_get_user_wallets(
+    dataset: Dataset, repo_benchmark: Benchmark, wallet_repository: IWalletRepository
+) -> None:
+    repo_benchmark(lambda i: wallet_repository.get_user_wallets(dataset.user(i * 31)))
+
+
+def test_get_wallets(
+    dataset: Dataset, repo_benchmark: Benchmark, wallet_repository: IWalletRepository
+) -> None:
+    repo_benchmark(
+        lambda i: wallet_repository.get_wallets(
+            [dataset.wallet(i * 31 + j) for j in range(10)]
+        )
+    )
+
+
+def test_update_balance(
+    dataset: Dataset, repo_benchmark: Benchmark, wallet_repository: IWalletRepository
+) -> None:
+    repo_benchmark(
+        lambda i: wallet_repository.update_balance(dataset.wallet(i * 31), i)
+    )
+
+
+def test_apply_balance_changes(
+    dataset: Dataset, repo_benchmark: Benchmark, wallet_repository: IWalletRepository
+) -> None:
+    repo_benchmark(
+        lambda i: wallet_repository.apply_balance_changes(
+            {dataset.wallet(i * 31 + j): 1 - 2 * (j % 2) for j in range(10)}
+        )
+    )
+
+
+def test_create_transaction(
+    dataset: Dataset,
+    repo_benchmark: Benchmark,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    repo_benchmark(
+        lambda i: transaction_repository.create_transaction(
+            Transaction(
+                dataset.wallet(i), dataset.wallet(i + 1), 1, 0, dataset.created_at(i)
+            )
+        )
+    )
+
+
+def test_create_transactions(
+    dataset: Dataset,
+    repo_benchmark: Benchmark,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    repo_benchmark(
+        lambda i: transaction_repository.create_transactions(
+            [
+                Transaction(
+                    dataset.wallet(i + j),
+                    dataset.wallet(i + j + 1),
+                    1,
+                    0,
+                    dataset.created_at(i + j),
+                )
+                for j in range(BATCH)
+            ]
+        )
+    )
+
+
+def test_get_all_user_transactions(
+    dataset: Dataset,
+    repo_benchmark: Benchmark,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    repo_benchmark(
+        lambda i: transaction_repository.get_all_user_transactions(dataset.user(i * 31))
+    )
+
+
+def test_get_all_wallet_transactions(
+    dataset: Dataset,
+    repo_benchmark: Benchmark,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    repo_benchmark(
+        lambda i: transaction_repository.get_all_wallet_transactions(
+            dataset.wallet(i * 31)
+        )
+    )
+
+
+def test_get_user_transactions_page(
+    dataset: Dataset,
+    repo_benchmark: Benchmark,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    repo_benchmark(
+        lambda i: transaction_repository.get_user_transactions_page(
+            dataset.user(i * 31), None, 5
+        )
+    )
+
+
+def test_get_wallet_transactions_page(
+    dataset: Dataset,
+    repo_benchmark: Benchmark,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    repo_benchmark(
+        lambda i: transaction_repository.get_wallet_transactions_page(
+            dataset.wallet(i * 31), None, 5
+        )
+    )
+
+
+def test_iter_user_transactions(
+    dataset: Dataset,
+    repo_benchmark: Benchmark,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    repo_benchmark(
+        lambda i: consume(
+            transaction_repository.iter_user_transactions(dataset.user(i * 31))
+        )
+    )
+
+
+def test_iter_wallet_transactions(
+    dataset: Dataset,
+    repo_benchmark: Benchmark,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    repo_benchmark(
+        lambda i: consume(
+            transaction_repository.iter_wallet_transactions(dataset.wallet(i * 31))
+        )
+    )
+
+
+def test_get_transaction_statistics(
+    dataset: Dataset, repo_benchmark: Benchmark, admin_repository: IAdminRepository
+) -> None:
+    repo_benchmark(lambda i: admin_repository.get_transaction_statistics())
+
+
+def test_get_transaction_buckets(
+    dataset: Dataset, repo_benchmark: Benchmark, admin_repository: IAdminRepository
+) -> None:
+    # a day by the hour, the same 24 buckets whatever the size of the history
+    repo_benchmark(
+        lambda i: admin_repository.get_transaction_buckets(
+            Granularity.HOUR, dataset.created_at(0), dataset.created_at(0) + 86400
+        )
+    )
+
+
+def test_get_all_transactions(
+    dataset: Dataset, repo_benchmark: Benchmark, admin_repository: IAdminRepository
+) -> None:
+    # grows with the history by design, kept to see by how much
+    repo_benchmark(lambda i: admin_repository.get_all_transactions())
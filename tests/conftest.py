@@ -1,17 +1,27 @@
-from typing import Callable, Dict, Protocol
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Protocol, Tuple
 
 import pytest
 from _pytest.config.argparsing import Parser
 from fastapi.testclient import TestClient
 from result import Ok, Result
 
+from app.core.admin.async_interactor import IAsyncAdminRepository
 from app.core.admin.interactor import (
     AdminInteractor,
     IAdminInteractor,
     IAdminRepository,
 )
+from app.core.async_facade import AsyncWalletService
 from app.core.currency_converter import (
+    AsyncBlockChainTickerCurrencyConverter,
+    BlockChainTickerCurrencyConverter,
     ConversionError,
+    FiatAmounts,
     FiatCurrency,
     ICurrencyConverter,
 )
@@ -21,22 +31,39 @@ from app.core.key_generator import (
     generate_new_user_key,
     generate_wallet_address,
 )
+from app.core.transaction.async_interactor import IAsyncTransactionRepository
 from app.core.transaction.fee_calculator import FeeCalculator, IFeeCalculator
 from app.core.transaction.interactor import (
     ITransactionInteractor,
     ITransactionRepository,
     TransactionInteractor,
 )
+from app.core.unit_of_work import IAsyncUnitOfWork, IUnitOfWork
+from app.core.user.async_interactor import IAsyncUserRepository
 from app.core.user.interactor import IUserInteractor, IUserRepository, UserInteractor
+from app.core.wallet.async_interactor import IAsyncWalletRepository
 from app.core.wallet.interactor import (
     IWalletInteractor,
     IWalletRepository,
     WalletInteractor,
 )
-from app.infra.fastapi.api_main import setup_fastapi
-from app.infra.inmemory.transaction import InMemoryTransactionRepository
-from app.infra.inmemory.user import InMemoryUserRepository
-from app.infra.inmemory.wallet import InMemoryWalletRepository
+from app.infra.async_sqlite.database import AsyncSqliteDatabase
+from app.infra.async_sqlite.transaction import AsyncSqlTransactionRepository
+from app.infra.async_sqlite.user import AsyncSqlUserRepository
+from app.infra.async_sqlite.wallet import AsyncSqlWalletRepository
+from app.infra.fastapi.api_main import setup_async_fastapi, setup_fastapi
+from app.infra.inmemory.columnar_transaction import ColumnarTransactionRepository
+from app.infra.inmemory.transaction import (
+    AsyncInMemoryTransactionRepository,
+    InMemoryTransactionRepository,
+)
+from app.infra.inmemory.unit_of_work import AsyncInMemoryUnitOfWork, InMemoryUnitOfWork
+from app.infra.inmemory.user import AsyncInMemoryUserRepository, InMemoryUserRepository
+from app.infra.inmemory.wallet import (
+    AsyncInMemoryWalletRepository,
+    InMemoryWalletRepository,
+)
+from app.infra.sqlite.database import SqliteDatabase
 from app.infra.sqlite.transaction import SqlTransactionRepository
 from app.infra.sqlite.user import SqlUserRepository
 from app.infra.sqlite.wallet import SqlWalletRepository
@@ -49,6 +76,41 @@ def pytest_addoption(parser: Parser) -> None:
         default=False,
         help="Nun integration tests with in memory Sqlite3Db",
     )
+    parser.addoption(
+        "--columnar",
+        action="store_true",
+        default=False,
+        help="Use the columnar in-memory transaction repository",
+    )
+    parser.addoption(
+        "--repo-benchmark",
+        action="store_true",
+        default=False,
+        help="Run the repository micro-benchmarks in tests/benchmarks",
+    )
+    parser.addoption(
+        "--repo-benchmark-sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000],
+        help="Dataset sizes the repository benchmarks are run with",
+    )
+    parser.addoption(
+        "--repo-benchmark-json",
+        default=None,
+        help="Add the benchmark results to this json file",
+    )
+    parser.addoption(
+        "--repo-benchmark-compare",
+        default=None,
+        help="Fail benchmarks slower than in this earlier --repo-benchmark-json",
+    )
+    parser.addoption(
+        "--repo-benchmark-max-slowdown",
+        type=float,
+        default=2.0,
+        help="How many times slower than --repo-benchmark-compare a benchmark may get",
+    )
 
 
 def use_sql_implementation(request: pytest.FixtureRequest) -> bool:
@@ -56,17 +118,37 @@ def use_sql_implementation(request: pytest.FixtureRequest) -> bool:
 
 
 @pytest.fixture(scope="function")
-def user_repository(request: pytest.FixtureRequest) -> IUserRepository:
+def sqlite_database() -> SqliteDatabase:
+    # every sql repository of a test shares one in-memory database
+    return SqliteDatabase(":memory:")
+
+
+@pytest.fixture(scope="function")
+def unit_of_work(
+    request: pytest.FixtureRequest, sqlite_database: SqliteDatabase
+) -> IUnitOfWork:
     if use_sql_implementation(request):
-        return SqlUserRepository(":memory:")
+        return sqlite_database
+    else:
+        return InMemoryUnitOfWork()
+
+
+@pytest.fixture(scope="function")
+def user_repository(
+    request: pytest.FixtureRequest, sqlite_database: SqliteDatabase
+) -> IUserRepository:
+    if use_sql_implementation(request):
+        return SqlUserRepository(sqlite_database)
     else:
         return InMemoryUserRepository()
 
 
 @pytest.fixture(scope="function")
-def wallet_repository(request: pytest.FixtureRequest) -> IWalletRepository:
+def wallet_repository(
+    request: pytest.FixtureRequest, sqlite_database: SqliteDatabase
+) -> IWalletRepository:
     if use_sql_implementation(request):
-        return SqlWalletRepository(":memory:")
+        return SqlWalletRepository(sqlite_database)
     else:
         return InMemoryWalletRepository()
 
@@ -79,10 +161,14 @@ class IAdminAndTransactionRepository(
 
 @pytest.fixture(scope="function")
 def transaction_and_admin_repository(
-    wallet_repository: IWalletRepository, request: pytest.FixtureRequest
+    wallet_repository: IWalletRepository,
+    request: pytest.FixtureRequest,
+    sqlite_database: SqliteDatabase,
 ) -> IAdminAndTransactionRepository:
     if use_sql_implementation(request):
-        return SqlTransactionRepository(":memory:", wallet_repository)
+        return SqlTransactionRepository(sqlite_database)
+    elif request.config.getoption("--columnar"):
+        return ColumnarTransactionRepository(wallet_repository)
     else:
         return InMemoryTransactionRepository(wallet_repository)
 
@@ -109,12 +195,66 @@ class FakeCurrencyConverter:
     ) -> Result[float, ConversionError]:
         return Ok(satoshis * self.scale)
 
+    def convert_many(
+        self, satoshis: List[int], currencies: List[FiatCurrency]
+    ) -> Result[List[FiatAmounts], ConversionError]:
+        return Ok([{c: amount * self.scale for c in currencies} for amount in satoshis])
+
 
 @pytest.fixture(scope="function")
 def currency_convertor() -> ICurrencyConverter:
     return FakeCurrencyConverter()
 
 
+@dataclass
+class StubTickerServer:
+    rates: Dict[str, float] = field(
+        default_factory=lambda: {"USD": 20000.0, "EUR": 19000.0, "RUB": 1200000.0}
+    )
+    requests_served: int = 0
+    # how long every answer takes, to let requests pile up behind one fetch
+    delay_seconds: float = 0.0
+    server: Any = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/ticker"
+
+    def ticker(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            currency: {"15m": rate, "last": rate, "buy": rate, "sell": rate}
+            for currency, rate in self.rates.items()
+        }
+
+
+@pytest.fixture(scope="function")
+def ticker_server() -> Iterator[StubTickerServer]:
+    stub = StubTickerServer()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            time.sleep(stub.delay_seconds)
+            body = json.dumps(stub.ticker()).encode()
+            stub.requests_served += 1
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    stub.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=stub.server.serve_forever, daemon=True)
+    thread.start()
+    yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
+    thread.join()
+
+
 @pytest.fixture(scope="function")
 def wallet_address_creator_fun() -> ApiKeyGenerator:
     def f() -> str:
@@ -187,24 +327,103 @@ def transaction_interactor(
     user_repository: IUserRepository,
     wallet_repository: IWalletRepository,
     fee_calculator: IFeeCalculator,
+    unit_of_work: IUnitOfWork,
 ) -> ITransactionInteractor:
     return TransactionInteractor(
-        transaction_repository, user_repository, wallet_repository, fee_calculator
+        transaction_repository,
+        user_repository,
+        wallet_repository,
+        fee_calculator,
+        unit_of_work,
     )
 
 
-@pytest.fixture(scope="function")
-def api_client() -> TestClient:
-    user_repository = InMemoryUserRepository()
-    wallet_repository = InMemoryWalletRepository()
-    transaction_and_admin_repository = InMemoryTransactionRepository(wallet_repository)
-    wallet_service = WalletService.create(
+def sync_wallet_service(
+    request: pytest.FixtureRequest, ticker_server: StubTickerServer
+) -> WalletService:
+    if use_sql_implementation(request):
+        database = SqliteDatabase(":memory:")
+        user_repository: IUserRepository = SqlUserRepository(database)
+        wallet_repository: IWalletRepository = SqlWalletRepository(database)
+        transaction_and_admin_repository: IAdminAndTransactionRepository = (
+            SqlTransactionRepository(database)
+        )
+        unit_of_work: IUnitOfWork = database
+    else:
+        user_repository = InMemoryUserRepository()
+        wallet_repository = InMemoryWalletRepository()
+        transaction_and_admin_repository = InMemoryTransactionRepository(
+            wallet_repository
+        )
+        unit_of_work = InMemoryUnitOfWork()
+    return WalletService.create(
+        user_repository=user_repository,
+        wallet_repository=wallet_repository,
+        transaction_repository=transaction_and_admin_repository,
+        admin_repository=transaction_and_admin_repository,
+        currency_converter=BlockChainTickerCurrencyConverter(api_url=ticker_server.url),
+        unit_of_work=unit_of_work,
+    )
+
+
+class IAsyncAdminAndTransactionRepository(
+    IAsyncAdminRepository, IAsyncTransactionRepository, Protocol
+):
+    pass
+
+
+def async_wallet_service(
+    request: pytest.FixtureRequest, ticker_server: StubTickerServer
+) -> Tuple[AsyncWalletService, Callable[[], Awaitable[None]]]:
+    if use_sql_implementation(request):
+        database = AsyncSqliteDatabase(":memory:")
+        user_repository: IAsyncUserRepository = AsyncSqlUserRepository(database)
+        wallet_repository: IAsyncWalletRepository = AsyncSqlWalletRepository(database)
+        transaction_and_admin_repository: IAsyncAdminAndTransactionRepository = (
+            AsyncSqlTransactionRepository(database)
+        )
+        unit_of_work: IAsyncUnitOfWork = database
+        close = database.close
+    else:
+        in_memory_wallet_repository = InMemoryWalletRepository()
+        user_repository = AsyncInMemoryUserRepository()
+        wallet_repository = AsyncInMemoryWalletRepository(in_memory_wallet_repository)
+        transaction_and_admin_repository = AsyncInMemoryTransactionRepository(
+            InMemoryTransactionRepository(in_memory_wallet_repository)
+        )
+        unit_of_work = AsyncInMemoryUnitOfWork()
+
+        async def close() -> None:
+            pass
+
+    wallet_service = AsyncWalletService.create(
         user_repository=user_repository,
         wallet_repository=wallet_repository,
         transaction_repository=transaction_and_admin_repository,
         admin_repository=transaction_and_admin_repository,
+        currency_converter=AsyncBlockChainTickerCurrencyConverter(
+            BlockChainTickerCurrencyConverter(api_url=ticker_server.url)
+        ),
+        unit_of_work=unit_of_work,
     )
-    return TestClient(setup_fastapi(wallet_service))
+    return wallet_service, close
+
+
+# every api test runs against both the threadpool and the event loop routes
+@pytest.fixture(scope="function", params=["sync", "async"])
+def api_client(
+    request: pytest.FixtureRequest, ticker_server: StubTickerServer
+) -> Iterator[TestClient]:
+    if request.param == "sync":
+        yield TestClient(setup_fastapi(sync_wallet_service(request, ticker_server)))
+        return
+
+    wallet_service, close = async_wallet_service(request, ticker_server)
+    app = setup_async_fastapi(wallet_service)
+    app.add_event_handler("shutdown", close)
+    # entering the client runs every request on one event loop
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture(scope="module")
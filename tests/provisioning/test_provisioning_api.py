@@ -0,0 +1,50 @@
+from typing import Callable, Dict
+
+from starlette.testclient import TestClient
+
+from app.core.admin.interactor import ADMIN_KEY
+from app.core.wallet.interactor import MAX_WALLETS_PER_PERSON
+from tests.test_api import (
+    API_ADMIN_KEY,
+    API_ARG_KEY_NAME,
+    WALLET_ADDRES_KEY_NAME,
+    StatusCode,
+)
+
+
+def test_api_provision_users(
+    api_client: TestClient, from_msg: Callable[[str], Dict[str, str]]
+) -> None:
+    response_wrong_key = api_client.post(
+        "/users/batch", params={API_ADMIN_KEY: "Blaa", "users": 1}
+    )
+    assert response_wrong_key.status_code == StatusCode.WRONG_ADMIN_KEY
+    assert response_wrong_key.json() == from_msg("Incorrect api key for admin")
+
+    response_too_many_wallets = api_client.post(
+        "/users/batch",
+        params={
+            API_ADMIN_KEY: ADMIN_KEY,
+            "users": 1,
+            "wallets_per_user": MAX_WALLETS_PER_PERSON + 1,
+        },
+    )
+    assert response_too_many_wallets.status_code == StatusCode.VALIDATION_ERROR
+
+    response = api_client.post(
+        "/users/batch",
+        params={API_ADMIN_KEY: ADMIN_KEY, "users": 3, "wallets_per_user": 2},
+    )
+    assert response.status_code == StatusCode.OK
+    users = response.json()["users"]
+    assert len(users) == 3
+    assert all(len(user["wallets"]) == 2 for user in users)
+
+    user = users[0]
+    wallet = user["wallets"][1]
+    response_get_wallet = api_client.get(
+        f"/wallets/{wallet[WALLET_ADDRES_KEY_NAME]}",
+        params={API_ARG_KEY_NAME: user[API_ARG_KEY_NAME]},
+    )
+    assert response_get_wallet.status_code == StatusCode.OK
+    assert response_get_wallet.json() == wallet
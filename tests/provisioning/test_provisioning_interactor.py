@@ -0,0 +1,118 @@
+from typing import Callable, List
+
+from result import Err, Ok, Result
+
+from app.core.admin.interactor import ADMIN_KEY
+from app.core.btc_constants import INITIAL_WALLET_VALUE_SATOSHIS, SATOSHI_IN_BTC
+from app.core.currency_converter import (
+    ConversionError,
+    FiatAmounts,
+    FiatCurrency,
+    ICurrencyConverter,
+)
+from app.core.provisioning.interactor import (
+    ProvisioningError,
+    ProvisioningInteractor,
+    ProvisionUsersRequest,
+)
+from app.core.unit_of_work import IUnitOfWork
+from app.core.user.interactor import IUserRepository
+from app.core.wallet.interactor import MAX_WALLETS_PER_PERSON, IWalletRepository
+
+
+def counter(prefix: str) -> Callable[[], str]:
+    count = 0
+
+    def f() -> str:
+        nonlocal count
+        count += 1
+        return f"{prefix}-{count}"
+
+    return f
+
+
+class FailingCurrencyConverter:
+    def convert_btc_to_fiat(
+        self, satoshis: int, currency: FiatCurrency
+    ) -> Result[float, ConversionError]:
+        return Err(ConversionError.UNSUPPORTED_CURRENCY)
+
+    def convert_many(
+        self, satoshis: List[int], currencies: List[FiatCurrency]
+    ) -> Result[List[FiatAmounts], ConversionError]:
+        return Err(ConversionError.UNSUPPORTED_CURRENCY)
+
+
+def test_provision_users(
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    currency_convertor: ICurrencyConverter,
+    unit_of_work: IUnitOfWork,
+) -> None:
+    interactor = ProvisioningInteractor(
+        user_repository,
+        wallet_repository,
+        currency_convertor,
+        counter("user"),
+        counter("wallet"),
+        unit_of_work,
+    )
+
+    response = interactor.provision_users(ProvisionUsersRequest(ADMIN_KEY, 2, 3))
+    assert isinstance(response, Ok)
+    assert [user.api_key for user in response.value.users] == ["user-1", "user-2"]
+    assert [
+        [wallet.wallet_address for wallet in user.wallets]
+        for user in response.value.users
+    ] == [["wallet-1", "wallet-2", "wallet-3"], ["wallet-4", "wallet-5", "wallet-6"]]
+
+    wallet = response.value.users[1].wallets[0]
+    assert wallet.balance_btc == INITIAL_WALLET_VALUE_SATOSHIS / SATOSHI_IN_BTC
+    assert (
+        wallet.balance_usd
+        == currency_convertor.convert_btc_to_fiat(
+            INITIAL_WALLET_VALUE_SATOSHIS, FiatCurrency.USD
+        ).unwrap()
+    )
+
+    assert user_repository.get_user("user-2") is not None
+    assert [w.address for w in wallet_repository.get_user_wallets("user-2")] == [
+        "wallet-4",
+        "wallet-5",
+        "wallet-6",
+    ]
+
+
+def test_provision_users_errors(
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    currency_convertor: ICurrencyConverter,
+    unit_of_work: IUnitOfWork,
+) -> None:
+    interactor = ProvisioningInteractor(
+        user_repository,
+        wallet_repository,
+        currency_convertor,
+        counter("user"),
+        counter("wallet"),
+        unit_of_work,
+    )
+
+    response_wrong_key = interactor.provision_users(ProvisionUsersRequest("Blaa", 1, 1))
+    assert isinstance(response_wrong_key, Err)
+    assert response_wrong_key.value == ProvisioningError.INCORRECT_ADMIN_KEY
+
+    response_too_many_wallets = interactor.provision_users(
+        ProvisionUsersRequest(ADMIN_KEY, 1, MAX_WALLETS_PER_PERSON + 1)
+    )
+    assert isinstance(response_too_many_wallets, Err)
+    assert response_too_many_wallets.value == ProvisioningError.WALLET_LIMIT_REACHED
+
+    interactor.currency_convertor = FailingCurrencyConverter()
+    response_no_rate = interactor.provision_users(
+        ProvisionUsersRequest(ADMIN_KEY, 1, 1)
+    )
+    assert isinstance(response_no_rate, Err)
+    assert response_no_rate.value == ProvisioningError.UNSUPPORTED_CURRENCY
+    # nothing is created when the rate lookup fails
+    assert user_repository.get_user("user-1") is None
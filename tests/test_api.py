@@ -12,6 +12,7 @@ class StatusCode:
     OK = 200
 
     API_ENDPOINT_NOT_FOUND = 404
+    VALIDATION_ERROR = 422
 
     USER_NOT_FOUND = 410
     WALLET_NOT_FOUND = 411
@@ -0,0 +1,144 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from result import Err, Ok
+
+from app.core.btc_constants import SATOSHI_IN_BTC
+from app.core.currency_converter import (
+    SUPPORTED_CURRENCIES,
+    BlockChainTickerCurrencyConverter,
+    ConversionError,
+    FiatCurrency,
+)
+from tests.conftest import StubTickerServer
+
+
+class FakeClock:
+    now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_convert_btc_to_fiat(ticker_server: StubTickerServer) -> None:
+    converter = BlockChainTickerCurrencyConverter(api_url=ticker_server.url)
+
+    usd = converter.convert_btc_to_fiat(SATOSHI_IN_BTC * 2, FiatCurrency.USD)
+    eur = converter.convert_btc_to_fiat(SATOSHI_IN_BTC, FiatCurrency.EUR)
+
+    assert isinstance(usd, Ok) and isinstance(eur, Ok)
+    assert usd.value == 2 * ticker_server.rates["USD"]
+    assert eur.value == ticker_server.rates["EUR"]
+
+
+def test_convert_many_uses_one_snapshot(ticker_server: StubTickerServer) -> None:
+    converter = BlockChainTickerCurrencyConverter(api_url=ticker_server.url)
+    amounts = [SATOSHI_IN_BTC * i for i in range(100)]
+
+    response = converter.convert_many(amounts, SUPPORTED_CURRENCIES)
+
+    assert isinstance(response, Ok)
+    assert response.value == [
+        {c: i * ticker_server.rates[c.name] for c in SUPPORTED_CURRENCIES}
+        for i in range(100)
+    ]
+    assert ticker_server.requests_served == 1
+
+    unsupported = converter.convert_many(amounts, [FiatCurrency.USD, FiatCurrency.GEL])
+    assert isinstance(unsupported, Err)
+    assert unsupported.value == ConversionError.UNSUPPORTED_CURRENCY
+
+
+def test_unsupported_currency_skips_ticker(ticker_server: StubTickerServer) -> None:
+    converter = BlockChainTickerCurrencyConverter(api_url=ticker_server.url)
+
+    response = converter.convert_btc_to_fiat(SATOSHI_IN_BTC, FiatCurrency.GEL)
+
+    assert isinstance(response, Err)
+    assert response.value == ConversionError.UNSUPPORTED_CURRENCY
+    assert ticker_server.requests_served == 0
+
+
+def test_cold_cache_fetched_once_by_concurrent_requests(
+    ticker_server: StubTickerServer,
+) -> None:
+    ticker_server.delay_seconds = 0.2
+    converter = BlockChainTickerCurrencyConverter(api_url=ticker_server.url)
+
+    with ThreadPoolExecutor(8) as pool:
+        responses = list(
+            pool.map(
+                lambda i: converter.convert_btc_to_fiat(i, FiatCurrency.USD), range(8)
+            )
+        )
+
+    assert all(isinstance(response, Ok) for response in responses)
+    assert ticker_server.requests_served == 1
+
+
+def test_rates_cached_within_ttl(ticker_server: StubTickerServer) -> None:
+    clock = FakeClock()
+    converter = BlockChainTickerCurrencyConverter(
+        api_url=ticker_server.url, ttl_seconds=10, clock=clock
+    )
+
+    for _ in range(100):
+        clock.now += 0.05
+        assert isinstance(
+            converter.convert_btc_to_fiat(SATOSHI_IN_BTC, FiatCurrency.USD), Ok
+        )
+
+    assert ticker_server.requests_served == 1
+
+
+def test_stale_rates_served_while_revalidating(
+    ticker_server: StubTickerServer,
+) -> None:
+    clock = FakeClock()
+    converter = BlockChainTickerCurrencyConverter(
+        api_url=ticker_server.url, ttl_seconds=10, clock=clock
+    )
+    old_rate = ticker_server.rates["USD"]
+    converter.convert_btc_to_fiat(SATOSHI_IN_BTC, FiatCurrency.USD)
+
+    ticker_server.rates["USD"] = old_rate * 2
+    clock.now += 10
+
+    stale = converter.convert_btc_to_fiat(SATOSHI_IN_BTC, FiatCurrency.USD)
+    assert isinstance(stale, Ok)
+    assert stale.value == old_rate
+
+    wait_until(
+        lambda: converter.convert_btc_to_fiat(SATOSHI_IN_BTC, FiatCurrency.USD)
+        == Ok(old_rate * 2)
+    )
+    assert ticker_server.requests_served == 2
+
+
+def test_background_refresher_keeps_rates_warm(
+    ticker_server: StubTickerServer,
+) -> None:
+    converter = BlockChainTickerCurrencyConverter(
+        api_url=ticker_server.url, refresh_interval_seconds=0.01
+    )
+    converter.start()
+    try:
+        wait_until(lambda: ticker_server.requests_served > 0)
+        served_before = ticker_server.requests_served
+
+        ticker_server.rates["USD"] = 1.0
+        wait_until(
+            lambda: converter.convert_btc_to_fiat(SATOSHI_IN_BTC, FiatCurrency.USD)
+            == Ok(1.0)
+        )
+        assert ticker_server.requests_served > served_before
+    finally:
+        converter.stop()
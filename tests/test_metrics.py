@@ -0,0 +1,120 @@
+import asyncio
+from pathlib import Path
+from typing import List
+
+from fastapi.testclient import TestClient
+
+from app.infra.cache.user import UserCacheStats
+from app.infra.metrics.instrumented import instrument
+from app.infra.metrics.registry import Histogram, Metrics
+from app.runner.server_setup import setup, setup_inmemory
+from tests.conftest import FakeCurrencyConverter
+
+
+def sample_lines(text: str, name: str) -> List[str]:
+    return [line for line in text.splitlines() if line.startswith(name)]
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    histogram = Histogram("latency_seconds", "Latency.", ("op",), buckets=(0.1, 1.0))
+    for value in [0.05, 0.1, 0.5, 3.0]:
+        histogram.observe(('say "hi"',), value)
+
+    assert histogram.render() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{op="say \\"hi\\"",le="0.1"} 2',
+        'latency_seconds_bucket{op="say \\"hi\\"",le="1.0"} 3',
+        'latency_seconds_bucket{op="say \\"hi\\"",le="+Inf"} 4',
+        'latency_seconds_sum{op="say \\"hi\\""} 3.65',
+        'latency_seconds_count{op="say \\"hi\\""} 4',
+    ]
+
+
+class Repository:
+    size = 3
+
+    def get(self, key: str) -> str:
+        return key
+
+    async def fetch(self, key: str) -> str:
+        return key
+
+
+def test_instrument_times_sync_and_async_methods() -> None:
+    histogram = Histogram("calls_seconds", "Calls.", ("repository", "method"))
+    repository = instrument(Repository(), histogram, "test")
+
+    assert repository.get("a") == "a"
+    assert repository.get("b") == "b"
+    assert asyncio.run(repository.fetch("c")) == "c"
+    assert repository.size == 3
+
+    counts = {labels: sum(s.counts) for labels, s in histogram.snapshot().items()}
+    assert counts == {("test", "get"): 2, ("test", "fetch"): 1}
+
+
+def test_api_metrics() -> None:
+    metrics = Metrics()
+    client = TestClient(setup_inmemory(FakeCurrencyConverter(), metrics=metrics))
+
+    api_key = client.post("/users").json()["api_key"]
+    client.post("/wallets", params={"api_key": api_key})
+    client.get("/wallets/nosuchwallet", params={"api_key": api_key})
+    client.get("/nosuchroute")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    # one series per route template, not per address
+    assert sample_lines(text, "http_request_duration_seconds_count") == [
+        'http_request_duration_seconds_count{method="GET",route="/wallets/{address}",'
+        'status="411"} 1',
+        'http_request_duration_seconds_count{method="GET",route="unmatched",'
+        'status="404"} 1',
+        'http_request_duration_seconds_count{method="POST",route="/users",'
+        'status="200"} 1',
+        'http_request_duration_seconds_count{method="POST",route="/wallets",'
+        'status="200"} 1',
+    ]
+    assert (
+        'repository_call_duration_seconds_count{repository="wallet",'
+        'method="create_wallet"} 1'
+    ) in sample_lines(text, "repository_call_duration_seconds_count")
+    assert sample_lines(text, "currency_converter_call_duration_seconds_count") == [
+        'currency_converter_call_duration_seconds_count{method="convert_many"} 1'
+    ]
+    # the scrape itself is recorded once it is answered
+    assert 'route="/metrics"' in client.get("/metrics").text
+
+
+def test_api_metrics_count_user_cache_lookups(tmp_path: Path) -> None:
+    metrics = Metrics()
+    app = setup(
+        filename=str(tmp_path / "db.db"),
+        currency_converter=FakeCurrencyConverter(),
+        metrics=metrics,
+    )
+    client = TestClient(app)
+
+    api_key = client.post("/users").json()["api_key"]
+    for _ in range(3):
+        client.post("/wallets", params={"api_key": api_key})
+    client.post("/wallets", params={"api_key": "nobody"})
+    client.post("/wallets", params={"api_key": "nobody"})
+
+    assert app.state.user_cache.stats == UserCacheStats(
+        hits=2, misses=2, negative_hits=1
+    )
+    assert sample_lines(client.get("/metrics").text, "user_cache_lookups_total") == [
+        'user_cache_lookups_total{result="hit"} 2',
+        'user_cache_lookups_total{result="miss"} 2',
+        'user_cache_lookups_total{result="negative_hit"} 1',
+    ]
+
+
+def test_api_without_metrics(api_client: TestClient) -> None:
+    # nothing is installed, requests do not go through the middleware
+    assert api_client.get("/metrics").status_code == 404
+    assert not setup_inmemory(FakeCurrencyConverter()).user_middleware
@@ -0,0 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from result import Ok
+
+from app.core.transaction.fee_calculator import FeeCalculator
+from app.core.transaction.interactor import (
+    GetTransactionsRequest,
+    MakeTransactionRequest,
+    TransactionError,
+    TransactionInteractor,
+)
+from app.infra.sqlite.database import SqliteDatabase, SqliteSettings
+from app.infra.sqlite.transaction import SqlTransactionRepository
+from app.infra.sqlite.user import SqlUserRepository
+from app.infra.sqlite.wallet import SqlWalletRepository
+
+WORKERS = 8
+TRANSFERS_PER_WORKER = 50
+INITIAL_BALANCE = 1000
+
+
+def test_pragmas_applied(tmp_path: Path) -> None:
+    database = SqliteDatabase(
+        str(tmp_path / "db.db"), settings=SqliteSettings(busy_timeout_ms=1234)
+    )
+
+    with database.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # NORMAL
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+    database.close()
+
+
+def test_nested_connections_share_one_transaction(tmp_path: Path) -> None:
+    database = SqliteDatabase(str(tmp_path / "db.db"))
+    wallet_repository = SqlWalletRepository(database)
+    wallet_repository.create_wallet("user", "aaa", 50)
+
+    with database.atomic():
+        with database.connection() as outer:
+            with database.connection() as inner:
+                assert inner is outer
+                wallet_repository.apply_balance_changes({"aaa": 10})
+                assert outer.in_transaction
+
+    wallet = wallet_repository.get_wallet("aaa")
+    assert wallet is not None
+    assert wallet.balance == 60
+    database.close()
+
+
+def test_concurrent_transfers(tmp_path: Path) -> None:
+    database = SqliteDatabase(
+        str(tmp_path / "db.db"), settings=SqliteSettings(pool_size=4)
+    )
+    user_repository = SqlUserRepository(database)
+    wallet_repository = SqlWalletRepository(database)
+    transaction_repository = SqlTransactionRepository(database)
+    interactor = TransactionInteractor(
+        transaction_repository,
+        user_repository,
+        wallet_repository,
+        FeeCalculator(),
+        database,
+    )
+
+    user_repository.create_user("user")
+    addresses = [f"wallet-{i}" for i in range(WORKERS)]
+    for address in addresses:
+        wallet_repository.create_wallet("user", address, INITIAL_BALANCE)
+
+    def worker(i: int) -> int:
+        made = 0
+        for j in range(TRANSFERS_PER_WORKER):
+            result = interactor.make_transaction(
+                MakeTransactionRequest(
+                    user_api_key="user",
+                    source_address=addresses[i],
+                    destination_address=addresses[
+                        (i + 1 + j % (WORKERS - 1)) % WORKERS
+                    ],
+                    amount=30,
+                )
+            )
+            if isinstance(result, Ok):
+                made += 1
+            else:
+                assert (
+                    result.value == TransactionError.NOT_ENOUGH_AMOUNT_ON_SOURCE_ACCOUNT
+                )
+            interactor.get_transactions(GetTransactionsRequest("user", limit=10))
+        return made
+
+    # any "database is locked" error is re-raised by map()
+    with ThreadPoolExecutor(WORKERS) as pool:
+        made = sum(pool.map(worker, range(WORKERS)))
+
+    balances = [wallet_repository.get_wallet(address) for address in addresses]
+    assert all(w is not None and w.balance >= 0 for w in balances)
+    assert sum(w.balance for w in balances if w is not None) == (
+        WORKERS * INITIAL_BALANCE
+    )
+    assert len(transaction_repository.get_all_transactions()) == made
+    database.close()
@@ -0,0 +1,105 @@
+import sqlite3
+from pathlib import Path
+
+from app.core.admin.interactor import (
+    Granularity,
+    TransactionBucket,
+    TransactionStatistics,
+)
+from app.infra.sqlite.database import SqliteDatabase
+from app.infra.sqlite.migrations import LATEST_VERSION, migrate, schema_version
+from app.infra.sqlite.transaction import SqlTransactionRepository
+from app.infra.sqlite.wallet import SqlWalletRepository
+
+
+def query_plan(conn: sqlite3.Connection, query: str) -> str:
+    return " ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + query))
+
+
+def test_new_database_is_fully_migrated() -> None:
+    database = SqliteDatabase(":memory:")
+
+    with database.connection() as conn:
+        assert schema_version(conn) == LATEST_VERSION
+
+
+def test_lookups_use_indexes() -> None:
+    conn = sqlite3.connect(":memory:")
+    migrate(conn)
+
+    assert "USING INDEX" in query_plan(conn, "SELECT * FROM Wallet WHERE address = 'a'")
+    assert "USING INDEX Wallet_owner_key" in query_plan(
+        conn, "SELECT * FROM Wallet WHERE owner_key = 'a'"
+    )
+    transactions_plan = query_plan(
+        conn,
+        "SELECT * FROM Transaction_tbl WHERE source_wallet = 'a'"
+        " or destination_wallet = 'a'",
+    )
+    assert "Transaction_tbl_source_wallet" in transactions_plan
+    assert "Transaction_tbl_destination_wallet" in transactions_plan
+
+
+def test_existing_database_upgraded_in_place(tmp_path: Path) -> None:
+    filename = str(tmp_path / "db.db")
+    conn = sqlite3.connect(filename)
+    migrate(conn, target_version=1)
+    conn.executemany(
+        "INSERT INTO Wallet VALUES (?, ?, ?)",
+        [("bbb", "newuser", 100), ("aaa", "newuser", 50), ("ccc", "otheruser", 1)],
+    )
+    conn.execute("INSERT INTO Transaction_tbl VALUES (NULL, 'aaa', 'bbb', 20, 0)")
+    conn.execute("INSERT INTO Transaction_tbl VALUES (NULL, 'bbb', 'ccc', 30, 3)")
+    conn.commit()
+    conn.close()
+
+    database = SqliteDatabase(filename)
+    wallet_repository = SqlWalletRepository(database)
+    transaction_repository = SqlTransactionRepository(database)
+
+    with database.connection() as conn:
+        assert schema_version(conn) == LATEST_VERSION
+    assert [w.address for w in wallet_repository.get_user_wallets("newuser")] == [
+        "bbb",
+        "aaa",
+    ]
+    ccc_wallet = wallet_repository.get_wallet("ccc")
+    assert ccc_wallet is not None
+    assert ccc_wallet.balance == 1
+    assert len(transaction_repository.get_all_wallet_transactions("aaa")) == 1
+    assert transaction_repository.get_transaction_statistics() == (
+        TransactionStatistics(number_of_transactions=2, profit=3)
+    )
+    # rows from before timestamps are dated at the epoch and rolled up there
+    assert [t.created_at for t in transaction_repository.get_all_transactions()] == [
+        0,
+        0,
+    ]
+    assert transaction_repository.get_transaction_buckets(Granularity.DAY, 0, 1) == [
+        TransactionBucket(0, 2, 50, 3)
+    ]
+
+
+def test_balance_journal_folded_into_wallet(tmp_path: Path) -> None:
+    filename = str(tmp_path / "db.db")
+    conn = sqlite3.connect(filename)
+    migrate(conn, target_version=5)
+    conn.executemany(
+        "INSERT INTO Wallet VALUES (?, ?, ?)",
+        [("aaa", "newuser", 100), ("bbb", "newuser", 0), ("ccc", "newuser", 7)],
+    )
+    conn.executemany(
+        "INSERT INTO Balance_journal VALUES (NULL, ?, ?)",
+        [("aaa", -20), ("bbb", 20), ("aaa", -5), ("bbb", 5)],
+    )
+    conn.commit()
+    conn.close()
+
+    database = SqliteDatabase(filename)
+    wallets = SqlWalletRepository(database).get_wallets(["aaa", "bbb", "ccc"])
+    assert [w.balance for w in wallets] == [75, 25, 7]
+    with database.connection() as conn:
+        assert not conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'Balance_journal'"
+        ).fetchall()
+    database.close()
@@ -0,0 +1,69 @@
+from starlette.testclient import TestClient
+
+from app.core.admin.interactor import ADMIN_KEY, TransactionStatistics
+from app.core.transaction.entity import Transaction
+from app.infra.inmemory.columnar_transaction import ColumnarTransactionRepository
+from app.infra.inmemory.wallet import InMemoryWalletRepository
+from app.runner.server_setup import setup_inmemory
+from tests.conftest import FakeCurrencyConverter
+from tests.test_api import API_ADMIN_KEY, API_ARG_KEY_NAME, WALLET_ADDRES_KEY_NAME
+
+
+def test_addresses_interned_once() -> None:
+    wallet_repository = InMemoryWalletRepository()
+    wallet_repository.create_wallet("newuser", "aaa", 100)
+    wallet_repository.create_wallet("newuser", "bbb", 100)
+    repository = ColumnarTransactionRepository(wallet_repository)
+
+    for transaction in [
+        Transaction("aaa", "bbb", 10, 0, 0),
+        Transaction("bbb", "ccc", 20, 3, 0),
+        Transaction("ccc", "ccc", 30, 0, 0),
+        Transaction("ccc", "aaa", 40, 5, 0),
+    ]:
+        repository.create_transaction(transaction)
+
+    assert repository.addresses == ["aaa", "bbb", "ccc"]
+    assert list(repository.sources) == [0, 1, 2, 2]
+    assert list(repository.destinations) == [1, 2, 2, 0]
+    assert [t.amount for t in repository.get_all_user_transactions("newuser")] == [
+        10,
+        20,
+        40,
+    ]
+    assert [t.amount for t in repository.get_all_wallet_transactions("ccc")] == [
+        20,
+        30,
+        40,
+    ]
+    assert repository.get_all_wallet_transactions("ddd") == []
+    assert repository.get_transaction_statistics() == TransactionStatistics(
+        number_of_transactions=4, profit=8
+    )
+
+
+def test_api_with_columnar_transactions() -> None:
+    client = TestClient(setup_inmemory(FakeCurrencyConverter(), columnar=True))
+    api_key = client.post("/users").json()[API_ARG_KEY_NAME]
+    other_api_key = client.post("/users").json()[API_ARG_KEY_NAME]
+    source = client.post("/wallets", params={API_ARG_KEY_NAME: api_key}).json()[
+        WALLET_ADDRES_KEY_NAME
+    ]
+    destination = client.post(
+        "/wallets", params={API_ARG_KEY_NAME: other_api_key}
+    ).json()[WALLET_ADDRES_KEY_NAME]
+
+    for amount in [1000, 2000]:
+        response = client.post(
+            "/transactions",
+            params={
+                API_ARG_KEY_NAME: api_key,
+                "source": source,
+                "destination": destination,
+                "amount": amount,
+            },
+        )
+        assert response.status_code == 200
+
+    response = client.get("/statistics", params={API_ADMIN_KEY: ADMIN_KEY})
+    assert response.json() == {"number_of_transactions": 2, "profit": 45}
@@ -1,9 +1,19 @@
-from typing import Callable, Dict
+import json
+import time
+from typing import Callable, Dict, List
 
+import pytest
 from starlette.testclient import TestClient
 
 from app.core.btc_constants import INITIAL_WALLET_VALUE_SATOSHIS
-from tests.test_api import API_ARG_KEY_NAME, WALLET_ADDRES_KEY_NAME, StatusCode
+from app.infra.fastapi.api_main import setup_fastapi
+from tests.conftest import StubTickerServer, sync_wallet_service
+from tests.test_api import (
+    API_ARG_KEY_NAME,
+    TRANSACTIONS_KEY_NAME,
+    WALLET_ADDRES_KEY_NAME,
+    StatusCode,
+)
 
 
 def test_api_error_messages_transaction(
@@ -84,3 +94,244 @@ def test_api_error_messages_transaction(
     assert response_no_couns.json() == from_msg(
         "Not enough coins on source wallet to complete transaction"
     )
+
+
+def test_api_transactions_pagination(api_client: TestClient) -> None:
+    user = api_client.post("/users").json()[API_ARG_KEY_NAME]
+    source = api_client.post("/wallets", params={API_ARG_KEY_NAME: user}).json()[
+        WALLET_ADDRES_KEY_NAME
+    ]
+    destination = api_client.post("/wallets", params={API_ARG_KEY_NAME: user}).json()[
+        WALLET_ADDRES_KEY_NAME
+    ]
+
+    for amount in range(1, 6):
+        api_client.post(
+            "/transactions",
+            params={
+                API_ARG_KEY_NAME: user,
+                "source": source,
+                "destination": destination,
+                "amount": amount,
+            },
+        )
+
+    for url in ["/transactions", f"/wallets/{source}/transactions"]:
+        amounts: List[int] = []
+        params = {API_ARG_KEY_NAME: user, "limit": 2}
+        while True:
+            response = api_client.get(url, params=params)
+            assert response.status_code == StatusCode.OK
+            amounts.extend(t["amount"] for t in response.json()[TRANSACTIONS_KEY_NAME])
+            if response.json()["next_cursor"] is None:
+                break
+            params["cursor"] = response.json()["next_cursor"]
+        assert amounts == [1, 2, 3, 4, 5]
+
+    response_too_big = api_client.get(
+        "/transactions", params={API_ARG_KEY_NAME: user, "limit": 10**6}
+    )
+    assert response_too_big.status_code == StatusCode.VALIDATION_ERROR
+
+
+def test_api_export_transactions(
+    api_client: TestClient, from_msg: Callable[[str], Dict[str, str]]
+) -> None:
+    user = api_client.post("/users").json()[API_ARG_KEY_NAME]
+    source = api_client.post("/wallets", params={API_ARG_KEY_NAME: user}).json()[
+        WALLET_ADDRES_KEY_NAME
+    ]
+    destination = api_client.post("/wallets", params={API_ARG_KEY_NAME: user}).json()[
+        WALLET_ADDRES_KEY_NAME
+    ]
+    started = int(time.time())
+    for amount in [1, 2]:
+        api_client.post(
+            "/transactions",
+            params={
+                API_ARG_KEY_NAME: user,
+                "source": source,
+                "destination": destination,
+                "amount": amount,
+            },
+        )
+    finished = int(time.time())
+
+    response_ndjson = api_client.get(
+        "/transactions/export", params={API_ARG_KEY_NAME: user}
+    )
+    assert response_ndjson.status_code == StatusCode.OK
+    assert response_ndjson.headers["content-type"] == "application/x-ndjson"
+    exported = [json.loads(line) for line in response_ndjson.text.splitlines()]
+    # every line is a transaction exactly as GET /transactions lists it
+    listed = api_client.get("/transactions", params={API_ARG_KEY_NAME: user})
+    assert exported == listed.json()[TRANSACTIONS_KEY_NAME]
+    created_ats = [transaction.pop("created_at") for transaction in exported]
+    assert all(started <= created_at <= finished for created_at in created_ats)
+    assert exported == [
+        {"source": source, "destination": destination, "amount": 1, "fee": 0},
+        {"source": source, "destination": destination, "amount": 2, "fee": 0},
+    ]
+
+    response_csv = api_client.get(
+        f"/wallets/{destination}/transactions/export",
+        params={API_ARG_KEY_NAME: user, "format": "csv"},
+    )
+    assert response_csv.status_code == StatusCode.OK
+    assert response_csv.headers["content-type"].startswith("text/csv")
+    assert response_csv.text.splitlines() == [
+        "source,destination,amount,fee,created_at",
+        f"{source},{destination},1,0,{created_ats[0]}",
+        f"{source},{destination},2,0,{created_ats[1]}",
+    ]
+
+    response_no_user = api_client.get(
+        "/transactions/export", params={API_ARG_KEY_NAME: ""}
+    )
+    assert response_no_user.status_code == StatusCode.USER_NOT_FOUND
+    assert response_no_user.json() == from_msg("User not found")
+
+
+def test_api_batch_transactions(
+    api_client: TestClient, from_msg: Callable[[str], Dict[str, str]]
+) -> None:
+    user = api_client.post("/users").json()[API_ARG_KEY_NAME]
+    wallets = [
+        api_client.post("/wallets", params={API_ARG_KEY_NAME: user}).json()[
+            WALLET_ADDRES_KEY_NAME
+        ]
+        for _ in range(2)
+    ]
+
+    response_no_user = api_client.post(
+        "/transactions/batch",
+        params={API_ARG_KEY_NAME: ""},
+        json={
+            "transfers": [
+                {"source": wallets[0], "destination": wallets[1], "amount": 1}
+            ]
+        },
+    )
+    assert response_no_user.status_code == StatusCode.USER_NOT_FOUND
+    assert response_no_user.json() == from_msg("User not found")
+
+    response_empty = api_client.post(
+        "/transactions/batch", params={API_ARG_KEY_NAME: user}, json={"transfers": []}
+    )
+    assert response_empty.status_code == StatusCode.VALIDATION_ERROR
+
+    response = api_client.post(
+        "/transactions/batch",
+        params={API_ARG_KEY_NAME: user},
+        json={
+            "transfers": [
+                {
+                    "source": wallets[0],
+                    "destination": wallets[1],
+                    "amount": INITIAL_WALLET_VALUE_SATOSHIS,
+                },
+                {"source": wallets[0], "destination": wallets[1], "amount": 1},
+                {"source": "", "destination": wallets[1], "amount": 1},
+            ]
+        },
+    )
+    assert response.status_code == StatusCode.OK
+    assert response.json() == {
+        "results": [
+            {"status_code": StatusCode.OK, "amount_left_btc": 0, "detail": None},
+            {
+                "status_code": StatusCode.INSUFFICIENT_FUNDS,
+                "amount_left_btc": None,
+                "detail": "Not enough coins on source wallet to complete transaction",
+            },
+            {
+                "status_code": StatusCode.NO_SOURCE_WALLET,
+                "amount_left_btc": None,
+                "detail": "Transactions's source wallet not found",
+            },
+        ]
+    }
+
+    transactions = api_client.get(
+        "/transactions", params={API_ARG_KEY_NAME: user}
+    ).json()[TRANSACTIONS_KEY_NAME]
+    assert len(transactions) == 1
+
+
+@pytest.mark.parametrize("amount", [0, -1000])
+def test_api_batch_transactions_reject_non_positive_amounts(
+    api_client: TestClient, amount: int
+) -> None:
+    user = api_client.post("/users").json()[API_ARG_KEY_NAME]
+    wallets = [
+        api_client.post("/wallets", params={API_ARG_KEY_NAME: user}).json()
+        for _ in range(2)
+    ]
+    addresses = [w[WALLET_ADDRES_KEY_NAME] for w in wallets]
+
+    response = api_client.post(
+        "/transactions/batch",
+        params={API_ARG_KEY_NAME: user},
+        json={
+            "transfers": [
+                {"source": addresses[0], "destination": addresses[1], "amount": 1},
+                {
+                    "source": addresses[0],
+                    "destination": addresses[1],
+                    "amount": amount,
+                },
+            ]
+        },
+    )
+    assert response.status_code == StatusCode.VALIDATION_ERROR
+    assert [
+        api_client.get(f"/wallets/{a}", params={API_ARG_KEY_NAME: user}).json()
+        for a in addresses
+    ] == wallets
+    assert (
+        api_client.get("/transactions", params={API_ARG_KEY_NAME: user}).json()[
+            TRANSACTIONS_KEY_NAME
+        ]
+        == []
+    )
+
+
+def test_api_fast_serialization(
+    request: pytest.FixtureRequest, ticker_server: StubTickerServer
+) -> None:
+    wallet_service = sync_wallet_service(request, ticker_server)
+    default_app = setup_fastapi(wallet_service)
+    fast_app = setup_fastapi(wallet_service, fast_serialization=True)
+    api_client = TestClient(default_app)
+    fast_client = TestClient(fast_app)
+
+    user = api_client.post("/users").json()[API_ARG_KEY_NAME]
+    source = api_client.post("/wallets", params={API_ARG_KEY_NAME: user}).json()[
+        WALLET_ADDRES_KEY_NAME
+    ]
+    destination = api_client.post("/wallets", params={API_ARG_KEY_NAME: user}).json()[
+        WALLET_ADDRES_KEY_NAME
+    ]
+    for amount in range(1, 6):
+        api_client.post(
+            "/transactions",
+            params={
+                API_ARG_KEY_NAME: user,
+                "source": source,
+                "destination": destination,
+                "amount": amount,
+            },
+        )
+
+    for url in ["/transactions", f"/wallets/{source}/transactions"]:
+        for params in [{API_ARG_KEY_NAME: user}, {API_ARG_KEY_NAME: user, "limit": 2}]:
+            expected = api_client.get(url, params=params)
+            response = fast_client.get(url, params=params)
+            assert response.status_code == expected.status_code == StatusCode.OK
+            assert response.json() == expected.json()
+
+        missing = fast_client.get(url, params={API_ARG_KEY_NAME: "nobody"})
+        assert missing.status_code == StatusCode.USER_NOT_FOUND
+
+    # the routes document the same response either way
+    assert fast_app.openapi() == default_app.openapi()
@@ -4,11 +4,16 @@ from result import Err, Ok
 
 from app.core.btc_constants import SATOSHI_IN_BTC
 from app.core.transaction.interactor import (
+    ExportTransactionsRequest,
     GetTransactionsRequest,
     MakeTransactionRequest,
+    MakeTransactionResponse,
+    MakeTransactionsRequest,
     TransactionError,
     TransactionInteractor,
+    TransferRequest,
 )
+from app.core.unit_of_work import IUnitOfWork
 from app.core.user.interactor import IUserRepository
 from app.core.wallet.entity import Wallet
 from app.core.wallet.interactor import IWalletRepository
@@ -29,12 +34,14 @@ def test_make_transaction_one_user(
     user_repository: IUserRepository,
     wallet_repository: IWalletRepository,
     transaction_repository: IAdminAndTransactionRepository,
+    unit_of_work: IUnitOfWork,
 ) -> None:
     interactor = TransactionInteractor(
         transaction_repository,
         user_repository,
         wallet_repository,
         TestingFeeCalculator(),
+        unit_of_work,
     )
 
     user_api_key = "User Key"
@@ -117,12 +124,14 @@ def test_make_transaction_two_users(
     user_repository: IUserRepository,
     wallet_repository: IWalletRepository,
     transaction_repository: IAdminAndTransactionRepository,
+    unit_of_work: IUnitOfWork,
 ) -> None:
     interactor = TransactionInteractor(
         transaction_repository,
         user_repository,
         wallet_repository,
         TestingFeeCalculator(),
+        unit_of_work,
     )
 
     user_api_key_1 = "User Key 1"
@@ -174,12 +183,14 @@ def test_get_transactions(
     user_repository: IUserRepository,
     wallet_repository: IWalletRepository,
     transaction_repository: IAdminAndTransactionRepository,
+    unit_of_work: IUnitOfWork,
 ) -> None:
     interactor = TransactionInteractor(
         transaction_repository,
         user_repository,
         wallet_repository,
         TestingFeeCalculator(),
+        unit_of_work,
     )
 
     user_api_key_1 = "User Key 1"
@@ -253,3 +264,155 @@ def test_get_transactions(
             r = interactor.get_transactions(GetTransactionsRequest(u, w.address))
             assert isinstance(r, Ok)
             assert len(r.value.transactions) == 2
+
+
+def test_export_transactions(
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    transaction_repository: IAdminAndTransactionRepository,
+    unit_of_work: IUnitOfWork,
+) -> None:
+    interactor = TransactionInteractor(
+        transaction_repository,
+        user_repository,
+        wallet_repository,
+        TestingFeeCalculator(),
+        unit_of_work,
+    )
+
+    user_api_key = "User Key"
+    user_repository.create_user(user_api_key)
+    wallet_repository.create_wallet(user_api_key, "Wallet Address 1", 10000)
+    wallet_repository.create_wallet(user_api_key, "Wallet Address 2", 10000)
+
+    for amount in [10, 20, 30]:
+        interactor.make_transaction(
+            MakeTransactionRequest(
+                user_api_key=user_api_key,
+                source_address="Wallet Address 1",
+                destination_address="Wallet Address 2",
+                amount=amount,
+            )
+        )
+
+    response_err_no_user = interactor.export_transactions(
+        ExportTransactionsRequest("Blaa")
+    )
+    assert isinstance(response_err_no_user, Err)
+    assert response_err_no_user.value == TransactionError.USER_NOT_FOUND
+
+    response_err_no_wallet = interactor.export_transactions(
+        ExportTransactionsRequest(user_api_key, "")
+    )
+    assert isinstance(response_err_no_wallet, Err)
+    assert response_err_no_wallet.value == TransactionError.WALLET_NOT_FOUND
+
+    for wallet_address in [None, "Wallet Address 1"]:
+        response_ok = interactor.export_transactions(
+            ExportTransactionsRequest(user_api_key, wallet_address)
+        )
+        assert isinstance(response_ok, Ok)
+        assert [t.amount for t in response_ok.value.transactions] == [10, 20, 30]
+
+
+def test_make_transactions(
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    transaction_repository: IAdminAndTransactionRepository,
+    unit_of_work: IUnitOfWork,
+) -> None:
+    interactor = TransactionInteractor(
+        transaction_repository,
+        user_repository,
+        wallet_repository,
+        TestingFeeCalculator(),
+        unit_of_work,
+    )
+
+    user_repository.create_user("User Key")
+    user_repository.create_user("Other Key")
+    wallet_repository.create_wallet("User Key", "Wallet Address 1", 100)
+    wallet_repository.create_wallet("User Key", "Wallet Address 2", 0)
+    wallet_repository.create_wallet("Other Key", "Wallet Address 3", 0)
+
+    response_err_no_user = interactor.make_transactions(
+        MakeTransactionsRequest("Blaa", [])
+    )
+    assert isinstance(response_err_no_user, Err)
+    assert response_err_no_user.value == TransactionError.USER_NOT_FOUND
+
+    response = interactor.make_transactions(
+        MakeTransactionsRequest(
+            "User Key",
+            [
+                TransferRequest("Wallet Address 1", "Wallet Address 2", 60),
+                # spends what the previous transfer credited
+                TransferRequest("Wallet Address 2", "Wallet Address 3", 50),
+                TransferRequest("Wallet Address 1", "Wallet Address 2", 50),
+                TransferRequest("", "Wallet Address 2", 1),
+                TransferRequest("Wallet Address 1", "", 1),
+                TransferRequest("Wallet Address 3", "Wallet Address 1", 1),
+                TransferRequest("Wallet Address 1", "Wallet Address 3", 40),
+            ],
+        )
+    )
+    assert isinstance(response, Ok)
+    assert [r.value for r in response.value.results] == [
+        MakeTransactionResponse(40 / SATOSHI_IN_BTC),
+        MakeTransactionResponse(10 / SATOSHI_IN_BTC),
+        TransactionError.NOT_ENOUGH_AMOUNT_ON_SOURCE_ACCOUNT,
+        TransactionError.SOURCE_WALLET_NOT_FOUND,
+        TransactionError.DESTINATION_WALLET_NOT_FOUND,
+        TransactionError.INCORRECT_API_KEY,
+        MakeTransactionResponse(0),
+    ]
+
+    balances = [
+        wallet_repository.get_wallet(f"Wallet Address {i}") for i in range(1, 4)
+    ]
+    assert [w.balance for w in balances if w is not None] == [0, 10, 45 + 36]
+    assert [t.amount for t in transaction_repository.get_all_transactions()] == [
+        60,
+        50,
+        40,
+    ]
+    assert transaction_repository.get_transaction_statistics().profit == 5 + 4
+
+
+def test_transactions_are_stamped_with_the_clock(
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    transaction_repository: IAdminAndTransactionRepository,
+    unit_of_work: IUnitOfWork,
+) -> None:
+    now = [1_700_000_000]
+    interactor = TransactionInteractor(
+        transaction_repository,
+        user_repository,
+        wallet_repository,
+        TestingFeeCalculator(),
+        unit_of_work,
+        clock=lambda: now[0],
+    )
+    user_repository.create_user("User Key")
+    wallet_repository.create_wallet("User Key", "Wallet Address 1", 100)
+    wallet_repository.create_wallet("User Key", "Wallet Address 2", 0)
+
+    interactor.make_transaction(
+        MakeTransactionRequest("User Key", "Wallet Address 1", "Wallet Address 2", 10)
+    )
+    now[0] += 90
+    interactor.make_transactions(
+        MakeTransactionsRequest(
+            "User Key",
+            [
+                TransferRequest("Wallet Address 1", "Wallet Address 2", 20),
+                TransferRequest("Wallet Address 2", "Wallet Address 1", 5),
+            ],
+        )
+    )
+
+    assert [
+        t.created_at
+        for t in transaction_repository.get_all_wallet_transactions("Wallet Address 1")
+    ] == [1_700_000_000, 1_700_000_090, 1_700_000_090]
@@ -1,3 +1,8 @@
+from dataclasses import FrozenInstanceError
+from typing import List
+
+import pytest
+
 from app.core.admin.interactor import IAdminRepository
 from app.core.transaction.entity import Transaction
 from app.core.transaction.interactor import ITransactionRepository
@@ -17,7 +22,7 @@ def test_create_transaction(
     second_user = user_repository.create_user("otheruser")
     wallet_repository.create_wallet(second_user.api_key, "ccc", 100)
 
-    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0))
+    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0, 0))
     first_address_transactions = transaction_repository.get_all_wallet_transactions(
         "aaa"
     )
@@ -33,7 +38,7 @@ def test_create_transaction(
     assert first_address_transactions[0].amount == 20
     assert first_address_transactions[0].fee == 0
 
-    transaction_repository.create_transaction(Transaction("bbb", "ccc", 50, 10))
+    transaction_repository.create_transaction(Transaction("bbb", "ccc", 50, 10, 0))
     third_address_transactions = transaction_repository.get_all_wallet_transactions(
         "ccc"
     )
@@ -51,6 +56,27 @@ def test_create_transaction(
     assert third_address_transactions[0].fee == 10
 
 
+def test_create_transactions(
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    user = user_repository.create_user("newuser")
+    wallet_repository.create_wallet(user.api_key, "aaa", 50)
+    wallet_repository.create_wallet(user.api_key, "bbb", 100)
+
+    transactions = [
+        Transaction("aaa", "bbb", 20, 0, 0),
+        Transaction("bbb", "aaa", 30, 1, 0),
+        Transaction("aaa", "aaa", 5, 0, 0),
+    ]
+    transaction_repository.create_transactions(transactions)
+    transaction_repository.create_transactions([])
+
+    assert transaction_repository.get_all_wallet_transactions("aaa") == transactions
+    assert transaction_repository.get_all_wallet_transactions("bbb") == transactions[:2]
+
+
 def test_get_all_user_transactions(
     user_repository: IUserRepository,
     wallet_repository: IWalletRepository,
@@ -63,14 +89,14 @@ def test_get_all_user_transactions(
     second_user = user_repository.create_user("otheruser")
     wallet_repository.create_wallet(second_user.api_key, "ccc", 100)
 
-    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0))
+    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0, 0))
     first_user_transactions = transaction_repository.get_all_user_transactions(
         first_user.api_key
     )
 
     assert len(first_user_transactions) == 1
 
-    transaction_repository.create_transaction(Transaction("bbb", "ccc", 50, 10))
+    transaction_repository.create_transaction(Transaction("bbb", "ccc", 50, 10, 0))
     first_user_transactions = transaction_repository.get_all_user_transactions(
         "newuser"
     )
@@ -95,7 +121,7 @@ def test_get_all_wallet_transactions(
     second_user = user_repository.create_user("otheruser")
     wallet_repository.create_wallet(second_user.api_key, "ccc", 100)
 
-    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0))
+    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0, 0))
     first_user_first_address_transactions = (
         transaction_repository.get_all_wallet_transactions("aaa")
     )
@@ -112,7 +138,7 @@ def test_get_all_wallet_transactions(
         == first_user_second_address_transactions[0]
     )
 
-    transaction_repository.create_transaction(Transaction("bbb", "ccc", 50, 10))
+    transaction_repository.create_transaction(Transaction("bbb", "ccc", 50, 10, 0))
     first_user_second_address_transactions = (
         transaction_repository.get_all_wallet_transactions("bbb")
     )
@@ -136,12 +162,12 @@ def test_get_all_transactions(
     second_user = user_repository.create_user("otheruser")
     wallet_repository.create_wallet(second_user.api_key, "ccc", 100)
 
-    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0))
+    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0, 0))
     transactions = admin_repository.get_all_transactions()
 
     assert len(transactions) == 1
 
-    transaction_repository.create_transaction(Transaction("bbb", "ccc", 50, 10))
+    transaction_repository.create_transaction(Transaction("bbb", "ccc", 50, 10, 0))
     transactions = admin_repository.get_all_transactions()
 
     assert len(transactions) == 2
@@ -157,12 +183,12 @@ def test_transaction_to_self(
     wallet_repository.create_wallet(first_user.api_key, "aaa", 100)
     wallet_repository.create_wallet(first_user.api_key, "bbb", 100)
 
-    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0))
+    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0, 0))
     assert len(transaction_repository.get_all_user_transactions("newuser")) == 1
     assert len(transaction_repository.get_all_wallet_transactions("aaa")) == 1
     assert len(admin_repository.get_all_transactions()) == 1
 
-    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0))
+    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0, 0))
     assert len(transaction_repository.get_all_user_transactions("newuser")) == 2
     assert len(transaction_repository.get_all_wallet_transactions("aaa")) == 2
     assert len(admin_repository.get_all_transactions()) == 2
@@ -181,7 +207,7 @@ def test_transaction_two_identical(
     wallet_repository.create_wallet(khokho.api_key, "poor_boy", 0)
 
     transaction_repository.create_transaction(
-        Transaction("my_rich_wallet", "poor_boy", 1, 0)
+        Transaction("my_rich_wallet", "poor_boy", 1, 0, 0)
     )
     assert len(transaction_repository.get_all_user_transactions("tamta")) == 1
     assert len(transaction_repository.get_all_user_transactions("khokho")) == 1
@@ -192,7 +218,7 @@ def test_transaction_two_identical(
     assert len(admin_repository.get_all_transactions()) == 1
 
     transaction_repository.create_transaction(
-        Transaction("my_rich_wallet", "poor_boy", 1, 0)
+        Transaction("my_rich_wallet", "poor_boy", 1, 0, 0)
     )
     assert len(transaction_repository.get_all_user_transactions("tamta")) == 2
     assert len(transaction_repository.get_all_user_transactions("khokho")) == 2
@@ -201,3 +227,142 @@ def test_transaction_two_identical(
     )
     assert len(transaction_repository.get_all_wallet_transactions("poor_boy")) == 2
     assert len(admin_repository.get_all_transactions()) == 2
+
+
+def test_user_transactions_in_creation_order(
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    first_user = user_repository.create_user("newuser")
+    wallet_repository.create_wallet(first_user.api_key, "aaa", 100)
+    wallet_repository.create_wallet(first_user.api_key, "bbb", 100)
+
+    second_user = user_repository.create_user("otheruser")
+    wallet_repository.create_wallet(second_user.api_key, "ccc", 100)
+
+    transactions = [
+        Transaction("ccc", "aaa", 1, 0, 0),
+        Transaction("aaa", "bbb", 2, 0, 0),
+        Transaction("ccc", "ccc", 3, 0, 0),
+        Transaction("bbb", "ccc", 4, 0, 0),
+        Transaction("bbb", "aaa", 5, 0, 0),
+    ]
+    for transaction in transactions:
+        transaction_repository.create_transaction(transaction)
+
+    first_user_transactions = transaction_repository.get_all_user_transactions(
+        first_user.api_key
+    )
+    assert [t.amount for t in first_user_transactions] == [1, 2, 4, 5]
+    assert [
+        t.amount for t in transaction_repository.get_all_wallet_transactions("ccc")
+    ] == [1, 3, 4]
+
+
+def test_transactions_are_immutable(
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    user = user_repository.create_user("newuser")
+    wallet_repository.create_wallet(user.api_key, "aaa", 100)
+    transaction_repository.create_transaction(Transaction("aaa", "aaa", 1, 0, 0))
+
+    transaction = transaction_repository.get_all_wallet_transactions("aaa")[0]
+    with pytest.raises(FrozenInstanceError):
+        transaction.amount = 2  # type: ignore
+    assert transaction_repository.get_all_wallet_transactions("aaa") == [
+        Transaction("aaa", "aaa", 1, 0, 0)
+    ]
+
+
+def test_transaction_pages(
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    first_user = user_repository.create_user("newuser")
+    wallet_repository.create_wallet(first_user.api_key, "aaa", 100)
+    wallet_repository.create_wallet(first_user.api_key, "bbb", 100)
+
+    second_user = user_repository.create_user("otheruser")
+    wallet_repository.create_wallet(second_user.api_key, "ccc", 100)
+
+    for amount, (source, destination) in enumerate(
+        [("aaa", "bbb"), ("ccc", "ccc"), ("bbb", "aaa"), ("aaa", "ccc"), ("aaa", "aaa")]
+    ):
+        transaction_repository.create_transaction(
+            Transaction(source, destination, amount, 0, 0)
+        )
+
+    amounts: List[int] = []
+    cursor = None
+    while True:
+        page = transaction_repository.get_user_transactions_page(
+            first_user.api_key, cursor, 2
+        )
+        assert len(page.transactions) <= 2
+        amounts.extend(t.amount for t in page.transactions)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+    assert amounts == [0, 2, 3, 4]
+
+    first_page = transaction_repository.get_wallet_transactions_page("aaa", None, 3)
+    assert [t.amount for t in first_page.transactions] == [0, 2, 3]
+    assert first_page.next_cursor is not None
+    last_page = transaction_repository.get_wallet_transactions_page(
+        "aaa", first_page.next_cursor, 3
+    )
+    assert [t.amount for t in last_page.transactions] == [4]
+    assert last_page.next_cursor is None
+
+    everything = transaction_repository.get_wallet_transactions_page("ccc", None, None)
+    assert [t.amount for t in everything.transactions] == [1, 3]
+    assert everything.next_cursor is None
+
+
+def test_iter_transactions(
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    first_user = user_repository.create_user("newuser")
+    wallet_repository.create_wallet(first_user.api_key, "aaa", 100)
+    wallet_repository.create_wallet(first_user.api_key, "bbb", 100)
+
+    second_user = user_repository.create_user("otheruser")
+    wallet_repository.create_wallet(second_user.api_key, "ccc", 100)
+
+    wallets = ["aaa", "bbb", "ccc"]
+    n = 2500
+    for i in range(n):
+        transaction_repository.create_transaction(
+            Transaction(wallets[i % 3], wallets[(i + 1) % 3], i, 0, 0)
+        )
+
+    assert [
+        t.amount for t in transaction_repository.iter_user_transactions("newuser")
+    ] == list(range(n))
+    assert [
+        t.amount for t in transaction_repository.iter_wallet_transactions("ccc")
+    ] == [i for i in range(n) if i % 3 != 0]
+    assert list(transaction_repository.iter_user_transactions("nosuchuser")) == []
+
+
+def test_get_transaction_statistics(
+    admin_repository: IAdminRepository,
+    transaction_repository: ITransactionRepository,
+) -> None:
+    statistics = admin_repository.get_transaction_statistics()
+    assert statistics.number_of_transactions == 0
+    assert statistics.profit == 0
+
+    transaction_repository.create_transaction(Transaction("aaa", "bbb", 20, 0, 0))
+    transaction_repository.create_transaction(Transaction("bbb", "ccc", 50, 10, 0))
+    transaction_repository.create_transaction(Transaction("ccc", "aaa", 70, 5, 0))
+
+    statistics = admin_repository.get_transaction_statistics()
+    assert statistics.number_of_transactions == 3
+    assert statistics.profit == 15
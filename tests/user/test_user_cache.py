@@ -0,0 +1,97 @@
+import asyncio
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.core.user.entity import User
+from app.core.user.interactor import IUserRepository
+from app.infra.cache.user import (
+    AsyncCachedUserRepository,
+    CachedUserRepository,
+    UserCache,
+    UserCacheStats,
+)
+from app.infra.inmemory.user import AsyncInMemoryUserRepository
+
+
+@dataclass
+class CountingUserRepository:
+    repository: IUserRepository
+    lookups: int = 0
+
+    def create_user(self, api_key: str) -> User:
+        return self.repository.create_user(api_key)
+
+    def create_users(self, api_keys: List[str]) -> List[User]:
+        return self.repository.create_users(api_keys)
+
+    def get_user(self, user_api_key: str) -> Optional[User]:
+        self.lookups += 1
+        return self.repository.get_user(user_api_key)
+
+
+@dataclass
+class FakeClock:
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_known_users_are_cached(user_repository: IUserRepository) -> None:
+    counting = CountingUserRepository(user_repository)
+    cached = CachedUserRepository(counting, UserCache(max_size=2))
+    cached.create_users(["a", "b", "c"])
+
+    for api_key in ["a", "b", "a", "b"]:
+        user = cached.get_user(api_key)
+        assert user is not None
+        assert user.api_key == api_key
+    assert counting.lookups == 2
+
+    # c evicts the least recently used one, a
+    cached.get_user("c")
+    cached.get_user("b")
+    cached.get_user("a")
+    assert counting.lookups == 4
+    assert cached.cache.stats == UserCacheStats(hits=3, misses=4, negative_hits=0)
+
+
+def test_unknown_users_expire(user_repository: IUserRepository) -> None:
+    clock = FakeClock()
+    counting = CountingUserRepository(user_repository)
+    cached = CachedUserRepository(
+        counting, UserCache(negative_ttl_seconds=5, clock=clock)
+    )
+
+    assert cached.get_user("a") is None
+    assert cached.get_user("a") is None
+    assert counting.lookups == 1
+
+    clock.now = 5
+    assert cached.get_user("a") is None
+    assert counting.lookups == 2
+    assert cached.cache.stats == UserCacheStats(hits=0, misses=2, negative_hits=1)
+
+
+def test_created_users_are_not_unknown(user_repository: IUserRepository) -> None:
+    cached = CachedUserRepository(user_repository)
+
+    assert cached.get_user("a") is None
+    cached.create_user("a")
+    assert cached.get_user("a") is not None
+
+    assert cached.get_user("b") is None
+    cached.create_users(["b"])
+    assert cached.get_user("b") is not None
+
+
+def test_async_cached_user_repository() -> None:
+    async def run() -> None:
+        cached = AsyncCachedUserRepository(AsyncInMemoryUserRepository())
+        assert await cached.get_user("a") is None
+        await cached.create_user("a")
+        assert await cached.get_user("a") is not None
+        assert await cached.get_user("a") is not None
+        assert cached.cache.stats == UserCacheStats(hits=1, misses=2, negative_hits=0)
+
+    asyncio.run(run())
@@ -17,3 +17,11 @@ def test_get_user(user_repository: IUserRepository) -> None:
 
     assert user_repository.get_user("aaa") is None
     assert user_repository.get_user("abc") is None
+
+
+def test_create_users(user_repository: IUserRepository) -> None:
+    users = user_repository.create_users(["abc", "newuser"])
+    assert [user.api_key for user in users] == ["abc", "newuser"]
+    assert user_repository.get_user("abc") is not None
+    assert user_repository.get_user("newuser") is not None
+    assert user_repository.create_users([]) == []
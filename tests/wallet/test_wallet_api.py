@@ -56,3 +56,51 @@ def test_api_error_messages_wallet(
     assert response_belonging_error.json() == from_msg(
         "Provided wallet doesn't belong to provided user"
     )
+
+
+def test_api_wallet_balances_in_all_currencies(api_client: TestClient) -> None:
+    api_key = api_client.post("/users").json()[API_ARG_KEY_NAME]
+    address = api_client.post("/wallets", params={API_ARG_KEY_NAME: api_key}).json()[
+        WALLET_ADDRES_KEY_NAME
+    ]
+
+    response = api_client.get(f"/wallets/{address}", params={API_ARG_KEY_NAME: api_key})
+    assert response.status_code == 200
+    assert "balances" not in response.json()
+
+    response = api_client.get(
+        f"/wallets/{address}",
+        params={API_ARG_KEY_NAME: api_key, "all_currencies": True},
+    )
+    assert response.status_code == 200
+    assert set(response.json()["balances"]) == {"USD", "EUR", "RUB"}
+
+
+def test_api_get_user_wallets(
+    api_client: TestClient, from_msg: Callable[[str], Dict[str, str]]
+) -> None:
+    response = api_client.get("/wallets", params={API_ARG_KEY_NAME: "nobody"})
+    assert response.status_code == StatusCode.USER_NOT_FOUND
+    assert response.json() == from_msg("User not found")
+
+    api_key = api_client.post("/users").json()[API_ARG_KEY_NAME]
+    response = api_client.get("/wallets", params={API_ARG_KEY_NAME: api_key})
+    assert response.status_code == 200
+    assert response.json() == {"wallets": [], "total_btc": 0, "total_usd": 0}
+
+    addresses = [
+        api_client.post("/wallets", params={API_ARG_KEY_NAME: api_key}).json()[
+            WALLET_ADDRES_KEY_NAME
+        ]
+        for _ in range(MAX_WALLETS_PER_PERSON)
+    ]
+    response = api_client.get(
+        "/wallets", params={API_ARG_KEY_NAME: api_key, "all_currencies": True}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert sorted(w[WALLET_ADDRES_KEY_NAME] for w in body["wallets"]) == sorted(
+        addresses
+    )
+    assert body["total_btc"] == sum(w["balance_btc"] for w in body["wallets"])
+    assert set(body["total_balances"]) == {"USD", "EUR", "RUB"}
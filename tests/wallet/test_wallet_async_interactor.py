@@ -0,0 +1,95 @@
+import asyncio
+from pathlib import Path
+from typing import List
+
+from result import Ok, Result
+
+from app.core.currency_converter import ConversionError, FiatAmounts, FiatCurrency
+from app.core.key_generator import generate_wallet_address
+from app.core.wallet.async_interactor import AsyncWalletInteractor
+from app.core.wallet.interactor import CreateWalletRequest, GetWalletRequest
+from app.infra.async_sqlite.database import AsyncSqliteDatabase
+from app.infra.async_sqlite.user import AsyncSqlUserRepository
+from app.infra.async_sqlite.wallet import AsyncSqlWalletRepository
+from app.infra.inmemory.unit_of_work import AsyncInMemoryUnitOfWork
+from app.infra.sqlite.database import SqliteSettings
+
+CONCURRENT_READS = 2000
+
+
+class AsyncFakeCurrencyConverter:
+    scale = 2
+
+    async def convert_btc_to_fiat(
+        self, satoshis: int, currency: FiatCurrency
+    ) -> Result[float, ConversionError]:
+        return Ok(satoshis * self.scale)
+
+    async def convert_many(
+        self, satoshis: List[int], currencies: List[FiatCurrency]
+    ) -> Result[List[FiatAmounts], ConversionError]:
+        return Ok([{c: amount * self.scale for c in currencies} for amount in satoshis])
+
+
+def test_concurrent_wallet_reads(tmp_path: Path) -> None:
+    async def run() -> None:
+        database = AsyncSqliteDatabase(
+            str(tmp_path / "db.db"), settings=SqliteSettings(pool_size=4)
+        )
+        user_repository = AsyncSqlUserRepository(database)
+        interactor = AsyncWalletInteractor(
+            AsyncSqlWalletRepository(database),
+            user_repository,
+            AsyncFakeCurrencyConverter(),
+            generate_wallet_address,
+        )
+        await user_repository.create_user("user")
+        created = await interactor.create_wallet(CreateWalletRequest("user"))
+        assert isinstance(created, Ok)
+        address = created.value.wallet_address
+
+        responses = await asyncio.gather(
+            *(
+                interactor.get_wallet(GetWalletRequest("user", address))
+                for _ in range(CONCURRENT_READS)
+            )
+        )
+
+        assert all(r == created for r in responses)
+        await database.close()
+
+    asyncio.run(run())
+
+
+def test_built_before_the_event_loop(tmp_path: Path) -> None:
+    # like asgi.py, which builds everything before uvicorn starts its loop
+    database = AsyncSqliteDatabase(
+        str(tmp_path / "db.db"), settings=SqliteSettings(pool_size=2)
+    )
+    unit_of_work = AsyncInMemoryUnitOfWork()
+    user_repository = AsyncSqlUserRepository(database)
+    interactor = AsyncWalletInteractor(
+        AsyncSqlWalletRepository(database),
+        user_repository,
+        AsyncFakeCurrencyConverter(),
+        generate_wallet_address,
+    )
+
+    async def atomic_block() -> None:
+        async with unit_of_work.atomic():
+            await asyncio.sleep(0)
+
+    async def run(with_unit_of_work: bool) -> None:
+        await user_repository.create_user(f"user-{with_unit_of_work}")
+        # more tasks than pooled connections, so that they queue for one
+        responses = await asyncio.gather(
+            *(interactor.get_wallet(GetWalletRequest("nobody", "x")) for _ in range(20))
+        )
+        assert len(responses) == 20
+        if with_unit_of_work:
+            await asyncio.gather(*(atomic_block() for _ in range(20)))
+        await database.close()
+
+    asyncio.run(run(with_unit_of_work=True))
+    # a closed database can be used again from another loop
+    asyncio.run(run(with_unit_of_work=False))
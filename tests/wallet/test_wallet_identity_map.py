@@ -0,0 +1,119 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from result import Ok
+
+from app.core.btc_constants import SATOSHI_IN_BTC
+from app.core.transaction.fee_calculator import FeeCalculator
+from app.core.transaction.interactor import (
+    ITransactionRepository,
+    MakeTransactionRequest,
+    TransactionInteractor,
+)
+from app.core.unit_of_work import IUnitOfWork
+from app.core.user.interactor import IUserRepository
+from app.core.wallet.entity import Wallet
+from app.core.wallet.identity_map import WalletIdentityMap
+from app.core.wallet.interactor import IWalletRepository
+
+
+@dataclass
+class CountingWalletRepository:
+    repository: IWalletRepository
+    # wallet address -> number of times it was read or written
+    reads: "Counter[str]" = field(default_factory=Counter)
+    writes: "Counter[str]" = field(default_factory=Counter)
+
+    def create_wallet(
+        self, user_api_key: str, wallet_address: str, initial_balance: int
+    ) -> Wallet:
+        return self.repository.create_wallet(
+            user_api_key, wallet_address, initial_balance
+        )
+
+    def create_wallets(self, wallets: List[Wallet]) -> None:
+        self.repository.create_wallets(wallets)
+
+    def get_wallet(self, wallet_address: str) -> Optional[Wallet]:
+        self.reads[wallet_address] += 1
+        return self.repository.get_wallet(wallet_address)
+
+    def get_user_wallets(self, user_api_key: str) -> List[Wallet]:
+        wallets = self.repository.get_user_wallets(user_api_key)
+        self.reads.update(w.address for w in wallets)
+        return wallets
+
+    def get_wallets(self, wallet_addresses: List[str]) -> List[Wallet]:
+        self.reads.update(wallet_addresses)
+        return self.repository.get_wallets(wallet_addresses)
+
+    def update_balance(self, wallet_address: str, balance: int) -> None:
+        self.writes[wallet_address] += 1
+        self.repository.update_balance(wallet_address, balance)
+
+    def apply_balance_changes(self, balance_changes: Dict[str, int]) -> None:
+        self.writes.update(list(balance_changes))
+        self.repository.apply_balance_changes(balance_changes)
+
+
+def test_wallets_are_read_once_and_written_together(
+    wallet_repository: IWalletRepository,
+) -> None:
+    wallet_repository.create_wallet("user", "aaa", 50)
+    wallet_repository.create_wallet("user", "bbb", 0)
+    counting = CountingWalletRepository(wallet_repository)
+
+    wallets = WalletIdentityMap()
+    wallets.load(counting, ["aaa", "bbb", "nosuchwallet"])
+    wallets.load(counting, ["bbb", "aaa", "nosuchwallet"])
+    assert wallets.get("nosuchwallet") is None
+
+    wallets.change_balance("aaa", -20)
+    wallets.change_balance("bbb", 20)
+    wallets.change_balance("aaa", -5)
+    wallets.change_balance("aaa", 5)
+    aaa = wallets.get("aaa")
+    assert aaa is not None
+    assert aaa.balance == 30
+
+    # nothing is written before the flush, the repository's wallet is untouched
+    repository_aaa = wallet_repository.get_wallet("aaa")
+    assert repository_aaa is not None
+    assert repository_aaa.balance == 50
+
+    wallets.flush(counting)
+    wallets.flush(counting)
+    assert counting.reads == Counter({"aaa": 1, "bbb": 1, "nosuchwallet": 1})
+    assert counting.writes == Counter({"aaa": 1, "bbb": 1})
+    assert [w.balance for w in wallet_repository.get_wallets(["aaa", "bbb"])] == [
+        30,
+        20,
+    ]
+
+
+def test_make_transaction_touches_each_wallet_once(
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    transaction_repository: ITransactionRepository,
+    unit_of_work: IUnitOfWork,
+) -> None:
+    user_repository.create_user("user")
+    wallet_repository.create_wallet("user", "aaa", 50)
+    wallet_repository.create_wallet("user", "bbb", 0)
+    counting = CountingWalletRepository(wallet_repository)
+    interactor = TransactionInteractor(
+        transaction_repository,
+        user_repository,
+        counting,
+        FeeCalculator(),
+        unit_of_work,
+    )
+
+    response = interactor.make_transaction(
+        MakeTransactionRequest("user", "aaa", "bbb", 20)
+    )
+    assert isinstance(response, Ok)
+    assert response.value.amount_left_btc == 30 / SATOSHI_IN_BTC
+    assert counting.reads == Counter({"aaa": 1, "bbb": 1})
+    assert counting.writes == Counter({"aaa": 1, "bbb": 1})
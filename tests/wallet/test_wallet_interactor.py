@@ -1,10 +1,15 @@
-from result import Err, Ok
+from typing import List
+
+from result import Err, Ok, Result
 
 from app.core.btc_constants import INITIAL_WALLET_VALUE_SATOSHIS, SATOSHI_IN_BTC
+from app.core.currency_converter import ConversionError, FiatAmounts, FiatCurrency
 from app.core.key_generator import ApiKeyGenerator
 from app.core.user.interactor import IUserRepository
 from app.core.wallet.interactor import (
+    MAX_WALLETS_PER_PERSON,
     CreateWalletRequest,
+    GetUserWalletsRequest,
     GetWalletRequest,
     IWalletInteractor,
     IWalletRepository,
@@ -19,7 +24,7 @@ def test_create_wallet(
     wallet_repository: IWalletRepository,
     user_repository: IUserRepository,
     currency_convertor: FakeCurrencyConverter,
-    wallet_address_creator_fun: ApiKeyGenerator,
+    wallet_address_creator_real_fun: ApiKeyGenerator,
 ) -> None:
     test_user_api = "Dummy Key"
 
@@ -29,7 +34,7 @@ def test_create_wallet(
         wallet_repository,
         user_repository,
         currency_convertor,
-        wallet_address_creator_fun,
+        wallet_address_creator_real_fun,
     )
 
     result_err_no_user = interactor.create_wallet(CreateWalletRequest(""))
@@ -38,7 +43,7 @@ def test_create_wallet(
 
     result_ok = interactor.create_wallet(CreateWalletRequest(test_user_api))
     assert isinstance(result_ok, Ok)
-    assert result_ok.value.wallet_address == wallet_address_creator_fun()
+    assert wallet_repository.get_wallet(result_ok.value.wallet_address) is not None
     assert result_ok.value.balance_btc == INITIAL_WALLET_VALUE_SATOSHIS / SATOSHI_IN_BTC
     assert result_ok.value.balance_usd == INITIAL_WALLET_VALUE_SATOSHIS * 2
 
@@ -96,7 +101,7 @@ def test_create_wallet_with_correct_user(
 
 
 def test_create_wallet_multiple_wallets(
-    wallet_interactor: IWalletInteractor,
+    wallet_interactor_real_generator: IWalletInteractor,
     user_repository: IUserRepository,
     wallet_repository: IWalletRepository,
 ) -> None:
@@ -105,31 +110,43 @@ def test_create_wallet_multiple_wallets(
 
     assert len(wallet_repository.get_user_wallets(test_user_api)) == 0
     assert isinstance(
-        wallet_interactor.create_wallet(CreateWalletRequest(test_user_api)), Ok
+        wallet_interactor_real_generator.create_wallet(
+            CreateWalletRequest(test_user_api)
+        ),
+        Ok,
     )
     assert len(wallet_repository.get_user_wallets(test_user_api)) == 1
     assert isinstance(
-        wallet_interactor.create_wallet(CreateWalletRequest(test_user_api)), Ok
+        wallet_interactor_real_generator.create_wallet(
+            CreateWalletRequest(test_user_api)
+        ),
+        Ok,
     )
     assert len(wallet_repository.get_user_wallets(test_user_api)) == 2
     assert isinstance(
-        wallet_interactor.create_wallet(CreateWalletRequest(test_user_api)), Ok
+        wallet_interactor_real_generator.create_wallet(
+            CreateWalletRequest(test_user_api)
+        ),
+        Ok,
     )
     assert len(wallet_repository.get_user_wallets(test_user_api)) == 3
 
 
 def test_create_wallet_limit_reached(
-    wallet_interactor: IWalletInteractor, user_repository: IUserRepository
+    wallet_interactor_real_generator: IWalletInteractor,
+    user_repository: IUserRepository,
 ) -> None:
     test_user_api = "Dummy Key"
     user_repository.create_user(test_user_api)
 
-    wallet_interactor.create_wallet(CreateWalletRequest(test_user_api))
-    wallet_interactor.create_wallet(CreateWalletRequest(test_user_api))
-    wallet_interactor.create_wallet(CreateWalletRequest(test_user_api))
+    wallet_interactor_real_generator.create_wallet(CreateWalletRequest(test_user_api))
+    wallet_interactor_real_generator.create_wallet(CreateWalletRequest(test_user_api))
+    wallet_interactor_real_generator.create_wallet(CreateWalletRequest(test_user_api))
 
-    wallet_creating_attempt_with_limit_reached = wallet_interactor.create_wallet(
-        CreateWalletRequest(test_user_api)
+    wallet_creating_attempt_with_limit_reached = (
+        wallet_interactor_real_generator.create_wallet(
+            CreateWalletRequest(test_user_api)
+        )
     )
     assert isinstance(wallet_creating_attempt_with_limit_reached, Err)
     assert (
@@ -286,3 +303,82 @@ def test_get_wallet_with_correct_user_mismatched_wallet(
         wallet_acquiring_attempt_with_real_api_mismatched_wallet.value
         == WalletError.NOT_THIS_USERS_WALLET
     )
+
+
+def test_get_wallet_in_all_currencies(
+    wallet_repository: IWalletRepository,
+    user_repository: IUserRepository,
+    currency_convertor: FakeCurrencyConverter,
+    wallet_address_creator_fun: ApiKeyGenerator,
+) -> None:
+    user_repository.create_user("Dummy Key")
+    interactor = WalletInteractor(
+        wallet_repository,
+        user_repository,
+        currency_convertor,
+        wallet_address_creator_fun,
+    )
+    created = interactor.create_wallet(CreateWalletRequest("Dummy Key"))
+    assert isinstance(created, Ok)
+    assert created.value.balances is None
+
+    wallet = interactor.get_wallet(
+        GetWalletRequest("Dummy Key", created.value.wallet_address, all_currencies=True)
+    )
+    assert isinstance(wallet, Ok)
+    assert wallet.value.balances == {
+        currency: INITIAL_WALLET_VALUE_SATOSHIS * currency_convertor.scale
+        for currency in ["USD", "EUR", "RUB"]
+    }
+
+
+class CountingCurrencyConverter(FakeCurrencyConverter):
+    calls = 0
+
+    def convert_many(
+        self, satoshis: List[int], currencies: List[FiatCurrency]
+    ) -> Result[List[FiatAmounts], ConversionError]:
+        self.calls += 1
+        return super().convert_many(satoshis, currencies)
+
+
+def test_get_user_wallets(
+    wallet_repository: IWalletRepository,
+    user_repository: IUserRepository,
+    wallet_address_creator_real_fun: ApiKeyGenerator,
+) -> None:
+    converter = CountingCurrencyConverter()
+    interactor = WalletInteractor(
+        wallet_repository, user_repository, converter, wallet_address_creator_real_fun
+    )
+
+    no_user = interactor.get_user_wallets(GetUserWalletsRequest("Dummy Key"))
+    assert isinstance(no_user, Err)
+    assert no_user.value == WalletError.USER_NOT_FOUND
+
+    user_repository.create_user("Dummy Key")
+    empty = interactor.get_user_wallets(GetUserWalletsRequest("Dummy Key"))
+    assert isinstance(empty, Ok)
+    assert empty.value.wallets == []
+    assert empty.value.total_btc == 0
+
+    addresses = []
+    for _ in range(MAX_WALLETS_PER_PERSON):
+        created = interactor.create_wallet(CreateWalletRequest("Dummy Key"))
+        assert isinstance(created, Ok)
+        addresses.append(created.value.wallet_address)
+    wallet_repository.update_balance(addresses[0], 5)
+
+    converter.calls = 0
+    response = interactor.get_user_wallets(
+        GetUserWalletsRequest("Dummy Key", all_currencies=True)
+    )
+    assert isinstance(response, Ok)
+    assert converter.calls == 1
+    assert sorted(w.wallet_address for w in response.value.wallets) == sorted(addresses)
+    total = 5 + INITIAL_WALLET_VALUE_SATOSHIS * (MAX_WALLETS_PER_PERSON - 1)
+    assert response.value.total_btc == total / SATOSHI_IN_BTC
+    assert response.value.total_usd == total * converter.scale
+    assert response.value.total_balances == {
+        currency: total * converter.scale for currency in ["USD", "EUR", "RUB"]
+    }
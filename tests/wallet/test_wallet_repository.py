@@ -1,5 +1,10 @@
+import pytest
+
+from app.core.unit_of_work import IUnitOfWork
 from app.core.user.interactor import IUserRepository
+from app.core.wallet.entity import Wallet
 from app.core.wallet.interactor import IWalletRepository
+from app.infra.sqlite.database import SqliteDatabase
 
 
 def test_create_and_get_wallet(
@@ -98,3 +103,62 @@ def test_update_balance_additional(wallet_repository: IWalletRepository) -> None
     new_check = wallet_repository.get_wallet(test_wallet_address)
     assert new_check is not None
     assert new_check.balance == test_new_balance
+
+
+def test_atomic_rolls_back_on_error(
+    user_repository: IUserRepository,
+    wallet_repository: IWalletRepository,
+    unit_of_work: IUnitOfWork,
+) -> None:
+    if not isinstance(unit_of_work, SqliteDatabase):
+        pytest.skip("only the sqlite unit of work rolls back")
+
+    user = user_repository.create_user("newuser")
+    wallet_repository.create_wallet(user.api_key, "aaa", 50)
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work.atomic():
+            wallet_repository.apply_balance_changes({"aaa": -20})
+            raise RuntimeError()
+
+    a_wallet = wallet_repository.get_wallet("aaa")
+    assert a_wallet is not None
+    assert a_wallet.balance == 50
+
+
+def test_get_wallets_and_apply_balance_changes(
+    user_repository: IUserRepository, wallet_repository: IWalletRepository
+) -> None:
+    user = user_repository.create_user("newuser")
+    wallet_repository.create_wallet(user.api_key, "aaa", 50)
+    wallet_repository.create_wallet(user.api_key, "bbb", 100)
+    wallet_repository.create_wallet(user.api_key, "ccc", 0)
+
+    wallets = wallet_repository.get_wallets(["ccc", "aaa", "nosuchwallet"])
+    assert sorted(w.address for w in wallets) == ["aaa", "ccc"]
+
+    wallet_repository.apply_balance_changes({"aaa": -20, "ccc": 15})
+    balances = {
+        w.address: w.balance
+        for w in wallet_repository.get_wallets(["aaa", "bbb", "ccc"])
+    }
+    assert balances == {"aaa": 30, "bbb": 100, "ccc": 15}
+
+
+def test_create_wallets(
+    user_repository: IUserRepository, wallet_repository: IWalletRepository
+) -> None:
+    user_repository.create_users(["first", "second"])
+    wallet_repository.create_wallets(
+        [
+            Wallet("aaa", "first", 1),
+            Wallet("bbb", "first", 2),
+            Wallet("ccc", "second", 3),
+        ]
+    )
+
+    assert wallet_repository.get_user_wallets("first") == [
+        Wallet("aaa", "first", 1),
+        Wallet("bbb", "first", 2),
+    ]
+    assert wallet_repository.get_wallet("ccc") == Wallet("ccc", "second", 3)